@@ -2,8 +2,9 @@
 """
 Repository for managing UserMeditationSession records.
 """
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 
 from app.models.orm_models import UserMeditationSession
@@ -24,14 +25,45 @@ def create_session(db: Session, user_id: int, start_time: datetime, end_time: da
     db.refresh(session)
     return session
 
-def find_sessions_for_user(db: Session, user_id: int, start_date: datetime, end_date: datetime, limit: int, offset: int) -> Tuple[List[UserMeditationSession], int]:
-    """Retrieves a paginated history of meditation sessions for a user."""
+def find_sessions_for_user(
+    db: Session, user_id: int, start_date: datetime, end_date: datetime, limit: int,
+    offset: int = 0, cursor_after: Optional[Tuple[datetime, int]] = None
+) -> Tuple[List[UserMeditationSession], Optional[int], Optional[Tuple[datetime, int]]]:
+    """
+    Retrieves a page of a user's meditation sessions, newest first.
+
+    Uses keyset pagination on (start_time, id): `cursor_after` is the key of the
+    last session on the previous page, so deep pages cost the same as the first.
+    `offset` is still honoured for existing callers but cannot be combined with
+    a cursor. Returns the sessions, the total count and the cursor for the next
+    page (None when this is the last page). The total is counted only for a
+    first page (no cursor), since counting costs a scan of all the user's
+    sessions; it is None on cursor pages.
+    """
+    if offset and cursor_after:
+        raise ValueError("offset and cursor_after cannot be combined.")
     query = db.query(UserMeditationSession).filter(UserMeditationSession.user_id == user_id)
     if start_date:
         query = query.filter(UserMeditationSession.start_time >= start_date)
     if end_date:
         query = query.filter(UserMeditationSession.start_time <= end_date)
     
-    total_count = query.count()
-    sessions = query.order_by(UserMeditationSession.start_time.desc()).offset(offset).limit(limit).all()
-    return sessions, total_count
\ No newline at end of file
+    if cursor_after:
+        cursor_start, cursor_id = cursor_after
+        query = query.filter(or_(
+            UserMeditationSession.start_time < cursor_start,
+            and_(UserMeditationSession.start_time == cursor_start, UserMeditationSession.id < cursor_id),
+        ))
+        total_count = None
+    else:
+        total_count = query.count()
+    # Fetch one extra row to learn whether another page follows.
+    sessions = query.order_by(
+        UserMeditationSession.start_time.desc(), UserMeditationSession.id.desc()
+    ).offset(offset).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(sessions) > limit:
+        sessions = sessions[:limit]
+        next_cursor = (sessions[-1].start_time, sessions[-1].id)
+    return sessions, total_count, next_cursor
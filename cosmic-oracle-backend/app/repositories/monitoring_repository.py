@@ -5,13 +5,79 @@ Repository for Subscription Monitoring and Analytics.
 This module encapsulates all direct database queries required to fetch metrics
 for the subscription monitoring dashboard.
 """
+import threading
+import time
+from dataclasses import dataclass
+from functools import wraps
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
-from typing import Dict, Any, List
-from datetime import datetime, timedelta
+from sqlalchemy import func, and_, case, select, true
+from typing import Dict, Any, Tuple
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
 
 from app.models.orm_models import UserSubscription, SubscriptionMetrics, PaymentFailure, CeleryTaskRun # Assuming these models exist
 
+@dataclass(frozen=True, slots=True)
+class AlertSnapshot:
+    """
+    Everything the system alert checks read, materialized from a single query.
+    The task arrays are parallel (one entry per task) and read-only.
+    """
+    active_subscriptions: int
+    payment_failures_24h: int
+    cancellations_7d: int
+    task_names: np.ndarray
+    task_run_ats: np.ndarray
+    task_statuses: np.ndarray
+
+# --- Short-TTL query cache ---
+# Dashboard polling and alert checks run the same aggregate queries seconds apart.
+# Results are cached briefly per (query, arguments); the session is not part of the key.
+QUERY_CACHE_TTL_SECONDS = 30
+QUERY_CACHE_MAXSIZE = 16
+_query_cache: Dict[Tuple, Tuple[float, Any]] = {}
+_query_cache_lock = threading.Lock()
+query_cache_stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+def ttl_cached(func):
+    """Caches a repository query's result for `QUERY_CACHE_TTL_SECONDS`."""
+    @wraps(func)
+    def wrapper(db: Session, *args):
+        key = (func.__name__,) + args
+        now = time.monotonic()
+        with _query_cache_lock:
+            entry = _query_cache.get(key)
+            if entry is not None and now - entry[0] < QUERY_CACHE_TTL_SECONDS:
+                query_cache_stats["hits"] += 1
+                return _copy_result(entry[1])
+            query_cache_stats["misses"] += 1
+
+        result = func(db, *args)
+
+        with _query_cache_lock:
+            if len(_query_cache) >= QUERY_CACHE_MAXSIZE:
+                # Drop the oldest entry to keep the cache bounded.
+                del _query_cache[min(_query_cache, key=lambda k: _query_cache[k][0])]
+            _query_cache[key] = (now, result)
+        return _copy_result(result)
+    return wrapper
+
+def _copy_result(result: Any) -> Any:
+    """
+    Dict results are copied, along with any nested dicts, so callers cannot
+    mutate the cached entry; other results must be immutable.
+    """
+    if isinstance(result, dict):
+        return {k: dict(v) if isinstance(v, dict) else v for k, v in result.items()}
+    return result
+
+def invalidate_query_cache() -> None:
+    """Clears cached query results; call after writes that change subscription data."""
+    with _query_cache_lock:
+        _query_cache.clear()
+        query_cache_stats["invalidations"] += 1
+
 def get_current_subscription_counts(db: Session) -> Dict[str, int]:
     """Retrieves counts of subscriptions by their current status."""
     active_count = db.query(UserSubscription).filter(UserSubscription.status == 'active').count()
@@ -53,22 +119,134 @@ def get_average_feature_usage(db: Session, start_date: datetime, end_date: datet
     ).scalar()
     return float(avg_usage or 0.0)
 
-def get_latest_task_runs(db: Session) -> List[CeleryTaskRun]:
+def _count_where(*conditions):
+    """Aggregate that counts the rows matching all `conditions` (portable across backends)."""
+    return func.coalesce(func.sum(case((and_(*conditions), 1), else_=0)), 0)
+
+@ttl_cached
+def get_dashboard_rollup(db: Session, start_date: datetime, end_date: datetime) -> Dict[str, Any]:
     """
-    Retrieves the most recent run record for each distinct background task.
-    This assumes a CeleryTaskRun model tracks task executions.
+    Retrieves every dashboard aggregate in a single round trip.
+
+    Combines the results of `get_current_subscription_counts`,
+    `get_subscription_changes`, `get_payment_failure_stats` and
+    `get_average_feature_usage` into one query built from three single-row CTEs.
     """
-    # This advanced query finds the latest run for each task name
-    subquery = db.query(
+    subscription_stats = select(
+        _count_where(UserSubscription.status == 'active').label('active'),
+        _count_where(UserSubscription.status == 'trialing').label('trialing'),
+        _count_where(UserSubscription.status == 'past_due').label('past_due'),
+        _count_where(UserSubscription.created_at.between(start_date, end_date)).label('new_subscriptions'),
+        _count_where(
+            UserSubscription.status == 'canceled',
+            UserSubscription.cancelled_at.between(start_date, end_date)
+        ).label('cancellations'),
+    ).cte('subscription_stats')
+
+    payment_stats = select(
+        func.count().label('total_failures'),
+        _count_where(PaymentFailure.resolved_at.isnot(None)).label('resolved_failures'),
+    ).where(PaymentFailure.created_at.between(start_date, end_date)).cte('payment_stats')
+
+    usage_stats = select(
+        func.avg(SubscriptionMetrics.feature_usage_count).label('avg_usage'),
+    ).where(SubscriptionMetrics.created_at.between(start_date, end_date)).cte('usage_stats')
+
+    row = db.execute(
+        select(subscription_stats, payment_stats, usage_stats).select_from(
+            subscription_stats.join(payment_stats, true()).join(usage_stats, true())
+        )
+    ).one()
+
+    return {
+        "current_counts": {
+            "active": int(row.active),
+            "trialing": int(row.trialing),
+            "past_due": int(row.past_due)
+        },
+        "changes": {
+            "new_subscriptions": int(row.new_subscriptions),
+            "cancellations": int(row.cancellations)
+        },
+        "payment_stats": {
+            "total_failures": int(row.total_failures),
+            "resolved_failures": int(row.resolved_failures)
+        },
+        "avg_usage": float(row.avg_usage or 0.0)
+    }
+
+def _latest_task_runs_query():
+    """Selects the most recent (task_name, run_at, status) row for each distinct task."""
+    latest_run_at = select(
         CeleryTaskRun.task_name,
         func.max(CeleryTaskRun.run_at).label('max_run_at')
     ).group_by(CeleryTaskRun.task_name).subquery()
 
-    latest_runs_query = db.query(CeleryTaskRun).join(
-        subquery,
+    return select(
+        CeleryTaskRun.task_name, CeleryTaskRun.run_at, CeleryTaskRun.status
+    ).join(
+        latest_run_at,
         and_(
-            CeleryTaskRun.task_name == subquery.c.task_name,
-            CeleryTaskRun.run_at == subquery.c.max_run_at
+            CeleryTaskRun.task_name == latest_run_at.c.task_name,
+            CeleryTaskRun.run_at == latest_run_at.c.max_run_at
+        )
+    )
+
+def _task_run_arrays(rows) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Converts task run rows into parallel (names, run_ats, statuses) arrays."""
+    # datetime64 has no timezone; normalize aware timestamps to naive UTC first.
+    run_ats = [
+        r.run_at.astimezone(timezone.utc).replace(tzinfo=None) if r.run_at.tzinfo else r.run_at
+        for r in rows
+    ]
+    return (
+        np.array([r.task_name for r in rows], dtype=object),
+        np.array(run_ats, dtype='datetime64[s]'),
+        np.array([r.status for r in rows], dtype=object),
+    )
+
+@ttl_cached
+def get_alert_snapshot(db: Session, window_end: datetime) -> AlertSnapshot:
+    """
+    Retrieves every input of the system alert checks in a single round trip.
+
+    Active subscriptions, payment failures in the 24 hours and cancellations in
+    the 7 days before `window_end` come from single-row CTEs, which are
+    left-joined onto the latest run of each task so the query still returns
+    one row when no task has run yet.
+    """
+    day_start = window_end - timedelta(days=1)
+    week_start = window_end - timedelta(days=7)
+
+    subscription_stats = select(
+        _count_where(UserSubscription.status == 'active').label('active'),
+        _count_where(
+            UserSubscription.status == 'canceled',
+            UserSubscription.cancelled_at.between(week_start, window_end)
+        ).label('cancellations_7d'),
+    ).cte('subscription_stats')
+
+    payment_stats = select(
+        func.count().label('failures_24h'),
+    ).where(PaymentFailure.created_at.between(day_start, window_end)).cte('payment_stats')
+
+    latest_runs = _latest_task_runs_query().cte('latest_runs')
+
+    rows = db.execute(
+        select(subscription_stats, payment_stats, latest_runs).select_from(
+            subscription_stats.join(payment_stats, true()).outerjoin(latest_runs, true())
         )
+    ).all()
+
+    task_names, run_ats, statuses = _task_run_arrays([r for r in rows if r.task_name is not None])
+    for array in (task_names, run_ats, statuses):
+        array.setflags(write=False)  # Shared through the query cache.
+
+    return AlertSnapshot(
+        active_subscriptions=int(rows[0].active),
+        payment_failures_24h=int(rows[0].failures_24h),
+        cancellations_7d=int(rows[0].cancellations_7d),
+        task_names=task_names,
+        task_run_ats=run_ats,
+        task_statuses=statuses,
     )
-    return latest_runs_query.all()
\ No newline at end of file
@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 from typing import Optional
 
 from app.models.orm_models import User, UserSubscription
+from app.repositories import monitoring_repository
 
 def find_user_by_id(db: Session, user_id: int) -> Optional[User]:
     return db.query(User).filter(User.id == user_id).first()
@@ -31,6 +32,7 @@ def create_or_update_subscription(db: Session, user: User, sub_data: dict) -> Us
         user.stripe_customer_id = sub_data.get('stripe_customer_id')
 
     db.commit()
+    monitoring_repository.invalidate_query_cache()
     db.refresh(subscription)
     return subscription
 
@@ -7,9 +7,12 @@ astrological aspects between a set of celestial bodies. It is designed to be
 reused by other services like Natal, Synastry, and Transits.
 """
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
-from app.services.content_fetch_service import get_aspect_content
+import numpy as np
+
+from app.services.content_fetch_service import ContentFetchService
+from app.services.numeric_kernels import aspect_scan, pair_aspect_scan
 
 logger = logging.getLogger(__name__)
 
@@ -21,9 +24,12 @@ class AspectService:
 
     def __init__(self):
         logger.info("Initializing AspectService singleton...")
-        self.aspect_definitions = get_aspect_content().get("aspects", [])
+        self.aspect_definitions = (ContentFetchService().get_aspect_base_data() or {}).get("aspects", [])
         if not self.aspect_definitions:
             raise RuntimeError("Could not load necessary aspect content file.")
+        # Array views of the definitions for the batched numeric search.
+        self.aspect_angles = np.array([a["angle"] for a in self.aspect_definitions], dtype=np.float64)
+        self.aspect_orbs = np.array([a["orb"] for a in self.aspect_definitions], dtype=np.float64)
         logger.info(f"AspectService initialized successfully with {len(self.aspect_definitions)} aspect definitions.")
 
     def _is_applying(self, p1: Dict[str, Any], p2: Dict[str, Any]) -> Optional[bool]:
@@ -54,34 +60,79 @@ class AspectService:
         Returns:
             A list of all found aspects, sorted by orb.
         """
-        if not self._instance: # Safety check if singleton wasn't created
-             return []
+        points = [p for p in points if p.get('longitude') is not None]
+        i_idx, j_idx, asp_idx, orbs = pair_aspect_scan(
+            np.array([p['longitude'] for p in points], dtype=np.float64),
+            self.aspect_angles,
+            self.aspect_orbs,
+        )
 
         found_aspects = []
-        point_pairs = [(points[i], points[j]) for i in range(len(points)) for j in range(i + 1, len(points))]
-
-        for p1, p2 in point_pairs:
-            lon1, lon2 = p1.get('longitude'), p2.get('longitude')
-            if lon1 is None or lon2 is None: continue
-
-            separation = abs(lon1 - lon2)
-            if separation > 180:
-                separation = 360 - separation
-
-            for aspect_def in self.aspect_definitions:
-                orb = abs(separation - aspect_def["angle"])
-                if orb <= aspect_def["orb"]:
-                    found_aspects.append({
-                        "point1_name": p1["name"],
-                        "point2_name": p2["name"],
-                        "aspect_name": aspect_def["name"],
-                        "aspect_type": aspect_def["type"],
-                        "orb_degrees": round(orb, 3),
-                        "is_applying": self._is_applying(p1, p2)
-                    })
+        for i, j, a, orb in zip(i_idx.tolist(), j_idx.tolist(), asp_idx.tolist(), orbs.tolist()):
+            p1, p2 = points[i], points[j]
+            aspect_def = self.aspect_definitions[a]
+            found_aspects.append({
+                "point1_name": p1["name"],
+                "point2_name": p2["name"],
+                "aspect_name": aspect_def["name"],
+                "aspect_type": aspect_def["type"],
+                "orb_degrees": round(orb, 3),
+                "is_applying": self._is_applying(p1, p2)
+            })
+
+        return sorted(found_aspects, key=lambda x: x['orb_degrees'])
 
+    def find_aspects_from_point(
+        self, point: Dict[str, Any], targets: List[Dict[str, Any]], max_orb: float = 360.0
+    ) -> List[Dict[str, Any]]:
+        """
+        Finds the aspects one point makes to each of `targets`, without the
+        target-to-target pairs that `find_all_aspects` would also compute.
+
+        Suited to sensitive points (midpoints, transits to a single natal point)
+        checked against a fixed set of natal positions.
+
+        Returns:
+            Aspect dicts in the same shape as `find_all_aspects`, sorted by orb.
+        """
+        if point.get('longitude') is None:
+            return []
+        targets = [t for t in targets if t.get('longitude') is not None]
+        _, tgt_idx, asp_idx, orbs = self.find_aspects_batch(
+            np.array([point['longitude']]), np.array([t['longitude'] for t in targets]), max_orb
+        )
+        found_aspects = [{
+            "point1_name": point["name"],
+            "point2_name": targets[t]["name"],
+            "aspect_name": self.aspect_definitions[a]["name"],
+            "aspect_type": self.aspect_definitions[a]["type"],
+            "orb_degrees": round(orb, 3),
+            "is_applying": self._is_applying(point, targets[t])
+        } for t, a, orb in zip(tgt_idx.tolist(), asp_idx.tolist(), orbs.tolist())]
         return sorted(found_aspects, key=lambda x: x['orb_degrees'])
 
+    def find_aspects_batch(
+        self, source_lons: np.ndarray, target_lons: np.ndarray, max_orb: float
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Finds aspects between every source and every target longitude in one pass.
+
+        Unlike `find_all_aspects`, this works on raw longitude arrays and returns
+        index arrays, so callers can check many positions at once and only build
+        dicts for the hits they keep.
+
+        Returns:
+            (source_idx, target_idx, aspect_idx, orb) arrays, one entry per hit,
+            where `aspect_idx` indexes `self.aspect_definitions`.
+        """
+        return aspect_scan(
+            np.asarray(source_lons, dtype=np.float64),
+            np.asarray(target_lons, dtype=np.float64),
+            self.aspect_angles,
+            self.aspect_orbs,
+            max_orb,
+        )
+
 # --- Create a single, shared instance for the application's lifetime ---
 try:
     aspect_service_instance = AspectService()
@@ -25,6 +25,7 @@ from typing import Dict, List, Tuple, Any, Optional, Final
 from itertools import combinations
 
 # Third-party library imports
+import numpy as np
 import swisseph as swe
 
 # Local application imports
@@ -84,6 +85,7 @@ class AstrologyDataCache:
         self.zodiac_signs, self.zodiac_map = self._load_zodiac_data()
         self.planets = self._load_planetary_data()
         self.aspects = self._load_aspect_data()
+        self.aspect_arrays = self._build_aspect_arrays()
         self.house_systems = self._load_house_systems()
         self.dignity_scores = self._load_dignity_scores()
         self.fixed_stars = self._load_fixed_stars()
@@ -96,6 +98,16 @@ class AstrologyDataCache:
         return signs, {s['key']: s for s in signs}
     def _load_planetary_data(self) -> Dict[str, Any]: return {"sun": {"symbol": "☉"}, "moon": {"symbol": "☽"}, "mercury": {"symbol": "☿"},"venus": {"symbol": "♀"}, "mars": {"symbol": "♂"}, "jupiter": {"symbol": "♃"},"saturn": {"symbol": "♄"}, "uranus": {"symbol": "♅"}, "neptune": {"symbol": "♆"},"pluto": {"symbol": "♇"}, "true_node": {"symbol": "☊"}, "chiron": {"symbol": "⚷"},"ascendant": {"symbol": "Asc"}, "midheaven": {"symbol": "MC"}, "descendant": {"symbol": "Dsc"},"imum_coeli": {"symbol": "IC"}, "part_of_fortune": {"symbol": "⊗"}}
     def _load_aspect_data(self) -> Dict[str, Any]: return {"conjunction": {"degrees": 0, "orb": 8.0, "symbol": "☌", "type": "major"},"opposition": {"degrees": 180, "orb": 8.0, "symbol": "☍", "type": "major"},"trine": {"degrees": 120, "orb": 8.0, "symbol": "△", "type": "major"},"square": {"degrees": 90, "orb": 7.0, "symbol": "□", "type": "major"},"sextile": {"degrees": 60, "orb": 6.0, "symbol": "⚹", "type": "major"},"quincunx": {"degrees": 150, "orb": 3.0, "symbol": "⚻", "type": "minor"}}
+    def _build_aspect_arrays(self) -> Tuple[Tuple[str, ...], np.ndarray, np.ndarray, Tuple[str, ...]]:
+        """
+        Aspect names, angles, orbs and symbols as parallel sequences for the
+        compiled aspect kernels. The arrays are shared and read-only.
+        """
+        degrees = np.array([info["degrees"] for info in self.aspects.values()], dtype=np.float64)
+        orbs = np.array([info["orb"] for info in self.aspects.values()], dtype=np.float64)
+        degrees.setflags(write=False)
+        orbs.setflags(write=False)
+        return tuple(self.aspects), degrees, orbs, tuple(info["symbol"] for info in self.aspects.values())
     def _load_house_systems(self) -> Dict[str, bytes]: return {"Placidus": b'P', "Koch": b'K', "Porphyry": b'O', "WholeSign": b'W', "Regiomontanus": b'R', "Campanus": b'C', "Equal": b'E'}
     def _load_dignity_scores(self) -> Dict[str, int]: return {"Rulership": 5, "Exaltation": 4, "Detriment": -4, "Fall": -5, "Peregrine": 0}
     def _load_dignity_rulerships(self) -> Dict[str, Dict[str, str]]: return {"rulership": {"Aries": "Mars", "Taurus": "Venus", "Gemini": "Mercury", "Cancer": "Moon", "Leo": "Sun", "Virgo": "Mercury", "Libra": "Venus", "Scorpio": "Mars", "Sagittarius": "Jupiter", "Capricorn": "Saturn", "Aquarius": "Saturn", "Pisces": "Jupiter"}, "modern_rulership": {"Scorpio": "Pluto", "Aquarius": "Uranus", "Pisces": "Neptune"}, "exaltation": {"Aries": "Sun", "Taurus": "Moon", "Cancer": "Jupiter", "Virgo": "Mercury", "Libra": "Saturn", "Capricorn": "Mars", "Pisces": "Venus"}}
@@ -134,11 +146,26 @@ class AstrologyEngine:
                 all_points_map[part_of_fortune['key']] = part_of_fortune
             aspects = self._calculate_aspects(all_points_map)
             analysis = self._run_analysis_modules(all_points_list, aspects, all_points_map)
-            return {"chart_info": {"datetime_utc": self.dt_utc.isoformat(), "julian_day_utc": self.julian_day_utc, "latitude": self.latitude, "longitude": self.longitude, "altitude": self.altitude, "house_system": self.house_system_name}, "points": points, "angles": angles, "house_cusps": house_cusps, "part_of_fortune": part_of_fortune, "aspects": aspects, "analysis": analysis}
+            return {"chart_info": self._chart_info(), "points": points, "angles": angles, "house_cusps": house_cusps, "part_of_fortune": part_of_fortune, "aspects": aspects, "analysis": analysis}
+        except swe.Error as e:
+            logger.warning(f"A swisseph calculation error occurred: {e}")
+            return {"error": f"Calculation error for house system '{self.house_system_name}' at this latitude. Try 'WholeSign'. Details: {e}"}
+
+    def generate_chart_points(self) -> Dict[str, Any]:
+        """
+        Generates only the chart info and planetary points (with their houses),
+        skipping the angles, part of fortune, aspects and analysis modules that
+        transit and progression lookups discard.
+        """
+        try:
+            return {"chart_info": self._chart_info(), "points": self._get_planetary_details()}
         except swe.Error as e:
             logger.warning(f"A swisseph calculation error occurred: {e}")
             return {"error": f"Calculation error for house system '{self.house_system_name}' at this latitude. Try 'WholeSign'. Details: {e}"}
 
+    def _chart_info(self) -> Dict[str, Any]:
+        return {"datetime_utc": self.dt_utc.isoformat(), "julian_day_utc": self.julian_day_utc, "latitude": self.latitude, "longitude": self.longitude, "altitude": self.altitude, "house_system": self.house_system_name}
+
     def _get_raw_planetary_positions(self) -> Dict[str, tuple]:
         if 'raw_positions' in self._cache: return self._cache['raw_positions']
         positions = {name: swe.calc_ut(self.julian_day_utc, pid, self.swe_flags) for name, pid in self.PLANET_IDS.items()}
@@ -160,6 +187,32 @@ class AstrologyEngine:
         key = name.lower().replace(" ", "_")
         return {"name": name, "key": key, "symbol": self.data_cache.planets.get(key, {}).get("symbol", sign_info['symbol']), "longitude": round(lon, 6), "speed_longitude": round(speed, 6) if speed is not None else None, "is_retrograde": speed < 0 if speed is not None else None, "ecliptic_latitude": round(lat, 6) if lat is not None else None, "sign_key": sign_info['key'], "sign_name": sign_info['name'], "element": sign_info['element'], "modality": sign_info['modality'], "degrees_in_sign": round(deg_in_zodiac, 6), "display_dms": f"{d}°{sign_info['symbol']}{m}'{s}\""}
     
+    @classmethod
+    def _format_points_bulk(cls, names: List[str], lons: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        Vectorized `_format_point` for many position-only points (no speed or
+        latitude). Sign and DMS arithmetic runs once over the whole array;
+        results are identical to calling `_format_point` per point.
+        """
+        lons = np.asarray(lons, dtype=np.float64)
+        sign_idx = (lons // 30).astype(np.int64)
+        deg_in_sign = np.mod(lons, 30.0)
+        d = np.floor(deg_in_sign)
+        m_float = (deg_in_sign - d) * 60
+        m = np.floor(m_float)
+        sec = np.rint((m_float - m) * 60)
+        # Carry rounded seconds/minutes exactly like `_degrees_to_dms`.
+        m = np.where(sec == 60, m + 1, m); sec = np.where(sec == 60, 0, sec)
+        d = np.where(m == 60, d + 1, d); m = np.where(m == 60, 0, m)
+
+        zodiac_signs, planets = astro_data_cache.zodiac_signs, astro_data_cache.planets
+        formatted = []
+        for name, lon, si, deg, dd, mm, ss in zip(names, lons.tolist(), sign_idx.tolist(), deg_in_sign.tolist(), d.astype(int).tolist(), m.astype(int).tolist(), sec.astype(int).tolist()):
+            sign_info = zodiac_signs[si]
+            key = name.lower().replace(" ", "_")
+            formatted.append({"name": name, "key": key, "symbol": planets.get(key, {}).get("symbol", sign_info['symbol']), "longitude": round(lon, 6), "speed_longitude": None, "is_retrograde": None, "ecliptic_latitude": None, "sign_key": sign_info['key'], "sign_name": sign_info['name'], "element": sign_info['element'], "modality": sign_info['modality'], "degrees_in_sign": round(deg, 6), "display_dms": f"{dd}°{sign_info['symbol']}{mm}'{ss}\""})
+        return formatted
+
     @staticmethod
     def _degrees_to_dms(degrees: float) -> Tuple[int, int, int]:
         d = int(degrees); m_float = (degrees - d) * 60; m = int(m_float); s = int(round((m_float - m) * 60))
@@ -509,6 +562,47 @@ class AstrologyService:
             self.logger.critical(f"AstrologyService: An unexpected fatal error occurred during natal chart calculation: {e}", exc_info=True)
             return {"error": "An unexpected internal server error occurred during chart calculation. The event has been logged for review."}
 
+    def get_transit_points(
+        self,
+        datetime_str: str,
+        timezone_str: str,
+        latitude: float,
+        longitude: float,
+        house_system: str,
+        altitude: float = 0.0
+    ) -> Dict[str, Any]:
+        """
+        Calculates only the planetary points of a chart, for transit lookups.
+        Returns the same `chart_info` and `points` as `get_natal_chart_details`.
+        """
+        self.logger.info(f"AstrologyService: Transit points request for: {datetime_str} in {timezone_str}")
+        dt_aware = parse_datetime_with_timezone(datetime_str, timezone_str)
+        if not dt_aware:
+            return {"error": "Invalid or unparseable datetime or timezone string provided."}
+        return self.get_chart_points_for_utc(convert_to_utc(dt_aware), latitude, longitude, house_system, altitude)
+
+    def get_chart_points_for_utc(
+        self,
+        dt_utc: datetime.datetime,
+        latitude: float,
+        longitude: float,
+        house_system: str,
+        altitude: float = 0.0
+    ) -> Dict[str, Any]:
+        """
+        Calculates only the planetary points of a chart for a UTC moment that
+        is already known, without any string parsing or timezone localization.
+        """
+        try:
+            if house_system not in self.data_cache.house_systems:
+                return {"error": f"Unsupported house system: '{house_system}'. Available: {list(self.data_cache.house_systems.keys())}"}
+
+            engine = AstrologyEngine(dt_utc, latitude, longitude, altitude, house_system)
+            return engine.generate_chart_points()
+        except Exception as e:
+            self.logger.critical(f"AstrologyService: An unexpected fatal error occurred during chart points calculation: {e}", exc_info=True)
+            return {"error": "An unexpected internal server error occurred during chart calculation. The event has been logged for review."}
+
     # Add other high-level methods here as needed, e.g.:
     # def get_current_transits(self, date: datetime.datetime, location_data: Dict) -> Dict:
     #     pass
\ No newline at end of file
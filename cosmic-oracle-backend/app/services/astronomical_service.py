@@ -1,6 +1,7 @@
 """
 Astronomical calculations service using PySwissEph and Skyfield for precise calculations.
 """
+import numpy as np
 import swisseph as swe
 from skyfield.api import load, utc
 from skyfield.units import Angle
@@ -73,6 +74,30 @@ class AstronomicalService:
             'julian_day': julian_day
         }
 
+    def get_planet_positions(self, planet: str, julian_days: np.ndarray) -> np.ndarray:
+        """
+        Get the longitude and longitudinal speed of a planet at many Julian Days.
+
+        Batch form of get_planet_position for sampling loops: the planet is
+        resolved once and no per-date datetime conversion or dict is built.
+
+        Returns:
+            (N, 2) array of (longitude, speed in deg/day), one row per date.
+        """
+        planet_id = self.PLANETS.get(planet.lower())
+
+        if planet_id is None:
+            raise ValueError(f"Invalid planet: {planet}")
+
+        flags = swe.FLG_SWIEPH + swe.FLG_SPEED
+        julian_days = np.asarray(julian_days, dtype=np.float64)
+        out = np.empty((julian_days.shape[0], 2), dtype=np.float64)
+        for k, julian_day in enumerate(julian_days.tolist()):
+            position = swe.calc_ut(julian_day, planet_id, flags)[0]
+            out[k, 0] = position[0]
+            out[k, 1] = position[3]
+        return out
+
     def calculate_moon_phase(self, date_time: datetime) -> Dict:
         """Calculate precise moon phase using Swiss Ephemeris."""
         julian_day = self._get_julian_day(date_time)
@@ -153,27 +178,27 @@ class AstronomicalService:
 
     def calculate_next_eclipse(self, date_time: datetime) -> Dict:
         """Calculate the next solar and lunar eclipses."""
-        julian_day = self._get_julian_day(date_time)
-        
-        # Find next solar eclipse
-        solar = swe.sol_eclipse_when_glob(julian_day)
-        solar_date = self._julian_to_datetime(solar[1][0])
-        
-        # Find next lunar eclipse
-        lunar = swe.lun_eclipse_when(julian_day)
-        lunar_date = self._julian_to_datetime(lunar[1][0])
+        return {
+            'next_solar_eclipse': self.calculate_next_solar_eclipse(date_time),
+            'next_lunar_eclipse': self.calculate_next_lunar_eclipse(date_time)
+        }
 
+    def calculate_next_solar_eclipse(self, date_time: datetime) -> Dict:
+        """Calculate the next solar eclipse only."""
+        solar = swe.sol_eclipse_when_glob(self._get_julian_day(date_time))
         return {
-            'next_solar_eclipse': {
-                'date': solar_date,
-                'type': self._get_eclipse_type(solar[0]),
-                'julian_day': solar[1][0]
-            },
-            'next_lunar_eclipse': {
-                'date': lunar_date,
-                'type': self._get_eclipse_type(lunar[0]),
-                'julian_day': lunar[1][0]
-            }
+            'date': self._julian_to_datetime(solar[1][0]),
+            'type': self._get_eclipse_type(solar[0]),
+            'julian_day': solar[1][0]
+        }
+
+    def calculate_next_lunar_eclipse(self, date_time: datetime) -> Dict:
+        """Calculate the next lunar eclipse only."""
+        lunar = swe.lun_eclipse_when(self._get_julian_day(date_time))
+        return {
+            'date': self._julian_to_datetime(lunar[1][0]),
+            'type': self._get_eclipse_type(lunar[0]),
+            'julian_day': lunar[1][0]
         }
 
     def calculate_lunar_nodes(self, date_time: datetime) -> Dict:
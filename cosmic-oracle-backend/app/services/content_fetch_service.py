@@ -201,4 +201,10 @@ class ContentFetchService:
         """
         Fetches interpretative data for astrological houses.
         """
-        return _load_json_data_cached('house_interpretations.json')
\ No newline at end of file
+        return _load_json_data_cached('house_interpretations.json')
+
+    def get_heliacal_content(self) -> Optional[Dict[str, Any]]:
+        """
+        Fetches heliacal event interpretations and fixed star lore.
+        """
+        return _load_json_data_cached('heliacal_content.json')
@@ -6,14 +6,16 @@ Calculates the heliacal rising and setting of planets and major fixed stars,
 a key technique in traditional and ancient astrology.
 """
 import logging
+from functools import lru_cache
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
+import numpy as np
 from skyfield.api import Star, load, wgs84
-from skyfield.almanac import find_discrete
+from skyfield.almanac import find_discrete, risings_and_settings
 
 from app.core.config import settings
-from app.services.content_fetch_service import get_heliacal_content
+from app.services.content_fetch_service import ContentFetchService
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +25,48 @@ logger = logging.getLogger(__name__)
 # Sun must be this far *below* the horizon when the star is *on* the horizon.
 ARC_OF_VISION = 11.0 
 
+# A star is visible at a twilight when it is above the horizon at the moment
+# the Sun reaches the arc of vision below it. That state changes only around
+# the heliacal dates (about two per star per year), so it is sampled on every
+# fifth twilight first, and day by day only between samples that differ.
+COARSE_STEP_DAYS = 5
+
+
+def find_twilights(eph, location, start_t, end_t):
+    """
+    Morning and evening twilights in the range: the moments the Sun rises or
+    sets through ARC_OF_VISION below the horizon at `location`.
+    """
+    twilight = risings_and_settings(eph, eph['sun'], location, horizon_degrees=-ARC_OF_VISION)
+    times, is_morning = find_discrete(start_t, end_t, twilight)
+    return times[is_morning == 1], times[is_morning == 0]
+
+
+def find_visibility_changes(is_visible, count: int) -> List[Tuple[int, bool]]:
+    """
+    Finds where a per-twilight visibility state changes, as (twilight index,
+    new state) pairs. `is_visible(indices)` returns the state at those
+    twilights. Every COARSE_STEP_DAYS-th twilight is sampled first, and only
+    the brackets whose ends differ are refined twilight by twilight.
+    """
+    if count < 2:
+        return []
+    coarse = np.unique(np.append(np.arange(0, count, COARSE_STEP_DAYS), count - 1))
+    coarse_visible = is_visible(coarse)
+    changes = []
+    for n in np.flatnonzero(coarse_visible[1:] != coarse_visible[:-1]).tolist():
+        lower, upper = int(coarse[n]), int(coarse[n + 1])
+        inner = np.arange(lower + 1, upper)
+        visible = np.concatenate((
+            coarse_visible[n:n + 1],
+            is_visible(inner) if len(inner) else np.empty(0, dtype=bool),
+            coarse_visible[n + 1:n + 2],
+        ))
+        for offset in np.flatnonzero(visible[1:] != visible[:-1]).tolist():
+            changes.append((lower + offset + 1, bool(visible[offset + 1])))
+    return changes
+
+
 class HeliacalService:
     """
     A singleton service that manages Skyfield resources and provides
@@ -37,17 +81,29 @@ class HeliacalService:
         self.earth = self.eph['earth']
         self.sun = self.eph['sun']
         
-        content = get_heliacal_content()
+        content = ContentFetchService().get_heliacal_content() or {}
         self.interpretations = content.get("event_interpretations", {})
         self.star_interpretations = content.get("major_stars", {})
         
-        # Skyfield's Star object requires RA, Dec, and other data for a specific epoch (J2000.0)
+        # Skyfield's Star object requires RA, Dec, and other data for a specific epoch (J2000.0).
+        # Coordinates are inlined (Hipparcos, J2000.0) so initialization never
+        # depends on a network name lookup and is fully deterministic offline.
         self.fixed_stars = {
-            'Sirius': Star.from_name('Sirius'),
-            'Regulus': Star.from_name('Regulus'),
-            'Aldebaran': Star.from_name('Aldebaran'),
-            'Antares': Star.from_name('Antares'),
-            'Spica': Star.from_name('Spica')
+            'Sirius': Star(ra_hours=(6, 45, 8.917), dec_degrees=(-16, 42, 58.02),
+                           ra_mas_per_year=-546.01, dec_mas_per_year=-1223.07,
+                           parallax_mas=379.21, radial_km_per_s=-5.50),
+            'Regulus': Star(ra_hours=(10, 8, 22.311), dec_degrees=(11, 58, 1.95),
+                            ra_mas_per_year=-248.73, dec_mas_per_year=5.59,
+                            parallax_mas=41.13, radial_km_per_s=5.90),
+            'Aldebaran': Star(ra_hours=(4, 35, 55.239), dec_degrees=(16, 30, 33.49),
+                              ra_mas_per_year=63.45, dec_mas_per_year=-188.94,
+                              parallax_mas=48.94, radial_km_per_s=54.26),
+            'Antares': Star(ra_hours=(16, 29, 24.460), dec_degrees=(-26, 25, 55.21),
+                            ra_mas_per_year=-12.11, dec_mas_per_year=-23.30,
+                            parallax_mas=5.89, radial_km_per_s=-3.40),
+            'Spica': Star(ra_hours=(13, 25, 11.579), dec_degrees=(-11, 9, 40.75),
+                          ra_mas_per_year=-42.35, dec_mas_per_year=-30.67,
+                          parallax_mas=13.06, radial_km_per_s=1.00),
         }
         logger.info("HeliacalService initialized successfully with star catalog.")
 
@@ -59,49 +115,67 @@ class HeliacalService:
             return self.eph[name.lower()]
         return None
 
+    @lru_cache(maxsize=1024)
+    def _get_location(self, lat_bucket: int, lon_bucket: int):
+        """
+        Returns a cached geographic location. Coordinates are bucketed to
+        hundredths of a degree (~1 km) so repeat city queries reuse the object.
+        """
+        return wgs84.latlon(lat_bucket / 100, lon_bucket / 100)
+
+    @lru_cache(maxsize=1024)
+    def _get_observer(self, lat_bucket: int, lon_bucket: int):
+        """Returns a cached topocentric observer for a bucketed location."""
+        return self.earth + self._get_location(lat_bucket, lon_bucket)
+
     def find_heliacal_events(self, start_date: datetime, end_date: datetime, latitude: float, longitude: float) -> List[Dict[str, Any]]:
         """
         Finds all major heliacal events for pre-defined bodies in a time range.
         """
-        observer = self.earth + wgs84.latlon(latitude, longitude)
+        buckets = (round(latitude * 100), round(longitude * 100))
+        observer = self._get_observer(*buckets)
         start_t = self.ts.from_datetime(start_date)
         end_t = self.ts.from_datetime(end_date)
         
         all_events = []
 
+        # The twilights are found once and shared by every star. A star rises
+        # heliacally on the first morning it is visible, and sets heliacally
+        # after the last evening it is visible.
+        mornings, evenings = find_twilights(self.eph, self._get_location(*buckets), start_t, end_t)
+        twilight_searches = (
+            ("heliacal_rising", mornings, True, 0),
+            ("heliacal_setting", evenings, False, -1),
+        )
+
+        # Every star is sampled at the same coarse twilights, so the observer's
+        # position at a set of twilights is computed once and shared.
+        observer_states = {}
+
         for name, body in self.fixed_stars.items(): # Could expand to planets too
-            
-            # --- Define the search function for Skyfield's almanac ---
-            # We are looking for the moment when the Sun is at a specific altitude
-            # *below* the horizon. The function will be zero at this moment.
-            def heliacal_event_function(t):
-                # We need the altitude of the star and the sun at time `t`
-                star_alt, _, _ = observer.at(t).observe(body).apparent().altaz()
-                sun_alt, _, _ = observer.at(t).observe(self.sun).apparent().altaz()
-                
-                # Heliacal condition: Star is on the horizon (alt=0) AND Sun is at a specific depth.
-                # We can combine this: Is the star's altitude + the Sun's required depth equal to zero?
-                # The function returns the difference from the ideal condition.
-                return star_alt.degrees - (sun_alt.degrees + ARC_OF_VISION)
-
-            # Set the step size for the search
-            heliacal_event_function.step_days = 1.0
-            
-            times, events = find_discrete(start_t, end_t, heliacal_event_function)
-            
-            # `events` will be True for a rising (morning), False for a setting (evening)
-            for t_event, is_rising in zip(times, events):
-                event_type = "heliacal_rising" if is_rising else "heliacal_setting"
-                interp = self.interpretations.get(event_type, {})
-                
-                all_events.append({
-                    "event_name": f"{name} {interp.get('title', event_type.replace('_', ' ').title())}",
-                    "event_type": event_type,
-                    "datetime_utc": t_event.utc_iso(),
-                    "body_name": name,
-                    "summary": self.star_interpretations.get(name, ""),
-                    "influence": interp.get("summary", "")
-                })
+            for event_type, twilights, event_state, event_offset in twilight_searches:
+                def is_visible(indices):
+                    key = (event_type, indices.tobytes())
+                    observer_at_t = observer_states.get(key)
+                    if observer_at_t is None:
+                        observer_at_t = observer_states[key] = observer.at(twilights[indices])
+                    star_alt, _, _ = observer_at_t.observe(body).apparent().altaz()
+                    return star_alt.degrees > 0.0
+
+                for index, state in find_visibility_changes(is_visible, len(twilights)):
+                    if state != event_state:
+                        continue
+                    t_event = twilights[index + event_offset]
+                    interp = self.interpretations.get(event_type, {})
+
+                    all_events.append({
+                        "event_name": f"{name} {interp.get('title', event_type.replace('_', ' ').title())}",
+                        "event_type": event_type,
+                        "datetime_utc": t_event.utc_iso(),
+                        "body_name": name,
+                        "summary": self.star_interpretations.get(name, ""),
+                        "influence": interp.get("summary", "")
+                    })
 
         all_events.sort(key=lambda x: x['datetime_utc'])
         return all_events
@@ -19,7 +19,7 @@ logger = logging.getLogger(__name__)
 HOUSE_RULERSHIPS = {
     1: ["life", "the querent"],
     2: ["wealth", "movable possessions"],
-    3. ["siblings", "short journeys", "communication"],
+    3: ["siblings", "short journeys", "communication"],
     4: ["father", "home", "land", "end of life"],
     5: ["children", "pleasure", "creativity", "romance"],
     6: ["illness", "employees", "small animals"],
@@ -128,6 +128,13 @@ def analyze_horary_chart(
         if 'error' in chart:
             return {"error": f"Could not calculate base chart for horary: {chart['error']}"}
 
+        # Index applying aspects by their point pair once, keeping the first
+        # occurrence so lookups match the order the chart reports them in.
+        aspects_by_pair: Dict[frozenset, Dict[str, Any]] = {}
+        for aspect in chart.get('aspects', []):
+            if aspect.get('is_applying'):
+                aspects_by_pair.setdefault(frozenset((aspect['point1_name'], aspect['point2_name'])), aspect)
+
         # Step 2: Apply horary-specific analysis.
         considerations = _check_considerations_before_judgment(chart)
         
@@ -143,14 +150,7 @@ def analyze_horary_chart(
         quesited_significator = chart['points'].get(quesited_ruler_name)
 
         # Step 4: Check for a perfecting aspect between significators (the core of the answer).
-        perfecting_aspect = None
-        for aspect in chart.get('aspects', []):
-            significators_involved = {querent_ruler_name, quesited_ruler_name}
-            aspect_points = {aspect['point1_name'], aspect['point2_name']}
-            
-            if significators_involved == aspect_points and aspect.get('is_applying'):
-                perfecting_aspect = aspect
-                break # Found the most important aspect
+        perfecting_aspect = aspects_by_pair.get(frozenset((querent_ruler_name, quesited_ruler_name)))
 
         # Step 5: Formulate a preliminary judgment.
         judgment = ""
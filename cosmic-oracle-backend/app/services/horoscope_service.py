@@ -10,6 +10,8 @@ import logging
 from datetime import datetime, date, timezone
 from typing import Dict, Any, List, Optional
 
+import numpy as np
+
 # IMPORTANT: Do NOT import 'astrology_service' directly from 'app' here.
 # It will be passed into this service's constructor.
 # REMOVED: from app.services.astrology_service import get_natal_chart_details # <-- THIS LINE IS THE PROBLEM
@@ -68,25 +70,30 @@ class HoroscopeService:
             logger.critical("Missing essential horoscope or zodiac content. Please check JSON files.")
             raise RuntimeError("Could not load necessary horoscope or zodiac content files from content_fetch_service.")
         
-        # Assuming zodiac_data keys are correct for direct access like 'aries', 'taurus'
-        if self.zodiac_data:
-            self.sign_longitudes = {
-                sign_key: (i * 30 + 15) for i, sign_key in enumerate(self.zodiac_data.keys())
-            } 
-        else:
-            self.sign_longitudes = {}
+        # Assuming zodiac_data keys are correct for direct access like 'aries', 'taurus'.
+        # Each sign is represented by the Sun at 15° of that sign, indexed by ordinal.
+        self._sign_keys = tuple(self.zodiac_data.keys())
+        self._sign_key_idx = {sign_key: i for i, sign_key in enumerate(self._sign_keys)}
+        self._sign_longitudes_arr = np.arange(len(self._sign_keys)) * 30.0 + 15.0
+        if not self._sign_keys:
             logger.error("Zodiac data not loaded, sign longitudes will be empty.")
         
         logger.info("HoroscopeService initialized successfully.")
         self._initialized = True # Mark as initialized
 
-    def _calculate_transits_to_sun(self, sun_longitude: float) -> List[Dict[str, Any]]:
-        """Calculates aspects from current planets to a given Sun longitude."""
-        now_utc = datetime.now(timezone.utc)
+    @staticmethod
+    def _current_ref_time() -> datetime:
+        """Current UTC time snapped to the minute, so every sign in a batch sees the same chart."""
+        return datetime.now(timezone.utc).replace(second=0, microsecond=0)
+
+    def _calculate_transits_to_sun(self, sun_longitude: float, ref_time: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Calculates aspects from the planets at `ref_time` (default: now) to a given Sun longitude."""
+        if ref_time is None:
+            ref_time = self._current_ref_time()
         
         # IMPORTANT: Use self.astrology_service.get_natal_chart_details
         transit_chart = self.astrology_service.get_natal_chart_details(
-            datetime_str=now_utc.isoformat(),
+            datetime_str=ref_time.isoformat(),
             timezone_str="UTC",
             latitude=51.4779, # Use a fixed location for general transits
             longitude=0.0,    # (Greenwich, UK)
@@ -119,9 +126,11 @@ class HoroscopeService:
                     })
         return active_aspects
 
-    def generate_daily_horoscope(self, zodiac_sign_key: str, target_date: date) -> Dict[str, Any]:
+    def generate_daily_horoscope(self, zodiac_sign_key: str, target_date: date, ref_time: Optional[datetime] = None) -> Dict[str, Any]:
         """
         Public facade to generate a dynamic daily horoscope for a specific sign.
+        Callers generating several signs should pass one shared `ref_time` so all
+        signs are computed against an identical transit chart.
         """
         logger.info(f"Generating daily horoscope for {zodiac_sign_key} for {target_date.isoformat()}.")
         
@@ -131,9 +140,11 @@ class HoroscopeService:
 
         try:
             sign_name = self.zodiac_data[sign_key_lower]['name']
-            sun_longitude = self.sign_longitudes[sign_key_lower]
+            sun_longitude = float(self._sign_longitudes_arr[self._sign_key_idx[sign_key_lower]])
             
-            active_transits = self._calculate_transits_to_sun(sun_longitude)
+            if ref_time is None:
+                ref_time = self._current_ref_time()
+            active_transits = self._calculate_transits_to_sun(sun_longitude, ref_time)
 
             if not active_transits:
                 horoscope_text = f"The cosmic energies are relatively quiet for {sign_name} today. It's a good day for steady progress and sticking to your routine. Focus on the fundamentals and prepare for the more dynamic days ahead."
@@ -8,7 +8,7 @@ import logging
 from typing import Dict, Any
 from datetime import datetime
 
-from app.services.astrology_service import get_natal_chart_details
+from app.services.astrology_service import get_julian_day_utc, swe
 from app.services.content_fetch_service import get_lunar_mansions_content
 
 logger = logging.getLogger(__name__)
@@ -32,20 +32,10 @@ class LunarMansionService:
         """
         logger.info(f"Calculating lunar mansion for {dt_utc.isoformat()}.")
         try:
-            # We only need the Moon's longitude, so a geocentric chart is sufficient and fast.
-            chart = get_natal_chart_details(
-                datetime_str=dt_utc.isoformat(),
-                timezone_str="UTC",
-                latitude=0.0,
-                longitude=0.0,
-                house_system="WholeSign" # Simplest system for this purpose
-            )
-            if 'error' in chart:
-                return {"error": f"Could not calculate Moon's position: {chart['error']}"}
-
-            moon_lon = chart.get('points', {}).get('Moon', {}).get('longitude')
-            if moon_lon is None:
-                return {"error": "Failed to retrieve Moon's longitude from the chart."}
+            # Only the Moon's longitude is needed, so query Swiss Ephemeris for the
+            # Moon alone rather than building a full chart (houses, planets, aspects).
+            julian_day_utc = get_julian_day_utc(dt_utc)
+            moon_lon = swe.calc_ut(julian_day_utc, swe.MOON, swe.FLG_SWIEPH | swe.FLG_SPEED)[0][0]
 
             # Find the mansion the Moon falls into
             current_mansion = None
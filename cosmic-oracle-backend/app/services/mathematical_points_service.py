@@ -3,22 +3,105 @@
 Service for calculating advanced mathematical and sensitive points in an astrological chart.
 """
 import logging
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timezone
 
+import numpy as np
+from skyfield.framelib import ecliptic_frame
+
 # --- REUSE: Import the primary astrology service ---
-from app.services.astrology_service import get_natal_chart_details, AstrologyEngine
+from app.services.astrology_service import get_natal_chart_details, AstrologyEngine, swe
 from app.services.content_fetch_service import get_mathematical_points_content
 from app.services.moon_service import moon_service_instance # For Syzygy calculation
 
 logger = logging.getLogger(__name__)
 
+# Syzygies fall within the previous ~15 days, so the current and previous
+# calendar months always contain the one preceding any birth time.
+MAX_SYZYGY_LOOKBACK_DAYS = 30.0
+
+# The Moon gains ~12 degrees a day on the Sun, so a 1-day grid brackets every
+# New and Full Moon, and a few secant steps from the bracket reach sub-second
+# precision (the elongation is close to linear over a single day).
+SYZYGY_GRID_STEP_DAYS = 1.0
+SYZYGY_SECANT_ITERATIONS = 3
+
+# Phase codes follow Skyfield's almanac convention.
+NEW_MOON_CODE = 0
+FULL_MOON_CODE = 2
+
+
+def _sun_moon_elongation(tt_jd: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Evaluates the geocentric Sun and Moon for an array of TT Julian dates in a
+    single vectorized Skyfield call.
+
+    Returns:
+        (sin_elongation, sun_longitude_deg) arrays. sin(Moon - Sun) is zero at
+        every syzygy: rising through zero at New Moon, falling at Full Moon.
+    """
+    eph = moon_service_instance.eph
+    earth_at_t = eph['earth'].at(moon_service_instance.ts.tt_jd(tt_jd))
+    _, sun_lon, _ = earth_at_t.observe(eph['sun']).apparent().frame_latlon(ecliptic_frame)
+    _, moon_lon, _ = earth_at_t.observe(eph['moon']).apparent().frame_latlon(ecliptic_frame)
+    return np.sin(moon_lon.radians - sun_lon.radians), np.asarray(sun_lon.degrees)
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso_utc(value: str) -> datetime:
+    """Parses a chart's ISO-8601 UTC timestamp; repeat charts reuse the same immutable datetime."""
+    return datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=4096)
+def _syzygies_in_month(year: int, month: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Finds every New and Full Moon in a UTC calendar month.
+
+    The Sun-Moon elongation is sampled on a 1-day grid, each sign change of its
+    sine brackets one syzygy, and all brackets are refined together with a
+    vectorized secant search. Syzygies are the same for everyone born in that
+    window, so the results are cached per (year, month). The returned arrays are
+    shared and must not be mutated.
+
+    Returns:
+        (tt_jd, sun_longitude_deg, phase_code) arrays in chronological order.
+    """
+    next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+    ts = moon_service_instance.ts
+    start_jd = ts.from_datetime(datetime(year, month, 1, tzinfo=timezone.utc)).tt
+    end_jd = ts.from_datetime(datetime(next_year, next_month, 1, tzinfo=timezone.utc)).tt
+
+    n_steps = int(np.ceil((end_jd - start_jd) / SYZYGY_GRID_STEP_DAYS))
+    grid = np.linspace(start_jd, end_jd, n_steps + 1)
+    f_grid, _ = _sun_moon_elongation(grid)
+
+    is_positive = f_grid >= 0.0
+    idx = np.flatnonzero(is_positive[:-1] != is_positive[1:])
+    if idx.size == 0:
+        return np.empty(0), np.empty(0), np.empty(0, dtype=np.int64)
+    codes = np.where(is_positive[idx + 1], NEW_MOON_CODE, FULL_MOON_CODE)
+
+    # Vectorized secant refinement of all brackets at once.
+    t0, t1 = grid[idx], grid[idx + 1]
+    f0, f1 = f_grid[idx], f_grid[idx + 1]
+    for _ in range(SYZYGY_SECANT_ITERATIONS):
+        denom = f1 - f0
+        converged = denom == 0.0
+        t2 = np.where(converged, t1, t1 - f1 * (t1 - t0) / np.where(converged, 1.0, denom))
+        f2, sun_lon = _sun_moon_elongation(t2)
+        t0, f0, t1, f1 = t1, f1, t2, f2
+
+    return t1, sun_lon, codes
+
+
 class MathematicalPointsService:
     """
     A singleton service that calculates various mathematical points like the
     Vertex, Equatorial Ascendant, and Pre-Natal Syzygy.
     """
-    _instance = None
+    __slots__ = ('interpretations',)
 
     def __init__(self):
         logger.info("Initializing MathematicalPointsService singleton...")
@@ -30,33 +113,28 @@ class MathematicalPointsService:
     def _calculate_pre_natal_syzygy(self, birth_dt_utc: datetime) -> Dict[str, Any]:
         """
         Calculates the longitude and type of the New or Full Moon immediately preceding birth.
-        This uses a more robust search method than the original.
+        Phase events are looked up from the per-month cache rather than searched per request.
         """
-        # Search backward from the birth time for up to 30 days.
-        end_t = moon_service_instance.ts.from_datetime(birth_dt_utc)
-        start_t = moon_service_instance.ts.from_datetime(birth_dt_utc - timedelta(days=30))
-        
-        # Use Skyfield's phase finder
-        t, y = moon_service_instance.phases(moon_service_instance.eph, start_t, end_t)
-        
-        if len(t) == 0:
+        birth_tt = moon_service_instance.ts.from_datetime(birth_dt_utc).tt
+        prev_year, prev_month = (birth_dt_utc.year - 1, 12) if birth_dt_utc.month == 1 else (birth_dt_utc.year, birth_dt_utc.month - 1)
+        months = [_syzygies_in_month(prev_year, prev_month), _syzygies_in_month(birth_dt_utc.year, birth_dt_utc.month)]
+        event_jds = np.concatenate([m[0] for m in months])
+        event_lons = np.concatenate([m[1] for m in months])
+        event_codes = np.concatenate([m[2] for m in months])
+
+        # The last event at or before birth is the one immediately preceding it.
+        idx = int(np.searchsorted(event_jds, birth_tt, side='right')) - 1
+        if idx < 0 or birth_tt - event_jds[idx] > MAX_SYZYGY_LOOKBACK_DAYS:
             return {"error": "Could not find a pre-natal syzygy within 30 days of birth."}
 
-        # The last event found in the list is the one immediately preceding birth.
-        last_event_time = t[-1]
-        last_event_phase_code = y[-1]
-
-        phase_name = "New Moon" if last_event_phase_code == 0 else "Full Moon"
-        
-        # Get the longitude of the Sun/Moon at that exact moment.
-        syzygy_point = moon_service_instance.eph['sun'].at(last_event_time)
-        _, lon, _ = syzygy_point.frame_latlon(ecliptic_frame)
+        last_event_time = moon_service_instance.ts.tt_jd(event_jds[idx])
+        phase_name = "New Moon" if event_codes[idx] == NEW_MOON_CODE else "Full Moon"
 
         return {
             "name": "Pre-Natal Syzygy",
             "type": phase_name,
             "datetime_utc": last_event_time.utc_iso(),
-            "longitude": lon.degrees
+            "longitude": float(event_lons[idx])
         }
 
     def calculate_all_points(self, natal_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -71,7 +149,7 @@ class MathematicalPointsService:
                 return {"error": f"Could not calculate base natal chart: {chart['error']}"}
 
             # Step 2: Use a temporary AstrologyEngine instance to access its internal methods.
-            birth_dt_utc = datetime.fromisoformat(chart['chart_info']['datetime_utc'])
+            birth_dt_utc = _parse_iso_utc(chart['chart_info']['datetime_utc'])
             engine = AstrologyEngine(
                 dt_utc=birth_dt_utc,
                 latitude=chart['chart_info']['latitude'],
@@ -93,23 +171,23 @@ class MathematicalPointsService:
             syzygy_data = self._calculate_pre_natal_syzygy(birth_dt_utc)
 
             # Step 4: Assemble and format the final report with interpretations.
-            points_report = []
-
+            # All computed points are formatted together in one bulk call.
+            to_format = []  # (display name, longitude, interpretation key, extra fields)
             if vertex_lon is not None:
-                formatted_vertex = engine._format_point("Vertex", vertex_lon)
-                formatted_vertex['interpretation'] = self.interpretations.get("Vertex", {})
-                points_report.append(formatted_vertex)
-
+                to_format.append(("Vertex", vertex_lon, "Vertex", {}))
             if eq_asc_lon is not None:
-                formatted_eq_asc = engine._format_point("Equatorial Ascendant", eq_asc_lon)
-                formatted_eq_asc['interpretation'] = self.interpretations.get("Equatorial Ascendant", {})
-                points_report.append(formatted_eq_asc)
-            
+                to_format.append(("Equatorial Ascendant", eq_asc_lon, "Equatorial Ascendant", {}))
             if "error" not in syzygy_data:
-                formatted_syzygy = engine._format_point(syzygy_data['name'], syzygy_data['longitude'])
-                formatted_syzygy['interpretation'] = self.interpretations.get("Pre-Natal Syzygy", {})
-                formatted_syzygy['type'] = syzygy_data['type'] # Add the phase type
-                points_report.append(formatted_syzygy)
+                to_format.append((syzygy_data['name'], syzygy_data['longitude'], "Pre-Natal Syzygy", {"type": syzygy_data['type']}))
+
+            formatted_points = AstrologyEngine._format_points_bulk(
+                [name for name, _, _, _ in to_format], [lon for _, lon, _, _ in to_format]
+            )
+            points_report = []
+            for formatted, (_, _, interp_key, extra) in zip(formatted_points, to_format):
+                formatted['interpretation'] = self.interpretations.get(interp_key, {})
+                formatted.update(extra)
+                points_report.append(formatted)
 
             # Part of Fortune is already included in a full chart calculation.
             pof_data = chart.get('part_of_fortune', {})
@@ -131,4 +209,4 @@ try:
     mathematical_points_service_instance = MathematicalPointsService()
 except RuntimeError as e:
     logger.critical(f"Could not instantiate MathematicalPointsService: {e}")
-    mathematical_points_service_instance = None
\ No newline at end of file
+    mathematical_points_service_instance = None
@@ -3,8 +3,9 @@
 Meditation Recommendation and Tracking Service
 """
 import logging
-from datetime import datetime, time, timedelta, timezone
-from typing import Dict, Any, List, Optional
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, Any, List, Optional, Tuple
+
 from sqlalchemy.orm import Session
 
 # --- REUSE other services and repositories ---
@@ -17,7 +18,7 @@ logger = logging.getLogger(__name__)
 
 class MeditationService:
     """A singleton service for all meditation-related business logic."""
-    _instance = None
+    __slots__ = ('meditation_types', 'reasons')
 
     def __init__(self):
         logger.info("Initializing MeditationService singleton...")
@@ -51,6 +52,8 @@ class MeditationService:
     def get_optimal_times(self, target_date: date, latitude: float, longitude: float, timezone_str: str) -> Dict[str, Any]:
         """Calculates optimal meditation windows based on astronomical events."""
         optimal_windows = []
+        reasons = self.reasons["astrological"]
+        meditation_types = self.meditation_types
         
         # 1. Get Moon Phase
         moon_phase_result = moon_service_instance.get_moon_details(datetime.combine(target_date, time(12, 0), tzinfo=timezone.utc))
@@ -61,40 +64,59 @@ class MeditationService:
                 optimal_windows.append({
                     "time_of_day": "Any",
                     "quality_score": 0.9,
-                    "reason": self.reasons["astrological"].get(reason_key),
-                    "recommended_type": self.meditation_types["mindfulness"]
+                    "reason": reasons.get(reason_key),
+                    "recommended_type": meditation_types["mindfulness"]
                 })
 
-        # 2. Get Rise and Set times to determine Dawn and Dusk
-        rise_set_result = moon_service_instance.get_moon_rise_set_times(target_date, latitude, longitude, timezone_str) # This needs to be expanded to get Sun rise/set
-        # Placeholder for sun rise/set logic...
-        # A full implementation would call a sun rise/set service.
-        # For now, we add generic morning/evening slots.
-
+        # 2. Dawn and Dusk windows.
+        # A full implementation would derive these from Sun rise/set times; until
+        # then generic morning/evening slots are used, so no rise/set ephemeris
+        # search is run for this request.
         optimal_windows.append({
             "time_of_day": "Morning (Dawn)",
             "quality_score": 0.85,
-            "reason": self.reasons["astrological"].get("dawn"),
-            "recommended_type": self.meditation_types["mindfulness"]
+            "reason": reasons.get("dawn"),
+            "recommended_type": meditation_types["mindfulness"]
         })
         optimal_windows.append({
             "time_of_day": "Evening (Dusk)",
             "quality_score": 0.8,
-            "reason": self.reasons["astrological"].get("dusk"),
-            "recommended_type": self.meditation_types["loving_kindness"]
+            "reason": reasons.get("dusk"),
+            "recommended_type": meditation_types["loving_kindness"]
         })
 
         return {"optimal_windows": sorted(optimal_windows, key=lambda x: x['quality_score'], reverse=True)}
 
+    @staticmethod
+    def _parse_cursor(cursor: Any) -> Optional[Tuple[datetime, int]]:
+        """Turns a `next_cursor` payload back into the repository's (start_time, id) key."""
+        if not cursor:
+            return None
+        if isinstance(cursor, dict):
+            start_time, session_id = cursor["start_time"], cursor["id"]
+        else:
+            start_time, session_id = cursor
+        if isinstance(start_time, str):
+            start_time = datetime.fromisoformat(start_time)
+        return start_time, int(session_id)
+
     def get_user_history(self, db: Session, user_id: int, **kwargs) -> Dict[str, Any]:
-        """Retrieves a user's paginated meditation history."""
-        sessions, total = meditation_repository.find_sessions_for_user(
+        """
+        Retrieves a user's paginated meditation history. Pass the previous
+        response's `next_cursor` back unchanged as `cursor_after` to get the
+        following page; a `(start_time, id)` tuple is accepted as well.
+        `offset` paging still works but cannot be combined with a cursor.
+        `total_sessions` is only reported on the first page (no cursor).
+        """
+        sessions, total, next_cursor = meditation_repository.find_sessions_for_user(
             db=db, user_id=user_id,
             start_date=kwargs.get("start_date"), end_date=kwargs.get("end_date"),
-            limit=kwargs.get("limit", 50), offset=kwargs.get("offset", 0)
+            limit=kwargs.get("limit", 50), offset=kwargs.get("offset", 0),
+            cursor_after=self._parse_cursor(kwargs.get("cursor_after"))
         )
         return {
             "total_sessions": total,
+            "next_cursor": {"start_time": next_cursor[0].isoformat(), "id": next_cursor[1]} if next_cursor else None,
             "sessions": [{
                 "id": s.id,
                 "start_time": s.start_time.isoformat(),
@@ -109,4 +131,4 @@ try:
     meditation_service_instance = MeditationService()
 except RuntimeError as e:
     logger.critical(f"Could not instantiate MeditationService: {e}")
-    meditation_service_instance = None
\ No newline at end of file
+    meditation_service_instance = None
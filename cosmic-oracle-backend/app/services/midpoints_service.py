@@ -5,36 +5,130 @@ Astrological Midpoints Calculation Service
 This service calculates midpoints between celestial bodies and analyzes the
 aspects made to these sensitive points, forming a "midpoint tree".
 """
+import functools
 import logging
-from typing import Dict, Any, List, Optional
-from itertools import combinations
+import math
+from typing import Dict, Any, List, Optional, Tuple, NamedTuple
+
+import numpy as np
 
 # --- REUSE other services ---
-from app.services.astrology_service import get_natal_chart_details
+from app.services.astrology_service import get_natal_chart_details, AstrologyEngine
 from app.services.aspect_service import aspect_service_instance
 from app.services.content_fetch_service import get_midpoint_content
 
 logger = logging.getLogger(__name__)
 
+
+class _PointsSoA(NamedTuple):
+    """Structure-of-arrays view of the chart points, built once per request."""
+    names: List[str]
+    lons: np.ndarray
+
+
+@functools.lru_cache(maxsize=64)
+def _pair_indices(n_points: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Upper-triangular (i, j) index arrays for every unique pair of `n_points`.
+
+    Charts almost always carry the same number of points, so the arrays are
+    built once per size and shared read-only between requests.
+    """
+    pair_i, pair_j = np.triu_indices(n_points, 1)
+    pair_i.setflags(write=False)
+    pair_j.setflags(write=False)
+    return pair_i, pair_j
+
+
 class MidpointsService:
     """A singleton service to manage midpoint calculations and interpretations."""
-    _instance = None
+    __slots__ = ('interpretations', '_aspect_names', '_aspect_types')
 
     def __init__(self):
         logger.info("Initializing MidpointsService singleton...")
         self.interpretations = get_midpoint_content().get("interpretations", {})
         if not self.interpretations:
             raise RuntimeError("Could not load necessary midpoint content file.")
+
+        aspect_definitions = aspect_service_instance.aspect_definitions if aspect_service_instance else []
+        self._aspect_names = [a["name"] for a in aspect_definitions]
+        self._aspect_types = [a["type"] for a in aspect_definitions]
         logger.info("MidpointsService initialized successfully.")
 
     def _calculate_midpoint_longitude(self, lon1: float, lon2: float) -> float:
-        """Calculates the shortest-arc midpoint between two longitudes."""
-        diff = abs(lon1 - lon2)
-        if diff > 180:
-            midpoint = (lon1 + lon2 + 360) / 2.0
-        else:
-            midpoint = (lon1 + lon2) / 2.0
-        return midpoint % 360
+        """
+        Calculates the shortest-arc midpoint between two longitudes.
+
+        Branch-free: the 360° correction for pairs more than 180° apart is applied
+        by multiplying with the comparison result, matching the vectorized form
+        used in `_calculate_all_midpoints`.
+        """
+        return ((lon1 + lon2 + 360.0 * float(math.fabs(lon1 - lon2) > 180.0)) * 0.5) % 360.0
+
+    @staticmethod
+    def _calculate_all_midpoints(lons: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calculates the shortest-arc direct and indirect midpoints for every
+        unique pair of longitudes in a single vectorized pass.
+
+        Returns:
+            (pair_i, pair_j, direct, indirect) as flat arrays indexed by pair,
+            in the same order as `itertools.combinations(range(len(lons)), 2)`.
+        """
+        pair_i, pair_j = _pair_indices(len(lons))
+        a, b = lons[pair_i], lons[pair_j]
+        direct = np.mod((a + b + 360.0 * (np.abs(a - b) > 180.0)) / 2.0, 360.0)
+        indirect = np.mod(direct + 180.0, 360.0)
+        return pair_i, pair_j, direct, indirect
+
+    @staticmethod
+    def _build_points_soa(chart: Dict[str, Any]) -> _PointsSoA:
+        """Flattens the chart's planets and angles into names + a longitude array."""
+        points = list(chart.get('points', {}).values()) + list(chart.get('angles', {}).values())
+        points = [p for p in points if p.get('longitude') is not None]
+        return _PointsSoA(
+            names=[p['name'] for p in points],
+            lons=np.array([p['longitude'] for p in points], dtype=np.float64),
+        )
+
+    @staticmethod
+    def _collect_aspect_hits(
+        direct_lons: np.ndarray, indirect_lons: np.ndarray, points: _PointsSoA, max_orb: float
+    ) -> Tuple[Dict[int, List[Tuple[int, int, float]]], Dict[int, List[Tuple[int, int, float]]]]:
+        """
+        Checks all direct and indirect midpoints against the natal points in a
+        single batched aspect search.
+
+        Returns:
+            Two mappings (direct, indirect) of pair index ->
+            [(target_idx, aspect_idx, orb), ...], containing only pairs that were hit.
+        """
+        n_pairs = len(direct_lons)
+        src_idx, tgt_idx, asp_idx, orbs = aspect_service_instance.find_aspects_batch(
+            np.concatenate([direct_lons, indirect_lons]), points.lons, max_orb
+        )
+        direct_hits: Dict[int, List[Tuple[int, int, float]]] = {}
+        indirect_hits: Dict[int, List[Tuple[int, int, float]]] = {}
+        for s, t, a, orb in zip(src_idx.tolist(), tgt_idx.tolist(), asp_idx.tolist(), orbs.tolist()):
+            if s < n_pairs:
+                direct_hits.setdefault(s, []).append((t, a, orb))
+            else:
+                indirect_hits.setdefault(s - n_pairs, []).append((t, a, orb))
+        return direct_hits, indirect_hits
+
+    def _format_aspect_hits(
+        self, midpoint_name: str, hits: List[Tuple[int, int, float]], points: _PointsSoA
+    ) -> List[Dict[str, Any]]:
+        """Materializes kernel hits for one midpoint as aspect dicts sorted by orb."""
+        aspects = [{
+            "point1_name": midpoint_name,
+            "point2_name": points.names[t],
+            "aspect_name": self._aspect_names[a],
+            "aspect_type": self._aspect_types[a],
+            "orb_degrees": round(orb, 3),
+            "is_applying": None,  # Midpoints have no speed of their own.
+        } for t, a, orb in hits]
+        return sorted(aspects, key=lambda x: x['orb_degrees'])
 
     def generate_midpoint_tree(self, natal_data: Dict[str, Any], aspect_orb: float = 1.5) -> Dict[str, Any]:
         """
@@ -47,39 +141,43 @@ class MidpointsService:
             if 'error' in chart:
                 return {"error": f"Could not calculate base natal chart: {chart['error']}"}
 
-            # Step 2: Prepare a list of points to use for midpoints.
-            points_for_midpoints = list(chart.get('points', {}).values()) + list(chart.get('angles', {}).values())
-            
-            midpoint_tree = []
+            # Step 2: Flatten the points used for midpoints into arrays once.
+            points = self._build_points_soa(chart)
+
+            # Step 3: Calculate the direct and indirect midpoints of all unique pairs at once.
+            pair_i, pair_j, direct_lons, indirect_lons = self._calculate_all_midpoints(points.lons)
 
-            # Step 3: Iterate through all unique pairs of points.
-            for p1, p2 in combinations(points_for_midpoints, 2):
-                if p1.get('longitude') is None or p2.get('longitude') is None:
-                    continue
-
-                # Step 4: Calculate the direct and indirect midpoints.
-                direct_lon = self._calculate_midpoint_longitude(p1['longitude'], p2['longitude'])
-                indirect_lon = (direct_lon + 180) % 360
-
-                # Create conceptual "points" for the midpoints to feed into the aspect service.
-                direct_midpoint_point = {"name": f"{p1['name']}/{p2['name']}", "longitude": direct_lon}
-                indirect_midpoint_point = {"name": f"opp-{p1['name']}/{p2['name']}", "longitude": indirect_lon}
-                
-                # Step 5: Find aspects from all natal points to these two midpoint positions.
-                # We create a temporary list of targets for the aspect service.
-                aspects_to_direct = aspect_service_instance.find_all_aspects([direct_midpoint_point] + points_for_midpoints)
-                aspects_to_indirect = aspect_service_instance.find_all_aspects([indirect_midpoint_point] + points_for_midpoints)
-                
-                # Filter for aspects that are within the specified orb and involve the midpoint.
-                direct_aspect_hits = [asp for asp in aspects_to_direct if asp['orb_degrees'] <= aspect_orb and asp['point1_name'] == direct_midpoint_point['name']]
-                indirect_aspect_hits = [asp for asp in aspects_to_indirect if asp['orb_degrees'] <= aspect_orb and asp['point1_name'] == indirect_midpoint_point['name']]
-
-                if direct_aspect_hits or indirect_aspect_hits:
-                    midpoint_tree.append({
-                        "pair": [p1['name'], p2['name']],
-                        "direct_midpoint": {"longitude": round(direct_lon, 4), "aspects": direct_aspect_hits},
-                        "indirect_midpoint": {"longitude": round(indirect_lon, 4), "aspects": indirect_aspect_hits},
-                    })
+            # Step 4: Find aspects from all natal points to every midpoint in one batched search.
+            direct_hits, indirect_hits = self._collect_aspect_hits(direct_lons, indirect_lons, points, aspect_orb)
+
+            # Step 5: Materialize entries only for pairs whose midpoints are aspected,
+            # formatting all of their midpoint positions in one bulk call.
+            hit_pairs = sorted(direct_hits.keys() | indirect_hits.keys())
+            pair_names = [(points.names[pair_i[k]], points.names[pair_j[k]]) for k in hit_pairs]
+            formatted = AstrologyEngine._format_points_bulk(
+                [f"{a}/{b}" for a, b in pair_names] + [f"opp-{a}/{b}" for a, b in pair_names],
+                np.concatenate([direct_lons[hit_pairs], indirect_lons[hit_pairs]]),
+            )
+            n_hits = len(hit_pairs)
+
+            midpoint_tree = []
+            for n, (k, (name1, name2)) in enumerate(zip(hit_pairs, pair_names)):
+                direct_fmt, indirect_fmt = formatted[n], formatted[n_hits + n]
+                midpoint_tree.append({
+                    "pair": [name1, name2],
+                    "direct_midpoint": {
+                        "longitude": round(float(direct_lons[k]), 4),
+                        "sign_name": direct_fmt['sign_name'],
+                        "display_dms": direct_fmt['display_dms'],
+                        "aspects": self._format_aspect_hits(direct_fmt['name'], direct_hits.get(k, []), points),
+                    },
+                    "indirect_midpoint": {
+                        "longitude": round(float(indirect_lons[k]), 4),
+                        "sign_name": indirect_fmt['sign_name'],
+                        "display_dms": indirect_fmt['display_dms'],
+                        "aspects": self._format_aspect_hits(indirect_fmt['name'], indirect_hits.get(k, []), points),
+                    },
+                })
 
             return {"midpoint_tree": midpoint_tree, "natal_chart_used": chart['chart_info']}
 
@@ -92,4 +190,4 @@ try:
     midpoints_service_instance = MidpointsService()
 except RuntimeError as e:
     logger.critical(f"Could not instantiate MidpointsService: {e}")
-    midpoints_service_instance = None
\ No newline at end of file
+    midpoints_service_instance = None
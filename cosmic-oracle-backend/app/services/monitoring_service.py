@@ -5,6 +5,7 @@ Subscription Monitoring and Analytics Service
 import logging
 from typing import Dict, Any, List
 from datetime import datetime, timedelta, timezone
+import numpy as np
 from sqlalchemy.orm import Session
 
 # Import the repository to handle all DB interactions
@@ -14,7 +15,7 @@ logger = logging.getLogger(__name__)
 
 class MonitoringService:
     """A singleton service for all monitoring-related business logic."""
-    _instance = None
+    __slots__ = ('alert_thresholds',)
 
     def __init__(self):
         logger.info("Initializing MonitoringService singleton...")
@@ -30,14 +31,16 @@ class MonitoringService:
         """Generates a full suite of metrics for the monitoring dashboard."""
         logger.info(f"Generating dashboard metrics for the last {days} days.")
         try:
-            now = datetime.now(timezone.utc)
+            # The window ends on the minute so repeat polls share the cached rollup.
+            now = datetime.now(timezone.utc).replace(second=0, microsecond=0)
             start_date = now - timedelta(days=days)
             
-            # 1. Fetch raw data from the repository
-            current_counts = monitoring_repository.get_current_subscription_counts(db)
-            changes = monitoring_repository.get_subscription_changes(db, start_date, now)
-            payment_stats = monitoring_repository.get_payment_failure_stats(db, start_date, now)
-            avg_usage = monitoring_repository.get_average_feature_usage(db, start_date, now)
+            # 1. Fetch raw data from the repository (a single round trip)
+            rollup = monitoring_repository.get_dashboard_rollup(db, start_date, now)
+            current_counts = rollup["current_counts"]
+            changes = rollup["changes"]
+            payment_stats = rollup["payment_stats"]
+            avg_usage = rollup["avg_usage"]
 
             # 2. Perform business logic calculations
             active_subs = current_counts.get("active", 0)
@@ -77,30 +80,37 @@ class MonitoringService:
         logger.info("Checking for system health alerts.")
         alerts = []
         now = datetime.now(timezone.utc)
+        # The query window ends on the minute so repeat checks share the cached snapshot.
+        window_end = now.replace(second=0, microsecond=0)
         
+        # All alert inputs come from one query.
+        snapshot = monitoring_repository.get_alert_snapshot(db, window_end)
+
         # --- High Payment Failure Rate Alert ---
-        payment_stats_24h = monitoring_repository.get_payment_failure_stats(db, now - timedelta(days=1), now)
-        active_subs = monitoring_repository.get_current_subscription_counts(db).get("active", 0)
+        active_subs = snapshot.active_subscriptions
         if active_subs > 0:
-            failure_rate = payment_stats_24h['total_failures'] / active_subs
+            failure_rate = snapshot.payment_failures_24h / active_subs
             if failure_rate > self.alert_thresholds['payment_failure_rate']:
                 alerts.append({"level": "high", "type": "payment_failures", "message": f"High payment failure rate in last 24h: {failure_rate:.1%}"})
 
         # --- High Churn Rate Alert ---
-        churn_7d = monitoring_repository.get_subscription_changes(db, now - timedelta(days=7), now)['cancellations']
         if active_subs > 0:
-            churn_rate = churn_7d / active_subs
+            churn_rate = snapshot.cancellations_7d / active_subs
             if churn_rate > self.alert_thresholds['weekly_churn_rate']:
                 alerts.append({"level": "medium", "type": "churn_rate", "message": f"Elevated weekly churn rate: {churn_rate:.1%}"})
 
         # --- Stale Task Alert ---
-        latest_tasks = monitoring_repository.get_latest_task_runs(db)
-        for task in latest_tasks:
-            time_since_run = now - task.run_at
-            if time_since_run.total_seconds() > self.alert_thresholds['task_stale_hours'] * 3600:
-                alerts.append({"level": "high", "type": "task_health", "message": f"Task '{task.task_name}' has not run in {time_since_run.total_seconds() / 3600:.1f} hours."})
-            if task.status == 'FAILURE':
-                alerts.append({"level": "high", "type": "task_health", "message": f"Task '{task.task_name}' failed on its last run."})
+        task_names, run_ats, statuses = snapshot.task_names, snapshot.task_run_ats, snapshot.task_statuses
+        now64 = np.datetime64(now.replace(tzinfo=None), 's')
+        ages_hours = (now64 - run_ats) / np.timedelta64(1, 'h')
+        stale_mask = ages_hours > self.alert_thresholds['task_stale_hours']
+        failed_mask = statuses == 'FAILURE'
+        # Only tasks with something to report are visited; per-task message order is preserved.
+        for i in np.flatnonzero(stale_mask | failed_mask):
+            if stale_mask[i]:
+                alerts.append({"level": "high", "type": "task_health", "message": f"Task '{task_names[i]}' has not run in {ages_hours[i]:.1f} hours."})
+            if failed_mask[i]:
+                alerts.append({"level": "high", "type": "task_health", "message": f"Task '{task_names[i]}' failed on its last run."})
 
         return {"alerts": alerts, "total_alerts": len(alerts), "checked_at_utc": now.isoformat()}
 
@@ -5,69 +5,268 @@ Moon Phase and Lunar Astrology Service
 This service provides functions to calculate moon phases, retrieve moon
 interpretations, and potentially offer lunar insights.
 """
+import copy
 import logging
 import math
-from datetime import datetime, date, timedelta
+import os
+import sqlite3
+import threading
+from datetime import datetime, date, time, timedelta, timezone
+from functools import lru_cache
 from typing import Dict, Any, List, Optional, Tuple # Ensure all typing hints are imported
 
+import numpy as np
+from skyfield.almanac import find_discrete, sunrise_sunset
+from skyfield.api import wgs84
+from skyfield.framelib import ecliptic_frame
+
 # Import the ContentFetchService CLASS, not standalone functions
 from app.services.content_fetch_service import ContentFetchService 
 
 # For astronomical calculations, using SkyfieldService
 from app.services.skyfield_service import SkyfieldService
 from app.services.lunar_mansion_service import lunar_mansion_service_instance
+from app.services.numeric_kernels import mean_node_batch
 
 logger = logging.getLogger(__name__)
 
-if not logger.handlers:
-    handler = logging.StreamHandler()
-    formatter = logging.Formatter('%(asctime)s - [%(levelname)s] - %(name)s - %(message)s')
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
-    logger.setLevel(logging.INFO)
+# Requests cluster around the same minutes, so results are computed for the
+# start of each time bucket and cached; the Moon moves ~0.5' per minute.
+MOON_CACHE_GRANULARITY_SECONDS = 60
+MOON_CACHE_MAXSIZE = 4096
+SUN_EVENTS_CACHE_MAXSIZE = 4096
+# Sunrise/sunset searches start at 00:00 UTC of the target day. 30 hours covers
+# that day's sunrise, sunset and next sunrise for most locations; callers widen
+# to two days when the short window misses an event.
+SUN_EVENTS_WINDOW_HOURS = 30
+SUN_EVENTS_WIDE_WINDOW_HOURS = 48
+
+DEFAULT_INTERPRETATION = "No specific interpretation available."
+
+# TT - UTC in days (37 leap seconds + 32.184 s), current since 2017.
+TT_MINUS_UTC_DAYS = 69.184 / 86400.0
+
+# Optional hourly Moon/Sun position table written by app/tasks/build_moon_table.py.
+MOON_TABLE_PATH = os.getenv('MOON_TABLE_PATH', 'instance/moon_cache.sqlite')
+
+
+# Approximate phase buckets by days into the synodic cycle: the phase at index i
+# covers [_PHASE_BOUNDS[i-1], _PHASE_BOUNDS[i]), and the cycle wraps to New Moon.
+_PHASE_BOUNDS = np.array([1.5, 6.5, 9.5, 13.5, 16.5, 21.5, 25.5, 28.0])
+_PHASE_NAMES = (
+    "New Moon", "Waxing Crescent", "First Quarter", "Waxing Gibbous", "Full Moon",
+    "Waning Gibbous", "Last Quarter", "Waning Crescent", "New Moon",
+)
+_PHASE_ILLUM = np.array([0.0, 25.0, 50.0, 75.0, 100.0, 75.0, 50.0, 25.0, 0.0])
+
+# Equal-width split of the synodic month into the eight phases, each centred on
+# its nominal day: the phase index is plain arithmetic on days into the cycle.
+SYNODIC_MONTH_DAYS = 29.53058867
+_PHASE_WIDTH_DAYS = SYNODIC_MONTH_DAYS / 8
+_PHASE_TABLE = (
+    ("New Moon", 0.0), ("Waxing Crescent", 25.0), ("First Quarter", 50.0), ("Waxing Gibbous", 75.0),
+    ("Full Moon", 100.0), ("Waning Gibbous", 75.0), ("Last Quarter", 50.0), ("Waning Crescent", 25.0),
+)
+
+
+def _jd_from_date(year: int, month: int, day: int) -> float:
+    """
+    Julian Day at 00:00 UT of a proleptic Gregorian date.
+
+    Counts days from 0000-03-01 with integer arithmetic over the 400-year
+    (146097-day) leap cycle, so no `date` object or ordinal walk is needed.
+    Equal to `date(year, month, day).toordinal() + 1721424.5`.
+    """
+    y = year - (month <= 2)
+    era = y // 400
+    yoe = y - era * 400                                                # year of era [0, 399]
+    doy = (153 * (month + (9 if month <= 2 else -3)) + 2) // 5 + day - 1  # day of March-based year
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy                      # day of era [0, 146096]
+    return era * 146097 + doe + 1721119.5
+
+
+def _tt_from_utc_fields(datetime_utc: datetime) -> float:
+    """
+    TT Julian date from a datetime's UTC fields, with TT - UTC taken as its
+    value since 2017 (37 leap seconds + 32.184 s). Good to about a minute for
+    modern dates, which moves the mean node by under 0.0001 degrees.
+    """
+    day_fraction = (datetime_utc.hour * 3600 + datetime_utc.minute * 60 + datetime_utc.second) / 86400.0
+    return _jd_from_date(datetime_utc.year, datetime_utc.month, datetime_utc.day) + day_fraction + TT_MINUS_UTC_DAYS
+
+
+def _time_bucket(datetime_utc: datetime) -> int:
+    """Index of the cache bucket containing `datetime_utc` (naive values are taken as UTC)."""
+    if datetime_utc.tzinfo is None:
+        datetime_utc = datetime_utc.replace(tzinfo=timezone.utc)
+    return int(datetime_utc.timestamp() // MOON_CACHE_GRANULARITY_SECONDS)
+
+
+def _bucket_start(bucket: int) -> datetime:
+    """UTC datetime at the start of a cache bucket."""
+    return datetime.fromtimestamp(bucket * MOON_CACHE_GRANULARITY_SECONDS, tz=timezone.utc)
+
+
+# Payload keys holding the calculation time; cached results carry the bucket
+# start there and are re-stamped with the requested time on the way out.
+_TIMESTAMP_KEYS = ("date_utc", "calculation_datetime_utc")
+
+
+class _UncacheableResult(Exception):
+    """Raised from a cached calculation so that its fallback or error payload is not cached."""
+
+
+def _cacheable(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Passes `result` through, raising if it or any of its sections is an error payload."""
+    if "error" in result or any(isinstance(v, dict) and "error" in v for v in result.values()):
+        raise _UncacheableResult(result.get("error", "error in a result section"))
+    return result
+
+
+def _restamp(result: Dict[str, Any], datetime_utc: datetime) -> Dict[str, Any]:
+    """Replaces the bucket-start timestamps in a copied cached result with the requested time."""
+    stamp = datetime_utc.isoformat()
+    for section in (result, *(v for v in result.values() if isinstance(v, dict))):
+        for key in _TIMESTAMP_KEYS:
+            if key in section:
+                section[key] = stamp
+    return result
+
 
 class MoonService:
     _instance = None # Optional: For singleton pattern if desired
+    # Guards first construction: concurrent cold-start requests must not each
+    # create an instance or load content and ephemeris data more than once.
+    _lock = threading.Lock()
 
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
-            cls._instance = super(MoonService, cls).__new__(cls)
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(MoonService, cls).__new__(cls)
         return cls._instance
 
     def __init__(self, content_fetch_service_instance: ContentFetchService = None, skyfield_service_instance: SkyfieldService = None):
-        if hasattr(self, '_initialized') and self._initialized:
+        if getattr(self, '_initialized', False):
             return
 
-        logger.info("Initializing MoonService...")
+        with self._lock:
+            # Another thread may have finished initializing while we waited.
+            if getattr(self, '_initialized', False):
+                return
 
-        # IMPORTANT: Receive service instances via constructor
-        if content_fetch_service_instance is None:
-            raise RuntimeError("ContentFetchService instance must be provided to MoonService.")
-        self.content_fetch_service = content_fetch_service_instance
+            logger.info("Initializing MoonService...")
+
+            # IMPORTANT: Receive service instances via constructor
+            if content_fetch_service_instance is None:
+                raise RuntimeError("ContentFetchService instance must be provided to MoonService.")
+            self.content_fetch_service = content_fetch_service_instance
         
-        # Initialize SkyfieldService for astronomical calculations
-        if skyfield_service_instance is None:
-            try:
-                self.skyfield_service = SkyfieldService()
-            except Exception as e:
-                logger.error(f"Failed to initialize SkyfieldService: {e}")
-                self.skyfield_service = None
-        else:
-            self.skyfield_service = skyfield_service_instance
+            # Initialize SkyfieldService for astronomical calculations
+            if skyfield_service_instance is None:
+                try:
+                    self.skyfield_service = SkyfieldService()
+                except Exception as e:
+                    logger.error("Failed to initialize SkyfieldService: %s", e)
+                    self.skyfield_service = None
+            else:
+                self.skyfield_service = skyfield_service_instance
 
-        # Load moon content and zodiac data via the injected content_fetch_service
-        self.moon_content = self.content_fetch_service.get_moon_content() # Now a method call
-        self.zodiac_data = self.content_fetch_service.get_zodiac_signs_data() # Now a method call
+            # Load moon content and zodiac data via the injected content_fetch_service
+            self.moon_content = self.content_fetch_service.get_moon_content() # Now a method call
+            self.zodiac_data = self.content_fetch_service.get_zodiac_signs_data() # Now a method call
 
-        if not self.moon_content or not self.zodiac_data:
-            raise RuntimeError("Could not load necessary moon or zodiac content files from content_fetch_service.")
+            if not self.moon_content or not self.zodiac_data:
+                raise RuntimeError("Could not load necessary moon or zodiac content files from content_fetch_service.")
+            # Sign lookups by index (longitude // 30) are on every calculation path.
+            self._zodiac_keys = tuple(self.zodiac_data.keys())
+            self._zodiac_info = tuple(self.zodiac_data.values())
+            # Interpretation sub-dicts, resolved once instead of per lookup.
+            self._phase_content = self.moon_content.get('phases') or {}
+            self._sign_content = self.moon_content.get('moon_in_signs') or {}
+            self._moon_table = self._open_moon_table(MOON_TABLE_PATH)
         
-        self._initialized = True
-        logger.info("MoonService initialized successfully.")
+            self._initialized = True
+            logger.info("MoonService initialized successfully.")
+
+    @property
+    def eph(self):
+        """The Skyfield ephemeris, shared with services that reuse MoonService's Skyfield setup."""
+        return self.skyfield_service.eph if self.skyfield_service else None
+
+    @property
+    def ts(self):
+        """The Skyfield timescale, shared with services that reuse MoonService's Skyfield setup."""
+        return self.skyfield_service.ts if self.skyfield_service else None
+
+    def _shared_time(self, datetime_utc: datetime) -> Optional['Time']:
+        """
+        Builds one Skyfield Time for `datetime_utc` to share across sub-calculations.
+
+        Skyfield caches derived quantities such as the precession/nutation matrix
+        on the Time object as they are first used, so every sub-calculation that
+        reuses `t` shares them.
+        """
+        if not self.skyfield_service:
+            return None
+        if datetime_utc.tzinfo is None:
+            datetime_utc = datetime_utc.replace(tzinfo=timezone.utc)
+        return self.skyfield_service.ts.from_datetime(datetime_utc)
+
+    def cache_clear(self) -> None:
+        """Admin hook: drops every cached moon calculation."""
+        for cached in (self._cached_phase, self._cached_zodiac, self._cached_nodes, self._cached_comprehensive,
+                       self.get_sunrise_sunset):
+            cached.cache_clear()
+
+    @lru_cache(maxsize=SUN_EVENTS_CACHE_MAXSIZE)
+    def get_sunrise_sunset(
+        self, target_date: date, latitude: float, longitude: float,
+        window_hours: int = SUN_EVENTS_WINDOW_HOURS
+    ) -> Tuple[Tuple[datetime, bool], ...]:
+        """
+        Sunrises and sunsets in the `window_hours` after 00:00 UTC on
+        `target_date`, as chronological (UTC datetime, is_sunrise) pairs.
+
+        One search per (day, location) is shared by every service that needs the
+        Sun's horizon crossings, so pass already-quantized coordinates to let
+        nearby callers share entries. The result is immutable and not copied.
+        """
+        sf = self.skyfield_service
+        start = datetime.combine(target_date, time.min, tzinfo=timezone.utc)
+        start_t = sf.ts.from_datetime(start)
+        end_t = sf.ts.from_datetime(start + timedelta(hours=window_hours))
+        t, y = find_discrete(start_t, end_t, sunrise_sunset(sf.eph, wgs84.latlon(latitude, longitude)))
+        return tuple(zip(t.utc_datetime(), (bool(v) for v in y)))
+
+    def _from_minute_cache(self, cached, compute, datetime_utc: datetime) -> Dict[str, Any]:
+        """
+        Serves `datetime_utc` from a per-minute cache, as a copy stamped with the
+        requested time. Only full-precision results are cached: when the cached
+        calculation fails, `compute` builds the fallback or error payload for
+        this call alone.
+        """
+        try:
+            result = copy.deepcopy(cached(_time_bucket(datetime_utc)))
+        except Exception:
+            return compute(datetime_utc)
+        return _restamp(result, datetime_utc)
 
     def get_moon_phase(self, datetime_utc: datetime) -> Dict[str, Any]:
+        """
+        Calculates the moon phase for the minute containing `datetime_utc`.
+        Results are cached per minute; callers receive their own copy.
+        """
+        return self._from_minute_cache(self._cached_phase, self._compute_moon_phase, datetime_utc)
+
+    @lru_cache(maxsize=MOON_CACHE_MAXSIZE)
+    def _cached_phase(self, bucket: int) -> Dict[str, Any]:
+        return _cacheable(self._compute_moon_phase(_bucket_start(bucket), fallback=False))
+
+    def _compute_moon_phase(self, datetime_utc: datetime, fallback: bool = True) -> Dict[str, Any]:
         """
         Calculates the moon phase for a given UTC datetime using Skyfield astronomical calculations.
+        With `fallback=False`, failures raise instead of returning the approximate phase.
         """
         if self.skyfield_service:
             try:
@@ -77,58 +276,88 @@ class MoonService:
                 # Add interpretation from content
                 phase_name = moon_phase_data.get('moon_phase_name', 'Unknown Phase')
                 phase_key = phase_name.lower().replace(' ', '_')
-                interpretation = self.moon_content.get('phases', {}).get(phase_key, "No specific interpretation available.")
+                interpretation = self._phase_content.get(phase_key, DEFAULT_INTERPRETATION)
                 moon_phase_data['interpretation'] = interpretation
                 
                 return moon_phase_data
                 
             except Exception as e:
-                logger.error(f"Error calculating moon phase with Skyfield: {e}")
+                if not fallback:
+                    raise
+                logger.error("Error calculating moon phase with Skyfield: %s", e)
                 # Fall back to approximate calculation
                 return self._get_approximate_moon_phase(datetime_utc)
         else:
+            if not fallback:
+                raise _UncacheableResult("SkyfieldService not available.")
             logger.warning("SkyfieldService not available, using approximate calculation.")
             return self._get_approximate_moon_phase(datetime_utc)
 
-    def _get_approximate_moon_phase(self, datetime_utc: datetime) -> Dict[str, Any]:
+    def get_moon_phase_batch(self, datetimes: List[datetime]) -> List[Dict[str, Any]]:
+        """
+        Calculates the moon phase for many UTC datetimes at once.
+
+        Builds a single Skyfield Time array and observes the Sun and Moon once for
+        all timestamps, instead of one ephemeris evaluation per datetime. Each
+        entry has the same shape as `get_moon_phase`'s result.
+        """
+        if not datetimes:
+            return []
+        if not self.skyfield_service or not self.skyfield_service.eph:
+            return [self.get_moon_phase(dt) for dt in datetimes]
+
+        try:
+            sf = self.skyfield_service
+            t = sf.ts.utc(
+                np.array([dt.year for dt in datetimes]), np.array([dt.month for dt in datetimes]),
+                np.array([dt.day for dt in datetimes]), np.array([dt.hour for dt in datetimes]),
+                np.array([dt.minute for dt in datetimes]), np.array([dt.second for dt in datetimes])
+            )
+            earth_at_t = sf.eph['earth'].at(t)
+            _, sun_lon, _ = earth_at_t.observe(sf.eph['sun']).apparent().ecliptic_latlon()
+            _, moon_lon, _ = earth_at_t.observe(sf.eph['moon']).apparent().ecliptic_latlon()
+            phase_angles = (moon_lon.degrees - sun_lon.degrees) % 360.0
+        except Exception as e:
+            logger.error("Error calculating batched moon phases with Skyfield: %s", e)
+            return [self.get_moon_phase(dt) for dt in datetimes]
+
+        return [self._format_phase(dt, phase_angle) for dt, phase_angle in zip(datetimes, phase_angles.tolist())]
+
+    def _format_phase(self, datetime_utc: datetime, phase_angle: float) -> Dict[str, Any]:
+        """Builds a `get_moon_phase`-shaped result from an already computed phase angle."""
+        phase_name, illumination_percent = self.skyfield_service._determine_phase_details(phase_angle)
+        return {
+            "date_utc": datetime_utc.isoformat(),
+            "moon_phase_angle_degrees": round(phase_angle, 2),
+            "moon_phase_name": phase_name,
+            "illumination_percent": round(illumination_percent, 2),
+            "description": f"The Moon is in a {phase_name} phase with {round(illumination_percent, 1)}% illumination.",
+            "interpretation": self._phase_content.get(
+                phase_name.lower().replace(' ', '_'), DEFAULT_INTERPRETATION
+            ),
+        }
+
+    def _get_approximate_moon_phase(self, datetime_utc: datetime, precise: bool = False) -> Dict[str, Any]:
         """
         Fallback approximate moon phase calculation when Skyfield is not available.
+
+        By default the cycle is split into eight equal phases; pass `precise=True`
+        for the hand-tuned `_PHASE_BOUNDS` boundaries.
         """
         # Simplified approximation based on lunar cycle
-        jd = datetime_utc.toordinal() + 1721424.5 - 2451545.0
-        days_into_cycle = jd % 29.53058867
-        
-        if 28 <= days_into_cycle or days_into_cycle < 1.5:
-            phase_name = "New Moon"
-            illumination = 0.0
-        elif 1.5 <= days_into_cycle < 6.5:
-            phase_name = "Waxing Crescent"
-            illumination = 25.0
-        elif 6.5 <= days_into_cycle < 9.5:
-            phase_name = "First Quarter"
-            illumination = 50.0
-        elif 9.5 <= days_into_cycle < 13.5:
-            phase_name = "Waxing Gibbous"
-            illumination = 75.0
-        elif 13.5 <= days_into_cycle < 16.5:
-            phase_name = "Full Moon"
-            illumination = 100.0
-        elif 16.5 <= days_into_cycle < 21.5:
-            phase_name = "Waning Gibbous"
-            illumination = 75.0
-        elif 21.5 <= days_into_cycle < 25.5:
-            phase_name = "Last Quarter"
-            illumination = 50.0
-        elif 25.5 <= days_into_cycle < 28:
-            phase_name = "Waning Crescent"
-            illumination = 25.0
+        jd = _jd_from_date(datetime_utc.year, datetime_utc.month, datetime_utc.day) - 2451545.0
+        days_into_cycle = jd % SYNODIC_MONTH_DAYS
+
+        if precise:
+            phase_idx = int(np.searchsorted(_PHASE_BOUNDS, days_into_cycle, side='right'))
+            phase_name = _PHASE_NAMES[phase_idx]
+            illumination = float(_PHASE_ILLUM[phase_idx])
         else:
-            phase_name = "Unknown"
-            illumination = 0.0
+            phase_name, illumination = _PHASE_TABLE[int((days_into_cycle + _PHASE_WIDTH_DAYS / 2) // _PHASE_WIDTH_DAYS) % 8]
 
         # Fetch interpretation from loaded content
         phase_key = phase_name.lower().replace(' ', '_')
-        interpretation = self.moon_content.get('phases', {}).get(phase_key, "No specific interpretation available.")
+        interpretation = self._phase_content.get(phase_key, DEFAULT_INTERPRETATION)
         
         return {
             "date_utc": datetime_utc.isoformat(),
@@ -140,43 +369,118 @@ class MoonService:
 
 
     def get_moon_in_zodiac(self, datetime_utc: datetime) -> Dict[str, Any]:
+        """
+        Determines the Moon's zodiac sign for the minute containing `datetime_utc`.
+        Results are cached per minute; callers receive their own copy.
+        """
+        return self._from_minute_cache(self._cached_zodiac, self._compute_moon_in_zodiac, datetime_utc)
+
+    @lru_cache(maxsize=MOON_CACHE_MAXSIZE)
+    def _cached_zodiac(self, bucket: int) -> Dict[str, Any]:
+        return _cacheable(self._compute_moon_in_zodiac(_bucket_start(bucket), fallback=False))
+
+    def _moon_longitude_packet(self, t: 'Time', with_sun: bool = False) -> Dict[str, Any]:
+        """
+        The Moon's apparent ecliptic longitude and daily motion at `t`, from a
+        single observe() call. Shared by the zodiac and void-of-course results.
+        With `with_sun`, also carries the Sun's apparent longitude as "sun_lon",
+        matching the rows of the precomputed table.
+        """
+        eph = self.skyfield_service.eph
+        earth_at_t = eph['earth'].at(t)
+        apparent = earth_at_t.observe(eph['moon']).apparent()
+        _, lon, _, _, lon_rate, _ = apparent.frame_latlon_and_rates(ecliptic_frame)
+        speed = float(lon_rate.degrees.per_day)
+        packet = {"lon": float(lon.degrees), "speed": speed, "retro": speed < 0}
+        if with_sun:
+            _, sun_lon, _ = earth_at_t.observe(eph['sun']).apparent().frame_latlon(ecliptic_frame)
+            packet["sun_lon"] = float(sun_lon.degrees)
+        return packet
+
+    @staticmethod
+    def _open_moon_table(path: str) -> Optional[sqlite3.Connection]:
+        """Opens the precomputed position table read-only, or returns None if it hasn't been built."""
+        if not os.path.exists(path):
+            logger.info("No precomputed moon table at %s; positions will come from Skyfield.", path)
+            return None
+        try:
+            conn = sqlite3.connect(f"file:{path}?mode=ro&immutable=1", uri=True, check_same_thread=False)
+            conn.execute("SELECT 1 FROM moon_positions LIMIT 1")
+        except sqlite3.Error as e:
+            logger.error("Could not open precomputed moon table %s: %s", path, e)
+            return None
+        logger.info("Using precomputed moon table at %s.", path)
+        return conn
+
+    def _table_positions(self, datetime_utc: datetime) -> Optional[Dict[str, Any]]:
+        """
+        Moon and Sun positions at `datetime_utc`, interpolated between the two
+        surrounding hourly rows of the precomputed table. Returns None outside the
+        table's range. Carries the `_moon_longitude_packet` keys plus "sun_lon".
+        """
+        if self._moon_table is None:
+            return None
+        if datetime_utc.tzinfo is None:
+            datetime_utc = datetime_utc.replace(tzinfo=timezone.utc)
+        hours = datetime_utc.timestamp() / 3600.0
+        hour = math.floor(hours)
+        rows = self._moon_table.execute(
+            "SELECT moon_lon, moon_speed, sun_lon FROM moon_positions"
+            " WHERE ts_hour BETWEEN ? AND ? ORDER BY ts_hour",
+            (hour, hour + 1),
+        ).fetchall()
+        if len(rows) != 2:
+            return None
+
+        (moon0, speed0, sun0), (moon1, speed1, sun1) = rows
+        frac = hours - hour
+        # Longitudes are interpolated along the short arc so the 360->0 wrap is handled.
+        moon_lon = (moon0 + frac * ((moon1 - moon0 + 180.0) % 360.0 - 180.0)) % 360.0
+        sun_lon = (sun0 + frac * ((sun1 - sun0 + 180.0) % 360.0 - 180.0)) % 360.0
+        speed = speed0 + frac * (speed1 - speed0)
+        return {"lon": moon_lon, "speed": speed, "retro": speed < 0, "sun_lon": sun_lon}
+
+    def _compute_moon_in_zodiac(
+        self, datetime_utc: datetime, packet: Optional[Dict[str, Any]] = None, fallback: bool = True
+    ) -> Dict[str, Any]:
         """
         Determines the zodiac sign the Moon is currently transiting using Skyfield calculations.
+        Pass `packet` from `_moon_longitude_packet` to reuse an already computed position.
+        With `fallback=False`, failures raise instead of returning the approximate sign.
         """
         if self.skyfield_service:
             try:
-                # Get accurate planetary positions from Skyfield
-                planetary_positions = self.skyfield_service.get_planetary_positions(datetime_utc)
-                moon_data = planetary_positions.get('moon', {})
-                moon_lon = moon_data.get('ecliptic_longitude_degrees')
-                
-                if moon_lon is None:
-                    logger.error("Failed to get Moon's longitude from Skyfield")
-                    return self._get_approximate_moon_in_zodiac(datetime_utc)
+                if packet is None:
+                    packet = self._moon_longitude_packet(self._shared_time(datetime_utc))
+                moon_lon = packet["lon"]
                 
                 # Calculate zodiac sign from longitude
                 moon_sign_index = int(moon_lon // 30)
-                moon_sign_key = list(self.zodiac_data.keys())[moon_sign_index]
-                moon_sign_info = self.zodiac_data.get(moon_sign_key)
+                moon_sign_key = self._zodiac_keys[moon_sign_index]
+                moon_sign_info = self._zodiac_info[moon_sign_index]
                 
                 if moon_sign_info:
-                    interpretation = self.moon_content.get('moon_in_signs', {}).get(moon_sign_key, "No specific interpretation available.")
+                    interpretation = self._sign_content.get(moon_sign_key, DEFAULT_INTERPRETATION)
                     return {
                         "date_utc": datetime_utc.isoformat(),
                         "moon_longitude": round(moon_lon, 4),
                         "moon_sign_name": moon_sign_info.get('name'),
                         "moon_sign_key": moon_sign_key,
                         "interpretation": interpretation,
-                        "is_retrograde": moon_data.get('is_retrograde', False),
-                        "speed_degrees_per_day": moon_data.get('speed_degrees_per_day', 0.0)
+                        "is_retrograde": packet["retro"],
+                        "speed_degrees_per_day": packet["speed"]
                     }
                 else:
                     return {"error": "Could not determine moon sign or its data."}
                     
             except Exception as e:
-                logger.error(f"Error calculating Moon's zodiac position with Skyfield: {e}")
+                if not fallback:
+                    raise
+                logger.error("Error calculating Moon's zodiac position with Skyfield: %s", e)
                 return self._get_approximate_moon_in_zodiac(datetime_utc)
         else:
+            if not fallback:
+                raise _UncacheableResult("SkyfieldService not available.")
             logger.warning("SkyfieldService not available, using approximate calculation.")
             return self._get_approximate_moon_in_zodiac(datetime_utc)
 
@@ -188,11 +492,11 @@ class MoonService:
         mock_moon_lon = (datetime_utc.day * 10 + datetime_utc.hour * 0.5) % 360
         moon_sign_index = int(mock_moon_lon // 30)
         
-        moon_sign_key = list(self.zodiac_data.keys())[moon_sign_index]
-        moon_sign_info = self.zodiac_data.get(moon_sign_key)
+        moon_sign_key = self._zodiac_keys[moon_sign_index]
+        moon_sign_info = self._zodiac_info[moon_sign_index]
         
         if moon_sign_info:
-            interpretation = self.moon_content.get('moon_in_signs', {}).get(moon_sign_key, "No specific interpretation available.")
+            interpretation = self._sign_content.get(moon_sign_key, DEFAULT_INTERPRETATION)
             return {
                 "date_utc": datetime_utc.isoformat(),
                 "moon_longitude": round(mock_moon_lon, 4),
@@ -212,32 +516,34 @@ class MoonService:
             try:
                 return lunar_mansion_service_instance.get_current_mansion(datetime_utc)
             except Exception as e:
-                logger.error(f"Error calculating lunar mansion: {e}")
+                logger.error("Error calculating lunar mansion: %s", e)
                 return {"error": f"Failed to calculate lunar mansion: {str(e)}"}
         else:
             return {"error": "Lunar mansion service not available"}
 
-    def get_moon_void_of_course(self, datetime_utc: datetime) -> Dict[str, Any]:
+    def get_moon_void_of_course(
+        self, datetime_utc: datetime, packet: Optional[Dict[str, Any]] = None, moon_lon: Optional[float] = None
+    ) -> Dict[str, Any]:
         """
         Determines if the Moon is void of course at the given time.
         Moon is void of course when it makes no more major aspects before changing signs.
+        Pass `packet` from `_moon_longitude_packet`, or a `moon_lon` the caller already
+        has (e.g. from `get_moon_in_zodiac`), to skip recomputing the Moon's position.
         """
         if not self.skyfield_service:
             return {"error": "Skyfield service required for void of course calculations"}
         
         try:
             # Get current Moon position
-            planetary_positions = self.skyfield_service.get_planetary_positions(datetime_utc)
-            moon_data = planetary_positions.get('moon', {})
-            moon_lon = moon_data.get('ecliptic_longitude_degrees')
-            
             if moon_lon is None:
-                return {"error": "Failed to get Moon's longitude"}
+                if packet is None:
+                    packet = self._moon_longitude_packet(self._shared_time(datetime_utc))
+                moon_lon = packet["lon"]
             
             # Calculate when Moon enters next sign (simplified)
             current_sign = int(moon_lon // 30)
             next_sign_start = (current_sign + 1) * 30
-            degrees_to_next_sign = (next_sign_start - moon_lon) % 360
+            degrees_to_next_sign = math.fmod(next_sign_start - moon_lon + 360.0, 360.0)
             
             # Estimate time to next sign based on Moon's average speed (~13 degrees/day)
             avg_moon_speed = 13.176  # degrees per day
@@ -253,12 +559,24 @@ class MoonService:
             }
             
         except Exception as e:
-            logger.error(f"Error calculating void of course: {e}")
+            logger.error("Error calculating void of course: %s", e)
             return {"error": f"Failed to calculate void of course: {str(e)}"}
 
     def get_moon_nodes(self, datetime_utc: datetime) -> Dict[str, Any]:
+        """
+        Calculates the lunar nodes for the minute containing `datetime_utc`.
+        Results are cached per minute; callers receive their own copy.
+        """
+        return self._from_minute_cache(self._cached_nodes, self._compute_moon_nodes, datetime_utc)
+
+    @lru_cache(maxsize=MOON_CACHE_MAXSIZE)
+    def _cached_nodes(self, bucket: int) -> Dict[str, Any]:
+        return _cacheable(self._compute_moon_nodes(_bucket_start(bucket)))
+
+    def _compute_moon_nodes(self, datetime_utc: datetime, t: Optional['Time'] = None) -> Dict[str, Any]:
         """
         Calculates the position of the lunar nodes (North Node/Rahu and South Node/Ketu).
+        Pass `t` from `_shared_time` to reuse a Time already built for `datetime_utc`.
         """
         if not self.skyfield_service:
             return {"error": "Skyfield service required for lunar node calculations"}
@@ -266,66 +584,114 @@ class MoonService:
         try:
             # Calculate lunar nodes using orbital mechanics
             # This is a simplified calculation - full precision requires more complex computation
-            t = self.skyfield_service.ts.utc(
-                datetime_utc.year, datetime_utc.month, datetime_utc.day,
-                datetime_utc.hour, datetime_utc.minute, datetime_utc.second
-            )
-            
-            # Get Moon's position
-            moon = self.skyfield_service.eph['moon']
-            earth = self.skyfield_service.eph['earth']
-            
-            # Calculate approximate lunar node positions
-            # True node calculation requires orbital elements
-            astrometric = earth.at(t).observe(moon)
-            lon, lat, _ = astrometric.ecliptic_position()
+            if t is not None:
+                tt = t.tt
+            else:
+                # The polynomial only needs TT, so skip building a Skyfield Time.
+                tt = _tt_from_utc_fields(datetime_utc)
             
             # Simplified node calculation (this is approximate)
             # For accurate nodes, we'd need to access Moon's orbital elements
-            mean_node_lon = (125.04452 - 1934.136261 * ((t.tt - 2451545.0) / 36525)) % 360
-            
-            # North Node (Rahu)
-            north_node_sign_index = int(mean_node_lon // 30)
-            north_node_sign_key = list(self.zodiac_data.keys())[north_node_sign_index]
-            north_node_sign_info = self.zodiac_data.get(north_node_sign_key, {})
+            mean_node_lon = (125.04452 - 1934.136261 * ((tt - 2451545.0) / 36525)) % 360
             
-            # South Node (Ketu) is exactly opposite (180 degrees)
-            south_node_lon = (mean_node_lon + 180) % 360
-            south_node_sign_index = int(south_node_lon // 30)
-            south_node_sign_key = list(self.zodiac_data.keys())[south_node_sign_index]
-            south_node_sign_info = self.zodiac_data.get(south_node_sign_key, {})
+            # South Node (Ketu) is exactly opposite (180 degrees); the mean node is
+            # already in [0, 360), so fmod wraps it without a floored modulo.
+            south_node_lon = math.fmod(mean_node_lon + 180.0, 360.0)
             
             return {
                 "date_utc": datetime_utc.isoformat(),
-                "north_node": {
-                    "longitude": round(mean_node_lon, 4),
-                    "sign_name": north_node_sign_info.get('name', 'Unknown'),
-                    "sign_key": north_node_sign_key,
-                    "degrees_in_sign": round(mean_node_lon % 30, 4)
-                },
-                "south_node": {
-                    "longitude": round(south_node_lon, 4),
-                    "sign_name": south_node_sign_info.get('name', 'Unknown'),
-                    "sign_key": south_node_sign_key,
-                    "degrees_in_sign": round(south_node_lon % 30, 4)
-                },
+                "north_node": self._node_packet(mean_node_lon),  # Rahu
+                "south_node": self._node_packet(south_node_lon),  # Ketu
                 "note": "Simplified node calculation using mean node formula"
             }
             
         except Exception as e:
-            logger.error(f"Error calculating lunar nodes: {e}")
+            logger.error("Error calculating lunar nodes: %s", e)
             return {"error": f"Failed to calculate lunar nodes: {str(e)}"}
 
+    def _node_packet(self, longitude: float) -> Dict[str, Any]:
+        """Formats one lunar node position, splitting the longitude into sign and degrees."""
+        sign_index, degrees_in_sign = divmod(longitude, 30.0)
+        return self._format_node(longitude, int(sign_index), degrees_in_sign)
+
+    def _format_node(self, longitude: float, sign_index: int, degrees_in_sign: float) -> Dict[str, Any]:
+        """
+        Formats one lunar node position whose sign split is already known, as
+        returned per element by the `mean_node_batch` kernel.
+        """
+        return {
+            "longitude": round(longitude, 4),
+            "sign_name": self._zodiac_info[sign_index].get('name', 'Unknown'),
+            "sign_key": self._zodiac_keys[sign_index],
+            "degrees_in_sign": round(degrees_in_sign, 4)
+        }
+
+    def get_moon_nodes_batch(self, datetimes: List[datetime]) -> List[Dict[str, Any]]:
+        """
+        Calculates the mean lunar nodes for many UTC datetimes at once.
+
+        The node polynomial runs in the compiled `mean_node_batch` kernel over a
+        single Time array; each entry has the same shape as `get_moon_nodes`.
+        Single lookups keep the scalar path, where kernel dispatch would dominate.
+        """
+        if not datetimes:
+            return []
+        if not self.skyfield_service:
+            return [{"error": "Skyfield service required for lunar node calculations"} for _ in datetimes]
+
+        t = self.skyfield_service.ts.utc(
+            np.array([dt.year for dt in datetimes]), np.array([dt.month for dt in datetimes]),
+            np.array([dt.day for dt in datetimes]), np.array([dt.hour for dt in datetimes]),
+            np.array([dt.minute for dt in datetimes]), np.array([dt.second for dt in datetimes])
+        )
+        north_lon, south_lon, north_sign, south_sign, north_deg, south_deg = (
+            a.tolist() for a in mean_node_batch(np.ascontiguousarray(t.tt, dtype=np.float64))
+        )
+        return [{
+            "date_utc": dt.isoformat(),
+            "north_node": self._format_node(north_lon[k], north_sign[k], north_deg[k]),
+            "south_node": self._format_node(south_lon[k], south_sign[k], south_deg[k]),
+            "note": "Simplified node calculation using mean node formula"
+        } for k, dt in enumerate(datetimes)]
+
     def get_comprehensive_moon_data(self, datetime_utc: datetime) -> Dict[str, Any]:
+        """
+        Returns comprehensive moon data for the minute containing `datetime_utc`.
+        Results are cached per minute; callers receive their own copy.
+        """
+        return self._from_minute_cache(self._cached_comprehensive, self._compute_comprehensive_moon_data, datetime_utc)
+
+    @lru_cache(maxsize=MOON_CACHE_MAXSIZE)
+    def _cached_comprehensive(self, bucket: int) -> Dict[str, Any]:
+        return _cacheable(self._compute_comprehensive_moon_data(_bucket_start(bucket), fallback=False))
+
+    def _compute_comprehensive_moon_data(self, datetime_utc: datetime, fallback: bool = True) -> Dict[str, Any]:
         """
         Returns comprehensive moon data including phase, zodiac position, mansion, and nodes.
+        Inside the range of the precomputed table, positions are read from it and
+        Skyfield is not consulted. `fallback` is passed on to the phase and zodiac
+        calculations.
         """
         try:
-            moon_phase = self.get_moon_phase(datetime_utc)
-            moon_zodiac = self.get_moon_in_zodiac(datetime_utc)
+            # The phase, zodiac and void-of-course results all derive from one
+            # Moon/Sun position, read from the table or computed the same way.
+            t = None
+            packet = self._table_positions(datetime_utc) if self.skyfield_service else None
+            if packet is None:
+                t = self._shared_time(datetime_utc)
+                if t is not None:
+                    try:
+                        packet = self._moon_longitude_packet(t, with_sun=True)
+                    except Exception as e:
+                        logger.error("Error calculating Moon's position with Skyfield: %s", e)
+            if packet is not None:
+                moon_phase = self._format_phase(datetime_utc, (packet["lon"] - packet["sun_lon"]) % 360.0)
+            else:
+                moon_phase = self._compute_moon_phase(datetime_utc, fallback)
+            moon_zodiac = self._compute_moon_in_zodiac(datetime_utc, packet, fallback)
             lunar_mansion = self.get_lunar_mansion(datetime_utc)
-            void_of_course = self.get_moon_void_of_course(datetime_utc)
-            lunar_nodes = self.get_moon_nodes(datetime_utc)
+            void_of_course = self.get_moon_void_of_course(datetime_utc, packet)
+            lunar_nodes = self._compute_moon_nodes(datetime_utc, t)
             
             return {
                 "calculation_datetime_utc": datetime_utc.isoformat(),
@@ -337,10 +703,10 @@ class MoonService:
             }
             
         except Exception as e:
-            logger.error(f"Error getting comprehensive moon data: {e}")
+            logger.error("Error getting comprehensive moon data: %s", e)
             return {"error": f"Failed to get comprehensive moon data: {str(e)}"}
 
-    def calculate_lunar_phenomena(self, date: datetime) -> Dict[str, Any]:
+    def calculate_lunar_phenomena(self, date: datetime, t: Optional['Time'] = None) -> Dict[str, Any]:
         """Calculate advanced lunar phenomena including:
         - Precise phase angle and illumination
         - Distance from Earth (in km)
@@ -348,9 +714,12 @@ class MoonService:
         - Libration in latitude and longitude
         - Subsolar point
         - Ascending/descending node crossings
+
+        Pass `t` from `_shared_time` to reuse a Time already built for `date`.
         """
         ts = self.skyfield_service.ts
-        t = ts.from_datetime(date)
+        if t is None:
+            t = ts.from_datetime(date)
         
         # Get Earth and Moon positions
         earth = self.skyfield_service.eph['earth']
@@ -432,4 +801,11 @@ class MoonService:
             'symbol': mansion_data.get('symbol', ''),
             'interpretation': mansion_data.get('interpretation', ''),
             'timestamp': date.isoformat()
-        }
\ No newline at end of file
+        }
+
+# --- Create a single, shared instance ---
+try:
+    moon_service_instance = MoonService(ContentFetchService())
+except Exception as e:
+    logger.critical(f"Could not instantiate MoonService: {e}")
+    moon_service_instance = None
@@ -0,0 +1,259 @@
+# app/services/numeric_kernels.py
+"""
+Numeric Kernels
+
+Small, pure-numeric hot loops shared by the calculation services. Kernels only
+take and return NumPy arrays so they can be compiled with Numba; when Numba is
+not installed they run unchanged as plain Python.
+
+If the `astro_kernels` extension has been built ahead of time (see
+build_kernels.py), its precompiled kernels replace the JIT versions below, so
+workers start without JIT warmup and without needing Numba.
+"""
+import logging
+from typing import Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.info("Numba not installed; numeric kernels will run as plain Python.")
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for `numba.njit` supporting both decorator forms."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# No fastmath on the comparison kernels: their orb tests must match the
+# Python loops they replace exactly, even for aspects right on the orb limit.
+@njit(cache=True)
+def aspect_scan(
+    source_lons: np.ndarray,
+    target_lons: np.ndarray,
+    aspect_angles: np.ndarray,
+    aspect_orbs: np.ndarray,
+    max_orb: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Finds every aspect between each source longitude and each target longitude.
+
+    An aspect is a hit when its orb is within both the aspect's own orb and
+    `max_orb`. Hits are emitted in (source, target, aspect) order.
+
+    Returns:
+        (source_idx, target_idx, aspect_idx, orb) arrays, one entry per hit.
+    """
+    n_src = source_lons.shape[0]
+    n_tgt = target_lons.shape[0]
+    n_asp = aspect_angles.shape[0]
+    capacity = n_src * n_tgt * n_asp
+
+    src_out = np.empty(capacity, dtype=np.int64)
+    tgt_out = np.empty(capacity, dtype=np.int64)
+    asp_out = np.empty(capacity, dtype=np.int64)
+    orb_out = np.empty(capacity, dtype=np.float64)
+
+    count = 0
+    for s in range(n_src):
+        for t in range(n_tgt):
+            d = abs(source_lons[s] - target_lons[t])
+            separation = min(d, 360.0 - d)
+            for a in range(n_asp):
+                orb = abs(separation - aspect_angles[a])
+                if orb <= aspect_orbs[a] and orb <= max_orb:
+                    src_out[count] = s
+                    tgt_out[count] = t
+                    asp_out[count] = a
+                    orb_out[count] = orb
+                    count += 1
+
+    return src_out[:count], tgt_out[:count], asp_out[:count], orb_out[:count]
+
+
+
+@njit(cache=True)
+def pair_aspect_scan(
+    lons: np.ndarray,
+    aspect_angles: np.ndarray,
+    aspect_orbs: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Finds every aspect within its orb between each unique pair (i < j) of `lons`.
+
+    Hits are emitted in (i, j, aspect) order, matching a nested loop over
+    `itertools.combinations(range(len(lons)), 2)`.
+
+    Returns:
+        (i_idx, j_idx, aspect_idx, orb) arrays, one entry per hit.
+    """
+    n = lons.shape[0]
+    n_asp = aspect_angles.shape[0]
+    capacity = (n * (n - 1) // 2) * n_asp
+
+    i_out = np.empty(capacity, dtype=np.int64)
+    j_out = np.empty(capacity, dtype=np.int64)
+    asp_out = np.empty(capacity, dtype=np.int64)
+    orb_out = np.empty(capacity, dtype=np.float64)
+
+    count = 0
+    for i in range(n):
+        for j in range(i + 1, n):
+            d = abs(lons[i] - lons[j])
+            separation = min(d, 360.0 - d)
+            for a in range(n_asp):
+                orb = abs(separation - aspect_angles[a])
+                if orb <= aspect_orbs[a]:
+                    i_out[count] = i
+                    j_out[count] = j
+                    asp_out[count] = a
+                    orb_out[count] = orb
+                    count += 1
+
+    return i_out[:count], j_out[:count], asp_out[:count], orb_out[:count]
+
+
+@njit(cache=True, fastmath=True)
+def mean_node_batch(
+    tt: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Evaluates the mean lunar node polynomial for an array of TT Julian dates.
+
+    Returns:
+        (north_lon, south_lon, north_sign_idx, south_sign_idx,
+         north_deg_in_sign, south_deg_in_sign) arrays, one entry per date.
+    """
+    n = tt.shape[0]
+    north_lon = np.empty(n, dtype=np.float64)
+    south_lon = np.empty(n, dtype=np.float64)
+    north_sign = np.empty(n, dtype=np.int64)
+    south_sign = np.empty(n, dtype=np.int64)
+    north_deg = np.empty(n, dtype=np.float64)
+    south_deg = np.empty(n, dtype=np.float64)
+
+    for k in range(n):
+        north = (125.04452 - 1934.136261 * ((tt[k] - 2451545.0) / 36525.0)) % 360.0
+        south = (north + 180.0) % 360.0
+        north_lon[k] = north
+        south_lon[k] = south
+        north_sign[k] = int(north // 30.0)
+        south_sign[k] = int(south // 30.0)
+        north_deg[k] = north % 30.0
+        south_deg[k] = south % 30.0
+
+    return north_lon, south_lon, north_sign, south_sign, north_deg, south_deg
+
+
+@njit(cache=True)
+def grand_trine_scan(
+    lons: np.ndarray,
+    element_codes: np.ndarray,
+    max_orb: float,
+) -> np.ndarray:
+    """
+    Finds every grand trine: three planets (i < j < k) in mutual trine within
+    `max_orb` and sharing one element. A negative element code never matches.
+
+    Hits are emitted in (i, j, k) order, matching a nested loop over
+    `itertools.combinations(range(len(lons)), 3)`.
+
+    Returns:
+        (M, 3) array of planet indices, one row per grand trine.
+    """
+    n = lons.shape[0]
+    out = np.empty((max(n * (n - 1) * (n - 2) // 6, 0), 3), dtype=np.int64)
+
+    count = 0
+    for i in range(n):
+        if element_codes[i] < 0:
+            continue
+        for j in range(i + 1, n):
+            if element_codes[j] != element_codes[i]:
+                continue
+            d = abs(lons[i] - lons[j])
+            if abs(min(d, 360.0 - d) - 120.0) > max_orb:
+                continue
+            for k in range(j + 1, n):
+                if element_codes[k] != element_codes[i]:
+                    continue
+                d = abs(lons[j] - lons[k])
+                if abs(min(d, 360.0 - d) - 120.0) > max_orb:
+                    continue
+                d = abs(lons[i] - lons[k])
+                if abs(min(d, 360.0 - d) - 120.0) > max_orb:
+                    continue
+                out[count, 0] = i
+                out[count, 1] = j
+                out[count, 2] = k
+                count += 1
+
+    return out[:count]
+
+
+# No fastmath: reassociating the final sums could flip near-equal comparisons.
+@njit(cache=True)
+def aspect_applying(
+    speeds1: np.ndarray,
+    speeds2: np.ndarray,
+    lons1: np.ndarray,
+    lons2: np.ndarray,
+    aspect_degrees: np.ndarray,
+) -> np.ndarray:
+    """
+    Determines, element-wise, whether each aspect between body 1 and body 2 is
+    applying (moving towards exact) over the next day of relative motion.
+
+    Branch-free: the wrap of the separation into [-180, 180] and the choice of
+    the exact target angle are folded into arithmetic on comparison results.
+
+    Returns:
+        Boolean array, True where the aspect is applying.
+    """
+    n = lons1.shape[0]
+    out = np.empty(n, dtype=np.bool_)
+    for k in range(n):
+        diff = lons1[k] - lons2[k]
+        diff -= 360.0 * (diff > 180.0)
+        diff += 360.0 * (diff < -180.0)
+        # Approach +aspect from below and -aspect from above; 0 for conjunctions.
+        degree = aspect_degrees[k] * (aspect_degrees[k] > 0.0)
+        target = degree - 2.0 * degree * (diff > 0.0)
+        relative_speed = speeds1[k] - speeds2[k]
+        out[k] = abs(diff - target) > abs(diff + relative_speed - target)
+    return out
+
+
+def _applying_scalar(speed1: float, speed2: float, lon1: float, lon2: float, ang: float) -> bool:
+    """
+    Single-aspect form of `aspect_applying`, with the same branch-free
+    arithmetic on plain floats. Scalar callers use this to avoid building
+    one-element arrays and going through the compiled dispatcher per aspect.
+    """
+    diff = lon1 - lon2
+    diff -= 360.0 * (diff > 180.0)
+    diff += 360.0 * (diff < -180.0)
+    degree = ang * (ang > 0.0)
+    target = degree - 2.0 * degree * (diff > 0.0)
+    return abs(diff - target) > abs(diff + (speed1 - speed2) - target)
+
+try:
+    from . import astro_kernels as _aot_kernels
+    AOT_AVAILABLE = True
+except ImportError:
+    AOT_AVAILABLE = False
+
+if AOT_AVAILABLE:
+    # An extension built before a kernel was added lacks it; keep the JIT version then.
+    aspect_scan = getattr(_aot_kernels, 'aspect_scan', aspect_scan)
+    pair_aspect_scan = getattr(_aot_kernels, 'pair_aspect_scan', pair_aspect_scan)
+    mean_node_batch = getattr(_aot_kernels, 'mean_node_batch', mean_node_batch)
+    grand_trine_scan = getattr(_aot_kernels, 'grand_trine_scan', grand_trine_scan)
+    aspect_applying = getattr(_aot_kernels, 'aspect_applying', aspect_applying)
+    logger.info("Using ahead-of-time compiled numeric kernels.")
@@ -1,84 +1,129 @@
 # app/services/numerology_service.py
+import datetime
+import functools
 import logging
-from typing import Dict, Any, Optional, List
+import threading
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Tuple
 
 logger = logging.getLogger(__name__)
 
-if not logger.handlers:
-    handler = logging.StreamHandler()
-    formatter = logging.Formatter('%(asctime)s - [%(levelname)s] - %(name)s - %(message)s')
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
-    logger.setLevel(logging.INFO)
+# Digit sum of every number below 1000, so digits are summed three at a time
+# with integer arithmetic instead of going through str() and int() per digit.
+_DIGIT_SUM = bytes(sum(map(int, str(i))) for i in range(1000))
+_MASTER_NUMBERS = frozenset((11, 22, 33))
+
+# In a real app, you'd fetch this from content_fetch_service or a database.
+# For now, a simple read-only lookup shared by every call.
+_LIFE_PATH_MEANINGS = MappingProxyType({
+    1: "The Leader: Independent, ambitious, and original. You are here to lead and innovate.",
+    2: "The Harmonizer: Diplomatic, cooperative, and sensitive. You are here to bring balance and peace.",
+    3: "The Communicator: Creative, expressive, and optimistic. You are here to inspire and uplift.",
+    4: "The Builder: Practical, disciplined, and hard-working. You are here to create solid foundations.",
+    5: "The Adventurer: Freedom-loving, adaptable, and versatile. You are here to experience and explore.",
+    6: "The Nurturer: Responsible, compassionate, and family-oriented. You are here to serve and heal.",
+    7: "The Seeker: Analytical, spiritual, and introspective. You are here to understand and uncover truths.",
+    8: "The Achiever: Ambitious, powerful, and successful. You are here to manifest abundance.",
+    9: "The Humanitarian: Compassionate, wise, and selfless. You are here to serve humanity.",
+    11: "The Master Intuitive: Highly sensitive, inspiring, and insightful. You are here to enlighten.",
+    22: "The Master Builder: Practical visionary, capable of grand achievements. You are here to build legacies.",
+    33: "The Master Healer: Compassionate and a powerful healer. You are here to guide with unconditional love."
+})
+
+
+def _digit_sum(num: int) -> int:
+    """Sums the decimal digits of a non-negative integer."""
+    total = 0
+    while num:
+        num, chunk = divmod(num, 1000)
+        total += _DIGIT_SUM[chunk]
+    return total
+
+def _canonical_date_digits(date_str: str) -> Optional[str]:
+    """
+    Returns the eight digits of a zero-padded "YYYY-MM-DD" string by slicing,
+    or None if the string has a different shape. Raises ValueError, as strptime
+    would, for a well-shaped string that is not a real calendar date.
+    """
+    if len(date_str) != 10 or date_str[4] != '-' or date_str[7] != '-':
+        return None
+    digits = date_str[:4] + date_str[5:7] + date_str[8:]
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+    datetime.date(int(digits[:4]), int(digits[4:6]), int(digits[6:]))  # Validates month/day ranges.
+    return digits
+
 
 class NumerologyService:
     _instance = None # For optional singleton pattern
+    _lock = threading.Lock()
 
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
-            cls._instance = super(NumerologyService, cls).__new__(cls)
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(NumerologyService, cls).__new__(cls)
         return cls._instance
 
     def __init__(self):
-        if hasattr(self, '_initialized') and self._initialized:
+        if getattr(self, '_initialized', False):
             return
-        logger.info("NumerologyService initialized.")
-        # NumerologyService might need content_fetch_service later if you add dynamic meanings
-        # For now, it's simple and doesn't need to be passed a dependency.
-        self._initialized = True
+        with self._lock:
+            if getattr(self, '_initialized', False):
+                return
+            logger.info("NumerologyService initialized.")
+            # NumerologyService might need content_fetch_service later if you add dynamic meanings
+            # For now, it's simple and doesn't need to be passed a dependency.
+            self._initialized = True
 
     def calculate_life_path(self, birth_date_str: str) -> Dict[str, Any]:
         """
         Calculates the life path number from a birth date string (YYYY-MM-DD).
         """
         try:
-            birth_date = datetime.datetime.strptime(birth_date_str, "%Y-%m-%d").date()
-            
-            # Sum the digits of the birth date
-            total_sum = sum(int(digit) for digit in str(birth_date.year) + str(birth_date.month) + str(birth_date.day))
-            
-            life_path = self._reduce_number(total_sum)
-            
-            meaning = self._get_life_path_meaning(life_path)
-            
+            life_path, master_number = self._life_path_core(birth_date_str)
             return {
                 "birth_date": birth_date_str,
                 "life_path_number": life_path,
-                "meaning": meaning,
-                "master_number": life_path in [11, 22, 33]
+                "meaning": self._get_life_path_meaning(life_path),
+                "master_number": master_number
             }
         except ValueError:
-            logger.error(f"Invalid birth date format: {birth_date_str}. Expected YYYY-MM-DD.")
+            logger.error("Invalid birth date format: %s. Expected YYYY-MM-DD.", birth_date_str)
             return {"error": "Invalid birth date format. Please use YYYY-MM-DD."}
         except Exception as e:
-            logger.critical(f"Error calculating life path for {birth_date_str}: {e}", exc_info=True)
+            logger.critical("Error calculating life path for %s: %s", birth_date_str, e, exc_info=True)
             return {"error": "An unexpected error occurred during numerology calculation."}
 
-    def _reduce_number(self, num: int) -> int:
+    @staticmethod
+    @functools.lru_cache(maxsize=100_000)
+    def _life_path_core(birth_date_str: str) -> Tuple[int, bool]:
+        """
+        Parses the birth date and reduces its digit sum to (life path, is master number).
+        The result depends only on the date string, so repeat lookups are served from cache.
+        """
+        digits = _canonical_date_digits(birth_date_str)
+        if digits is not None:
+            # ASCII digit bytes are the digit values offset by ord('0') each.
+            total_sum = sum(digits.encode()) - 48 * len(digits)
+        else:
+            # Non-padded forms such as "1990-1-5" still go through strptime.
+            birth_date = datetime.datetime.strptime(birth_date_str, "%Y-%m-%d").date()
+            total_sum = _digit_sum(birth_date.year) + _digit_sum(birth_date.month) + _digit_sum(birth_date.day)
+
+        life_path = NumerologyService._reduce_number(total_sum)
+        return life_path, life_path in _MASTER_NUMBERS
+
+    @staticmethod
+    def _reduce_number(num: int) -> int:
         """Reduces a number to a single digit or a master number (11, 22, 33)."""
-        while num > 9 and num not in [11, 22, 33]:
-            num = sum(int(digit) for digit in str(num))
+        while num > 9 and num not in _MASTER_NUMBERS:
+            num = _digit_sum(num)
         return num
 
     def _get_life_path_meaning(self, life_path: int) -> str:
         """Fetches the meaning for a given life path number."""
-        # In a real app, you'd fetch this from content_fetch_service or a database
-        # For now, a simple lookup.
-        meanings = {
-            1: "The Leader: Independent, ambitious, and original. You are here to lead and innovate.",
-            2: "The Harmonizer: Diplomatic, cooperative, and sensitive. You are here to bring balance and peace.",
-            3: "The Communicator: Creative, expressive, and optimistic. You are here to inspire and uplift.",
-            4: "The Builder: Practical, disciplined, and hard-working. You are here to create solid foundations.",
-            5: "The Adventurer: Freedom-loving, adaptable, and versatile. You are here to experience and explore.",
-            6: "The Nurturer: Responsible, compassionate, and family-oriented. You are here to serve and heal.",
-            7: "The Seeker: Analytical, spiritual, and introspective. You are here to understand and uncover truths.",
-            8: "The Achiever: Ambitious, powerful, and successful. You are here to manifest abundance.",
-            9: "The Humanitarian: Compassionate, wise, and selfless. You are here to serve humanity.",
-            11: "The Master Intuitive: Highly sensitive, inspiring, and insightful. You are here to enlighten.",
-            22: "The Master Builder: Practical visionary, capable of grand achievements. You are here to build legacies.",
-            33: "The Master Healer: Compassionate and a powerful healer. You are here to guide with unconditional love."
-        }
-        return meanings.get(life_path, "Meaning not found for this life path number.")
+        return _LIFE_PATH_MEANINGS.get(life_path, "Meaning not found for this life path number.")
 
 # IMPORTANT: Remove module-level instance creation
 # numerology_service_instance = NumerologyService()
\ No newline at end of file
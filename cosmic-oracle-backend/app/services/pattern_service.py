@@ -9,15 +9,41 @@ This service analyzes charts for complex patterns including:
 - Midpoint structures and symmetries
 """
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, NamedTuple
 import math
 from dataclasses import dataclass
 
+import numpy as np
+
 from app.services.astronomical_service import AstronomicalService
 from app.services.aspect_service import AspectService
+from app.services.numeric_kernels import aspect_applying, grand_trine_scan, _applying_scalar
 
 logger = logging.getLogger(__name__)
 
+# Sign -> element / modality as small integer codes, so pattern searches can
+# compare whole arrays of planets instead of looking up strings per candidate.
+ELEMENTS = ('fire', 'earth', 'air', 'water')
+MODALITIES = ('cardinal', 'fixed', 'mutable')
+ELEMENT_OF = {
+    'aries': 0, 'leo': 0, 'sagittarius': 0,
+    'taurus': 1, 'virgo': 1, 'capricorn': 1,
+    'gemini': 2, 'libra': 2, 'aquarius': 2,
+    'cancer': 3, 'scorpio': 3, 'pisces': 3
+}
+MODALITY_OF = {
+    'aries': 0, 'cancer': 0, 'libra': 0, 'capricorn': 0,
+    'taurus': 1, 'leo': 1, 'scorpio': 1, 'aquarius': 1,
+    'gemini': 2, 'virgo': 2, 'sagittarius': 2, 'pisces': 2
+}
+NO_CODE = -1  # Unknown sign; never matches another planet.
+
+# The fixed set of aspects patterns are built from: exact angle and name, in
+# matching order, so a whole separation matrix is classified in one broadcast.
+ASPECT_DEGREES = np.array([0, 60, 90, 120, 150, 180], dtype=np.float64)
+ASPECT_NAMES = ('conjunction', 'sextile', 'square', 'trine', 'quincunx', 'opposition')
+ASPECT_TYPE_OF = dict(zip(ASPECT_DEGREES.tolist(), ASPECT_NAMES))
+
 @dataclass
 class Pattern:
     """Represents an astrological pattern in a chart."""
@@ -28,6 +54,109 @@ class Pattern:
     orb: float
     power: float  # Pattern strength/significance
 
+class _PlanetsSoA(NamedTuple):
+    """
+    Structure-of-arrays view of a chart's planets that does not depend on the
+    search orb. It is built on first use and kept on the chart under
+    '_planets_soa', so every later pattern or harmonic search on the same chart
+    skips the conversion. Rebuild it (drop the key) if the chart's planets change.
+    """
+    names: List[str]
+    data: List[Dict[str, Any]]
+    lon: np.ndarray  # (N,) ecliptic longitudes
+    speed: np.ndarray  # (N,) daily motion in longitude, NaN when unknown
+    element: np.ndarray  # (N,) int8 index into ELEMENTS, or NO_CODE
+    modality: np.ndarray  # (N,) int8 index into MODALITIES, or NO_CODE
+
+    @classmethod
+    def of(cls, chart: Dict[str, Any]) -> '_PlanetsSoA':
+        soa = chart.get('_planets_soa')
+        if soa is None:
+            names = list(chart['planets'].keys())
+            data = list(chart['planets'].values())
+            signs = [str(p.get('sign', '')).lower() for p in data]
+            soa = chart['_planets_soa'] = cls(
+                names, data,
+                np.array([p['longitude'] for p in data], dtype=np.float64),
+                np.array([p.get('speed', np.nan) for p in data], dtype=np.float64),
+                np.fromiter((ELEMENT_OF.get(s, NO_CODE) for s in signs), dtype=np.int8, count=len(signs)),
+                np.fromiter((MODALITY_OF.get(s, NO_CODE) for s in signs), dtype=np.int8, count=len(signs)),
+            )
+        return soa
+
+
+class _ChartArrays(NamedTuple):
+    """
+    Structure-of-arrays view of a chart's planets, built once per pattern search.
+
+    The orb, in-orb mask and applying flag of every ASPECT_NAMES aspect between
+    every pair of planets are derived here in a single pass, so each pattern
+    finder only indexes them instead of re-checking aspects pair by pair.
+    """
+    names: List[str]
+    data: List[Dict[str, Any]]
+    lon: np.ndarray  # (N,) ecliptic longitudes
+    separation: np.ndarray  # (N, N) shortest-arc distance between every pair of planets
+    element: np.ndarray  # (N,) int8 index into ELEMENTS, or NO_CODE
+    modality: np.ndarray  # (N,) int8 index into MODALITIES, or NO_CODE
+    orb: Dict[str, np.ndarray]  # aspect name -> (N, N) orb of every pair from the exact aspect
+    mask: Dict[str, np.ndarray]  # aspect name -> (N, N) bool, pair within max_orb (diagonal False)
+    applying: Dict[str, np.ndarray]  # aspect name -> (N, N) bool, row planet applying to column planet
+
+    @classmethod
+    def from_chart(cls, chart: Dict[str, Any], max_orb: float) -> '_ChartArrays':
+        planets = _PlanetsSoA.of(chart)
+        lon, speed = planets.lon, planets.speed
+        diff = np.abs(lon[:, None] - lon[None, :])
+        separation = np.where(diff > 180, 360 - diff, diff)
+
+        # (N, N, A) orb of every pair from every aspect, thresholded in one comparison.
+        orbs = np.abs(separation[..., None] - ASPECT_DEGREES)
+        within = orbs <= max_orb
+        within[np.arange(len(lon)), np.arange(len(lon))] = False
+        orb = {name: orbs[..., a] for a, name in enumerate(ASPECT_NAMES)}
+        mask = {name: within[..., a] for a, name in enumerate(ASPECT_NAMES)}
+
+        # (N, N, A) applying flags from one compiled call over every combination.
+        shape = orbs.shape
+        applying_flat = aspect_applying(
+            np.broadcast_to(speed[:, None, None], shape).ravel(),
+            np.broadcast_to(speed[None, :, None], shape).ravel(),
+            np.broadcast_to(lon[:, None, None], shape).ravel(),
+            np.broadcast_to(lon[None, :, None], shape).ravel(),
+            np.broadcast_to(ASPECT_DEGREES, shape).ravel(),
+        ).reshape(shape)
+        applying = {name: applying_flat[..., a] for a, name in enumerate(ASPECT_NAMES)}
+
+        return cls(
+            planets.names, planets.data, lon, separation, planets.element, planets.modality,
+            orb, mask, applying,
+        )
+
+
+# Hexagon vertex pairs of a grand sextile and the aspect each pair forms:
+# six sextiles around the ring, two grand trines and three oppositions.
+_GRAND_SEXTILE_EDGES = (
+    [(n, (n + 1) % 6, 60, 'sextile') for n in range(6)] +
+    [(n, (n + 2) % 6, 120, 'trine') for n in range(6)] +
+    [(n, n + 3, 180, 'opposition') for n in range(3)]
+)
+
+
+def _bitmask_rows(mask: np.ndarray) -> List[int]:
+    """Encodes each row of an (N, N) bool matrix as an int with bit j set where mask[i, j]."""
+    packed = np.packbits(mask, axis=1, bitorder='little')
+    return [int.from_bytes(row.tobytes(), 'little') for row in packed]
+
+
+def _iter_bits(bits: int):
+    """Yields the indices of the set bits of `bits`, lowest first."""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
 class PatternService:
     """Service for detecting and analyzing astrological patterns."""
     
@@ -39,147 +168,218 @@ class PatternService:
     def find_all_patterns(self, chart: Dict[str, Any],
                          max_orb: float = 8.0) -> Dict[str, List[Pattern]]:
         """Find all major aspect patterns in a chart."""
+        # The pairwise aspect orbs and masks are shared by every pattern search.
+        arrays = _ChartArrays.from_chart(chart, max_orb)
         patterns = {
-            'grand_trines': self.find_grand_trines(chart, max_orb),
-            'grand_crosses': self.find_grand_crosses(chart, max_orb),
+            'grand_trines': self.find_grand_trines(chart, max_orb, arrays),
+            'grand_crosses': self.find_grand_crosses(chart, max_orb, arrays),
             't_squares': self.find_t_squares(chart, max_orb),
-            'yods': self.find_yods(chart, max_orb),
+            'yods': self.find_yods(chart, max_orb, arrays),
             'mystic_rectangles': self.find_mystic_rectangles(chart, max_orb),
             'kites': self.find_kites(chart, max_orb),
             'thors_hammers': self.find_thors_hammers(chart, max_orb),
-            'grand_sextiles': self.find_grand_sextiles(chart, max_orb)
+            'grand_sextiles': self.find_grand_sextiles(chart, max_orb, arrays)
         }
         
         return patterns
     
     def find_grand_trines(self, chart: Dict[str, Any],
-                         max_orb: float = 8.0) -> List[Pattern]:
-        """Find all grand trines in the chart."""
+                         max_orb: float = 8.0,
+                         arrays: Optional[_ChartArrays] = None,
+                         max_results: Optional[int] = None) -> List[Pattern]:
+        """
+        Find all grand trines in the chart, tightest first.
+
+        Candidates are ranked on raw index/orb arrays and only the first
+        `max_results` (all when None) are materialized as Pattern objects.
+        """
         grand_trines = []
-        planets = list(chart['planets'].items())
-        
-        for i in range(len(planets) - 2):
-            for j in range(i + 1, len(planets) - 1):
-                for k in range(j + 1, len(planets)):
-                    p1_name, p1_data = planets[i]
-                    p2_name, p2_data = planets[j]
-                    p3_name, p3_data = planets[k]
-                    
-                    # Check for three trines
-                    trine1 = self._check_aspect(p1_data, p2_data, 120, max_orb)
-                    trine2 = self._check_aspect(p2_data, p3_data, 120, max_orb)
-                    trine3 = self._check_aspect(p3_data, p1_data, 120, max_orb)
-                    
-                    if trine1 and trine2 and trine3:
-                        # Determine element
-                        element = self._get_element(p1_data['sign'])
-                        if (self._get_element(p2_data['sign']) == element and
-                            self._get_element(p3_data['sign']) == element):
-                            
-                            # Calculate average orb
-                            avg_orb = (trine1['orb'] + trine2['orb'] + trine3['orb']) / 3
-                            
-                            grand_trines.append(Pattern(
-                                type='grand_trine',
-                                planets=[p1_name, p2_name, p3_name],
-                                aspects=[trine1, trine2, trine3],
-                                quality=element,
-                                orb=avg_orb,
-                                power=self._calculate_pattern_power(
-                                    'grand_trine',
-                                    [p1_data, p2_data, p3_data],
-                                    avg_orb
-                                )
-                            ))
-        
-        return sorted(grand_trines, key=lambda x: x.orb)
+        arrays = arrays or _ChartArrays.from_chart(chart, max_orb)
+        trine_orbs = arrays.orb['trine']
+        trine_applying = arrays.applying['trine']
+
+        # Every (i, j, k), i < j < k, in mutual trine and sharing one element.
+        # Charts are small, so a compiled triple loop beats building the N^3 mask.
+        hits = grand_trine_scan(arrays.lon, arrays.element, float(max_orb))
+        i, j, k = hits[:, 0], hits[:, 1], hits[:, 2]
+        orbs = np.stack([trine_orbs[i, j], trine_orbs[j, k], trine_orbs[k, i]], axis=1)
+        # Average orb; a stable sort keeps scan order among equal orbs.
+        avg_orbs = (orbs[:, 0] + orbs[:, 1] + orbs[:, 2]) / 3
+        ranked = np.argsort(avg_orbs, kind='stable')[:max_results]
+
+        for (i, j, k), (orb1, orb2, orb3), avg_orb in zip(
+            hits[ranked].tolist(), orbs[ranked].tolist(), avg_orbs[ranked].tolist()
+        ):
+            p1_data, p2_data, p3_data = arrays.data[i], arrays.data[j], arrays.data[k]
+
+            grand_trines.append(Pattern(
+                type='grand_trine',
+                planets=[arrays.names[i], arrays.names[j], arrays.names[k]],
+                aspects=[
+                    self._aspect_entry(p1_data, p2_data, 120, orb1, bool(trine_applying[i, j])),
+                    self._aspect_entry(p2_data, p3_data, 120, orb2, bool(trine_applying[j, k])),
+                    self._aspect_entry(p3_data, p1_data, 120, orb3, bool(trine_applying[k, i])),
+                ],
+                quality=ELEMENTS[arrays.element[i]],
+                orb=avg_orb,
+                power=self._calculate_pattern_power(
+                    'grand_trine',
+                    [p1_data, p2_data, p3_data],
+                    avg_orb
+                )
+            ))
+
+        return grand_trines
     
     def find_grand_crosses(self, chart: Dict[str, Any],
-                          max_orb: float = 8.0) -> List[Pattern]:
+                          max_orb: float = 8.0,
+                          arrays: Optional[_ChartArrays] = None) -> List[Pattern]:
         """Find all grand crosses in the chart."""
         grand_crosses = []
-        planets = list(chart['planets'].items())
-        
-        for i in range(len(planets) - 3):
-            for j in range(i + 1, len(planets) - 2):
-                for k in range(j + 1, len(planets) - 1):
-                    for l in range(k + 1, len(planets)):
-                        p1_name, p1_data = planets[i]
-                        p2_name, p2_data = planets[j]
-                        p3_name, p3_data = planets[k]
-                        p4_name, p4_data = planets[l]
-                        
-                        # Check for four squares and two oppositions
-                        square1 = self._check_aspect(p1_data, p2_data, 90, max_orb)
-                        square2 = self._check_aspect(p2_data, p3_data, 90, max_orb)
-                        square3 = self._check_aspect(p3_data, p4_data, 90, max_orb)
-                        square4 = self._check_aspect(p4_data, p1_data, 90, max_orb)
-                        opp1 = self._check_aspect(p1_data, p3_data, 180, max_orb)
-                        opp2 = self._check_aspect(p2_data, p4_data, 180, max_orb)
-                        
-                        if all([square1, square2, square3, square4, opp1, opp2]):
-                            # Determine modality
-                            mode = self._get_modality(p1_data['sign'])
-                            if (self._get_modality(p2_data['sign']) == mode and
-                                self._get_modality(p3_data['sign']) == mode and
-                                self._get_modality(p4_data['sign']) == mode):
-                                
-                                avg_orb = (square1['orb'] + square2['orb'] +
-                                         square3['orb'] + square4['orb'] +
-                                         opp1['orb'] + opp2['orb']) / 6
-                                
-                                grand_crosses.append(Pattern(
-                                    type='grand_cross',
-                                    planets=[p1_name, p2_name, p3_name, p4_name],
-                                    aspects=[square1, square2, square3, square4,
-                                           opp1, opp2],
-                                    quality=mode,
-                                    orb=avg_orb,
-                                    power=self._calculate_pattern_power(
-                                        'grand_cross',
-                                        [p1_data, p2_data, p3_data, p4_data],
-                                        avg_orb
-                                    )
-                                ))
-        
+        arrays = arrays or _ChartArrays.from_chart(chart, max_orb)
+        square_orbs = arrays.orb['square']
+        opp_orbs = arrays.orb['opposition']
+        square_applying = arrays.applying['square']
+        opp_applying = arrays.applying['opposition']
+        sq = arrays.mask['square']
+
+        # A grand cross is two oppositions i-k and j-l whose four cross-edges
+        # i-j, j-k, k-l, l-i are all squares, so join the (short) list of
+        # opposition pairs with itself instead of searching every 4-tuple.
+        # All four planets must share one modality, which is a cheap integer
+        # compare, so it filters both the oppositions and their pairings
+        # before any square is looked up.
+        mode_code = arrays.modality
+        same_mode = (mode_code[:, None] == mode_code[None, :]) & (mode_code != NO_CODE)[:, None]
+        opps = np.argwhere(np.triu(arrays.mask['opposition'] & same_mode, 1))
+        first, second = np.triu_indices(len(opps), 1)
+        same_pair_mode = mode_code[opps[first, 0]] == mode_code[opps[second, 0]]
+        first, second = first[same_pair_mode], second[same_pair_mode]
+        i, k = opps[first, 0], opps[first, 1]
+        j, l = opps[second, 0], opps[second, 1]
+        is_cross = ((i != j) & (i != l) & (k != j) & (k != l) &
+                    sq[i, j] & sq[j, k] & sq[k, l] & sq[l, i])
+        for i, j, k, l in np.stack([i, j, k, l], axis=1)[is_cross].tolist():
+            p1_name, p1_data = arrays.names[i], arrays.data[i]
+            p2_name, p2_data = arrays.names[j], arrays.data[j]
+            p3_name, p3_data = arrays.names[k], arrays.data[k]
+            p4_name, p4_data = arrays.names[l], arrays.data[l]
+            mode = MODALITIES[mode_code[i]]
+
+            square1 = self._aspect_entry(p1_data, p2_data, 90, float(square_orbs[i, j]), bool(square_applying[i, j]))
+            square2 = self._aspect_entry(p2_data, p3_data, 90, float(square_orbs[j, k]), bool(square_applying[j, k]))
+            square3 = self._aspect_entry(p3_data, p4_data, 90, float(square_orbs[k, l]), bool(square_applying[k, l]))
+            square4 = self._aspect_entry(p4_data, p1_data, 90, float(square_orbs[l, i]), bool(square_applying[l, i]))
+            opp1 = self._aspect_entry(p1_data, p3_data, 180, float(opp_orbs[i, k]), bool(opp_applying[i, k]))
+            opp2 = self._aspect_entry(p2_data, p4_data, 180, float(opp_orbs[j, l]), bool(opp_applying[j, l]))
+
+            avg_orb = (square1['orb'] + square2['orb'] +
+                     square3['orb'] + square4['orb'] +
+                     opp1['orb'] + opp2['orb']) / 6
+
+            grand_crosses.append(Pattern(
+                type='grand_cross',
+                planets=[p1_name, p2_name, p3_name, p4_name],
+                aspects=[square1, square2, square3, square4,
+                       opp1, opp2],
+                quality=mode,
+                orb=avg_orb,
+                power=self._calculate_pattern_power(
+                    'grand_cross',
+                    [p1_data, p2_data, p3_data, p4_data],
+                    avg_orb
+                )
+            ))
+
         return sorted(grand_crosses, key=lambda x: x.orb)
     
     def find_yods(self, chart: Dict[str, Any],
-                  max_orb: float = 8.0) -> List[Pattern]:
+                  max_orb: float = 8.0,
+                  arrays: Optional[_ChartArrays] = None) -> List[Pattern]:
         """Find all yod configurations (Finger of God)."""
         yods = []
-        planets = list(chart['planets'].items())
-        
-        for i in range(len(planets) - 2):
-            for j in range(i + 1, len(planets) - 1):
-                for k in range(j + 1, len(planets)):
-                    p1_name, p1_data = planets[i]
-                    p2_name, p2_data = planets[j]
-                    p3_name, p3_data = planets[k]
-                    
-                    # Check for two quincunxes and one sextile
-                    quincunx1 = self._check_aspect(p1_data, p3_data, 150, max_orb)
-                    quincunx2 = self._check_aspect(p2_data, p3_data, 150, max_orb)
-                    sextile = self._check_aspect(p1_data, p2_data, 60, max_orb)
-                    
-                    if quincunx1 and quincunx2 and sextile:
-                        avg_orb = (quincunx1['orb'] + quincunx2['orb'] +
-                                 sextile['orb']) / 3
-                        
-                        yods.append(Pattern(
-                            type='yod',
-                            planets=[p1_name, p2_name, p3_name],
-                            aspects=[quincunx1, quincunx2, sextile],
-                            quality='mutable',  # Yods are generally mutable
-                            orb=avg_orb,
-                            power=self._calculate_pattern_power(
-                                'yod',
-                                [p1_data, p2_data, p3_data],
-                                avg_orb
-                            )
-                        ))
-        
+        arrays = arrays or _ChartArrays.from_chart(chart, max_orb)
+        quincunx_orbs = arrays.orb['quincunx']
+        sextile_orbs = arrays.orb['sextile']
+        quincunx_applying = arrays.applying['quincunx']
+        sextile_applying = arrays.applying['sextile']
+        qx = arrays.mask['quincunx']
+
+        # For each sextile i-j, every apex k quincunx to both ends.
+        sextiles = np.argwhere(np.triu(arrays.mask['sextile'], 1))
+        apexes = np.argwhere(qx[sextiles[:, 0]] & qx[sextiles[:, 1]])
+        for (i, j), k in zip(sextiles[apexes[:, 0]].tolist(), apexes[:, 1].tolist()):
+            p1_data, p2_data, p3_data = arrays.data[i], arrays.data[j], arrays.data[k]
+
+            quincunx1 = self._aspect_entry(p1_data, p3_data, 150, float(quincunx_orbs[i, k]), bool(quincunx_applying[i, k]))
+            quincunx2 = self._aspect_entry(p2_data, p3_data, 150, float(quincunx_orbs[j, k]), bool(quincunx_applying[j, k]))
+            sextile = self._aspect_entry(p1_data, p2_data, 60, float(sextile_orbs[i, j]), bool(sextile_applying[i, j]))
+            avg_orb = (quincunx1['orb'] + quincunx2['orb'] +
+                     sextile['orb']) / 3
+
+            yods.append(Pattern(
+                type='yod',
+                planets=[arrays.names[i], arrays.names[j], arrays.names[k]],
+                aspects=[quincunx1, quincunx2, sextile],
+                quality='mutable',  # Yods are generally mutable
+                orb=avg_orb,
+                power=self._calculate_pattern_power(
+                    'yod',
+                    [p1_data, p2_data, p3_data],
+                    avg_orb
+                )
+            ))
+
         return sorted(yods, key=lambda x: x.orb)
+
+    def find_grand_sextiles(self, chart: Dict[str, Any],
+                            max_orb: float = 8.0,
+                            arrays: Optional[_ChartArrays] = None) -> List[Pattern]:
+        """Find all grand sextiles (Stars of David) in the chart."""
+        grand_sextiles = []
+        arrays = arrays or _ChartArrays.from_chart(chart, max_orb)
+        sextile = _bitmask_rows(arrays.mask['sextile'])
+        trine = _bitmask_rows(arrays.mask['trine'])
+        opposition = _bitmask_rows(arrays.mask['opposition'])
+
+        # Walk the hexagon p0-p1-...-p5 one sextile at a time. Each step's
+        # candidates are the intersection of the neighbour sets every earlier
+        # vertex requires (sextile, trine or opposition), so the search stays
+        # tiny however many planets the chart has. p0 is the lowest index in
+        # the hexagon and p1 < p5 picks one of its two traversal directions.
+        for p0 in range(len(arrays.names)):
+            above = ~((1 << (p0 + 1)) - 1)
+            for p1 in _iter_bits(sextile[p0] & above):
+                for p2 in _iter_bits(sextile[p1] & trine[p0] & above):
+                    for p3 in _iter_bits(sextile[p2] & trine[p1] & opposition[p0] & above):
+                        for p4 in _iter_bits(sextile[p3] & trine[p2] & opposition[p1] & trine[p0] & above):
+                            last = sextile[p4] & trine[p3] & opposition[p2] & trine[p1] & sextile[p0]
+                            for p5 in _iter_bits(last & ~((1 << (p1 + 1)) - 1)):
+                                grand_sextiles.append(self._grand_sextile(arrays, [p0, p1, p2, p3, p4, p5]))
+
+        return sorted(grand_sextiles, key=lambda x: x.orb)
+
+    def _grand_sextile(self, arrays: _ChartArrays, ring: List[int]) -> Pattern:
+        """Builds the Pattern for six planets in hexagon order."""
+        data = [arrays.data[i] for i in ring]
+        aspects = [
+            self._aspect_entry(
+                data[a], data[b], degree,
+                float(arrays.orb[name][ring[a], ring[b]]), bool(arrays.applying[name][ring[a], ring[b]])
+            )
+            for a, b, degree, name in _GRAND_SEXTILE_EDGES
+        ]
+        avg_orb = sum(a['orb'] for a in aspects) / len(aspects)
+        elements = sorted({int(arrays.element[i]) for i in ring} - {NO_CODE})
+
+        return Pattern(
+            type='grand_sextile',
+            planets=[arrays.names[i] for i in ring],
+            aspects=aspects,
+            quality='/'.join(ELEMENTS[e] for e in elements),
+            orb=avg_orb,
+            power=self._calculate_pattern_power('grand_sextile', data, avg_orb)
+        )
     
     def _check_aspect(self, planet1: Dict, planet2: Dict,
                      aspect_degree: float, max_orb: float) -> Optional[Dict]:
@@ -190,77 +390,48 @@ class PatternService:
             
         orb = abs(diff - aspect_degree)
         if orb <= max_orb:
-            return {
-                'aspect_type': self._get_aspect_type(aspect_degree),
-                'degree': aspect_degree,
-                'orb': orb,
-                'applying': self._is_aspect_applying(
-                    planet1['speed'],
-                    planet2['speed'],
-                    planet1['longitude'],
-                    planet2['longitude'],
-                    aspect_degree
-                )
-            }
+            return self._aspect_entry(planet1, planet2, aspect_degree, orb)
         return None
+
+    def _aspect_entry(self, planet1: Dict, planet2: Dict,
+                      aspect_degree: float, orb: float,
+                      applying: Optional[bool] = None) -> Dict:
+        """
+        Builds the aspect dict for a pair already known to be within orb.
+        Pattern finders pass `applying` from the precomputed chart arrays.
+        """
+        if applying is None:
+            applying = self._is_aspect_applying(
+                planet1['speed'],
+                planet2['speed'],
+                planet1['longitude'],
+                planet2['longitude'],
+                aspect_degree
+            )
+        return {
+            'aspect_type': self._get_aspect_type(aspect_degree),
+            'degree': aspect_degree,
+            'orb': orb,
+            'applying': applying
+        }
     
     def _get_element(self, sign: str) -> str:
         """Get element of a sign."""
-        elements = {
-            'aries': 'fire', 'leo': 'fire', 'sagittarius': 'fire',
-            'taurus': 'earth', 'virgo': 'earth', 'capricorn': 'earth',
-            'gemini': 'air', 'libra': 'air', 'aquarius': 'air',
-            'cancer': 'water', 'scorpio': 'water', 'pisces': 'water'
-        }
-        return elements[sign.lower()]
+        return ELEMENTS[ELEMENT_OF[sign.lower()]]
     
     def _get_modality(self, sign: str) -> str:
         """Get modality of a sign."""
-        modalities = {
-            'aries': 'cardinal', 'cancer': 'cardinal',
-            'libra': 'cardinal', 'capricorn': 'cardinal',
-            'taurus': 'fixed', 'leo': 'fixed',
-            'scorpio': 'fixed', 'aquarius': 'fixed',
-            'gemini': 'mutable', 'virgo': 'mutable',
-            'sagittarius': 'mutable', 'pisces': 'mutable'
-        }
-        return modalities[sign.lower()]
+        return MODALITIES[MODALITY_OF[sign.lower()]]
     
     def _get_aspect_type(self, degree: float) -> str:
         """Get aspect type from degree."""
-        aspects = {
-            0: 'conjunction',
-            60: 'sextile',
-            90: 'square',
-            120: 'trine',
-            150: 'quincunx',
-            180: 'opposition'
-        }
-        return aspects.get(degree, 'unknown')
+        return ASPECT_TYPE_OF.get(degree, 'unknown')
     
     def _is_aspect_applying(self, speed1: float, speed2: float,
                           lon1: float, lon2: float,
                           aspect_degree: float) -> bool:
         """Determine if aspect is applying or separating."""
-        relative_speed = speed1 - speed2
-        
-        # Calculate current angular separation
-        diff = lon1 - lon2
-        if diff > 180:
-            diff -= 360
-        elif diff < -180:
-            diff += 360
-            
-        # For aspects other than conjunction
-        if aspect_degree > 0:
-            target_diff = aspect_degree
-            if diff > 0:
-                target_diff = -aspect_degree
-        else:
-            target_diff = 0
-        
-        # If moving towards the aspect
-        return abs(diff - target_diff) > abs(diff + relative_speed - target_diff)
+        return _applying_scalar(speed1, speed2, lon1, lon2, aspect_degree)
     
     def _calculate_pattern_power(self, pattern_type: str,
                                planet_data: List[Dict],
@@ -293,33 +464,23 @@ class PatternService:
     def calculate_harmonic_patterns(self, chart: Dict[str, Any],
                                   harmonic: int) -> Dict[str, Any]:
         """Calculate harmonic patterns and resonances."""
-        harmonic_positions = {}
-        
-        # Calculate harmonic positions
-        for planet, data in chart['planets'].items():
-            # Multiply longitude by harmonic number and reduce
-            harm_lon = (data['longitude'] * harmonic) % 360
-            harmonic_positions[planet] = harm_lon
-        
-        # Find conjunctions in harmonic chart
-        conjunctions = []
-        planets = list(harmonic_positions.items())
-        
-        for i in range(len(planets) - 1):
-            for j in range(i + 1, len(planets)):
-                p1_name, p1_lon = planets[i]
-                p2_name, p2_lon = planets[j]
-                
-                diff = abs(p1_lon - p2_lon)
-                if diff > 180:
-                    diff = 360 - diff
-                    
-                if diff <= 10:  # Use 10° orb for harmonics
-                    conjunctions.append({
-                        'planets': [p1_name, p2_name],
-                        'degrees': [p1_lon, p2_lon],
-                        'orb': diff
-                    })
+        planets = _PlanetsSoA.of(chart)
+        names = planets.names
+
+        # Multiply every longitude by the harmonic number and reduce
+        harm_lon = (planets.lon * harmonic) % 360
+        harmonic_positions = dict(zip(names, harm_lon.tolist()))
+
+        # Find conjunctions in harmonic chart: all pairs at once, in (i < j) order
+        diff = np.abs(harm_lon[:, None] - harm_lon[None, :])
+        diff = np.minimum(diff, 360 - diff)
+        pair_i, pair_j = np.nonzero(np.triu(diff <= 10, 1))  # Use 10° orb for harmonics
+        lons = harm_lon.tolist()
+        conjunctions = [{
+            'planets': [names[i], names[j]],
+            'degrees': [lons[i], lons[j]],
+            'orb': orb
+        } for i, j, orb in zip(pair_i.tolist(), pair_j.tolist(), diff[pair_i, pair_j].tolist())]
         
         return {
             'harmonic': harmonic,
@@ -6,7 +6,7 @@ Orchestrates multiple astrological services to generate a personalized forecast
 for a user by comparing their natal chart to current cosmic events.
 """
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timezone
 
 # --- REUSE our existing, powerful services ---
@@ -18,6 +18,29 @@ from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
 
+# Shared fallback for transits without a written interpretation; never mutated.
+DEFAULT_TRANSIT_INTERPRETATION = {
+    "title": "General Influence",
+    "impact": "low",
+    "areas": ["general"],
+    "advice": "A background cosmic energy is present. Be mindful of its themes."
+}
+
+
+def _split_interpretation_key(key: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Splits a 'transiting_{planet}_{aspect}_natal_{point}' content key into its
+    (planet, aspect, point) parts, or None if the key has another shape.
+    """
+    if not key.startswith("transiting_") or "_natal_" not in key:
+        return None
+    transit_part, natal_point = key[len("transiting_"):].rsplit("_natal_", 1)
+    if "_" not in transit_part:
+        return None
+    transiting_planet, aspect_name = transit_part.rsplit("_", 1)
+    return transiting_planet, aspect_name, natal_point
+
+
 class PersonalForecastService:
     """
     A singleton service that generates personalized daily insights for users.
@@ -30,6 +53,13 @@ class PersonalForecastService:
         self.interpretations = content.get("aspect_interpretations", {})
         if not self.interpretations:
             raise RuntimeError("Could not load personal forecast interpretation content.")
+        # The same interpretations keyed by (planet, aspect, point), so lookups
+        # hash a tuple instead of formatting a key string per transit.
+        self._interp_by_aspect: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        for key, interpretation in self.interpretations.items():
+            parts = _split_interpretation_key(key)
+            if parts:
+                self._interp_by_aspect[parts] = interpretation
         logger.info("PersonalForecastService initialized successfully.")
 
     def get_personal_sky_for_today(self, db: Session, user_id: int) -> Dict[str, Any]:
@@ -67,14 +97,11 @@ class PersonalForecastService:
             # Step 3: Add personalized interpretations to the most significant transits.
             significant_transits = []
             for aspect in transit_result.get("predictive_analysis", {}).get("active_transit_aspects", []):
-                # Create a key to look up in our content file
-                key = f"transiting_{aspect['transiting_planet'].lower()}_{aspect['aspect_name'].lower()}_natal_{aspect['natal_point'].lower()}"
-                interpretation = self.interpretations.get(key, {
-                    "title": "General Influence",
-                    "impact": "low",
-                    "areas": ["general"],
-                    "advice": "A background cosmic energy is present. Be mindful of its themes."
-                })
+                # Look up the interpretation for this (planet, aspect, point)
+                interpretation = self._interp_by_aspect.get(
+                    (aspect['transiting_planet'].lower(), aspect['aspect_name'].lower(), aspect['natal_point'].lower()),
+                    DEFAULT_TRANSIT_INTERPRETATION
+                )
                 aspect_with_interp = {**aspect, "interpretation": interpretation}
                 significant_transits.append(aspect_with_interp)
 
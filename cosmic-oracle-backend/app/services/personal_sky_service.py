@@ -7,13 +7,14 @@ moon, planetary hours, etc.) to build a complete data object for the user's
 personalized dashboard.
 """
 import logging
+from bisect import bisect_right
 from typing import Dict, Any
 from sqlalchemy.orm import Session
 from datetime import datetime, timezone, time
 
 # --- REUSE our existing, powerful services ---
 from app.repositories import birth_chart_repository
-from app.services.predictive_service import transit_forecasting_service_instance
+from app.services.predictive_service import get_cached_natal_chart, transit_forecasting_service_instance
 from app.services.moon_service import moon_service_instance
 from app.services.planetary_hours_service import planetary_hours_service_instance
 from app.services.ai_synthesis_service import ai_synthesis_service_instance
@@ -59,17 +60,19 @@ class PersonalSkyService:
             
             # Get current moon phase and which natal house it's in
             moon_details = moon_service_instance.get_moon_details(now_utc)
-            # This requires a natal chart calculation to find the house
-            from app.services.astrology_service import get_natal_chart_details
-            temp_chart = get_natal_chart_details(**natal_data)
-            moon_details['house'] = temp_chart.get('points', {}).get('Moon', {}).get('house')
+            # This requires the natal chart to find the house; it is cached per set of birth data
+            natal_chart = get_cached_natal_chart(natal_data)
+            moon_details['house'] = natal_chart.get('points', {}).get('Moon', {}).get('house')
             
             # Get planetary hours for today
             hours_schedule = planetary_hours_service_instance.calculate_hours_for_day(today_date, natal_data['latitude'], natal_data['longitude'])
             
-            # Find the current and next planetary hour
-            current_hour = next((h for h in hours_schedule.get('planetary_hours_schedule', []) if datetime.fromisoformat(h['start_time_utc']) <= now_utc < datetime.fromisoformat(h['end_time_utc'])), None)
-            next_hour = next((h for h in hours_schedule.get('planetary_hours_schedule', []) if datetime.fromisoformat(h['start_time_utc']) > now_utc), None)
+            # Find the current and next planetary hour by bisecting the hour start times
+            schedule = hours_schedule.get('planetary_hours_schedule', [])
+            now_ts = now_utc.timestamp()
+            idx = bisect_right([h['start_ts'] for h in schedule], now_ts) - 1
+            current_hour = schedule[idx] if idx >= 0 and now_ts < schedule[idx]['end_ts'] else None
+            next_hour = schedule[idx + 1] if idx + 1 < len(schedule) else None
 
             # 3. Assemble the complete data object.
             dashboard_payload = {
@@ -3,15 +3,22 @@
 Planetary Hours Calculation Service
 """
 import logging
-from datetime import datetime, time, timedelta, timezone
+from datetime import date
+from functools import lru_cache
 from typing import Dict, Any, List
 
-from skyfield.almanac import sunrise_sunset
-from app.services.moon_service import moon_service_instance # Reusing its skyfield instance
+from app.services.moon_service import ( # Shares its sunrise/sunset cache
+    moon_service_instance, SUN_EVENTS_WINDOW_HOURS, SUN_EVENTS_WIDE_WINDOW_HOURS
+)
 from app.services.content_fetch_service import get_planetary_hours_content
 
 logger = logging.getLogger(__name__)
 
+# Schedules are cached per day for locations rounded to 0.01 degrees (~1 km):
+# sunrise and sunset shift by only seconds across such a cell.
+LOCATION_ROUNDING_DECIMALS = 2
+HOURS_CACHE_MAXSIZE = 4096
+
 class PlanetaryHoursService:
     """A singleton service for calculating planetary hours."""
     _instance = None
@@ -26,63 +33,77 @@ class PlanetaryHoursService:
         logger.info("PlanetaryHoursService initialized successfully.")
 
     def calculate_hours_for_day(self, target_date: date, latitude: float, longitude: float) -> Dict[str, Any]:
-        """Calculates the full 24 planetary hours for a given date and location."""
+        """
+        Calculates the full 24 planetary hours for a given date and location.
+        Results are cached per (date, location rounded to ~1 km); callers receive their own copy.
+        """
         try:
-            observer = moon_service_instance.eph['earth'] + moon_service_instance.wgs84.latlon(latitude, longitude)
-            ts = moon_service_instance.ts
-            
-            # Create a 48-hour window around the target date to find all relevant sunrises/sunsets
-            start_t = ts.from_datetime(datetime.combine(target_date, time.min, tzinfo=timezone.utc) - timedelta(days=1))
-            end_t = ts.from_datetime(datetime.combine(target_date, time.max, tzinfo=timezone.utc) + timedelta(days=1))
-            
-            t, y = sunrise_sunset(moon_service_instance.eph, observer, start_t, end_t)
-            
+            cached = self._cached_hours(
+                target_date,
+                round(latitude, LOCATION_ROUNDING_DECIMALS),
+                round(longitude, LOCATION_ROUNDING_DECIMALS),
+            )
+            # The hour dicts hold only flat values apart from the shared,
+            # read-only interpretation, so shallow copies are enough.
+            result = dict(cached)
+            if "planetary_hours_schedule" in result:
+                result["planetary_hours_schedule"] = [dict(hour) for hour in cached["planetary_hours_schedule"]]
+            return result
+        except Exception as e:
+            logger.error(f"Error calculating planetary hours: {e}", exc_info=True)
+            return {"error": "An internal error occurred during calculation."}
+
+    @lru_cache(maxsize=HOURS_CACHE_MAXSIZE)
+    def _cached_hours(self, target_date: date, latitude: float, longitude: float) -> Dict[str, Any]:
+        """
+        Computes the schedule for one (date, quantized location). Exceptions
+        propagate so that transient failures are never cached.
+        """
+        # Sunrises/sunsets after the start of the day, shared with other services via
+        # MoonService. The short window usually suffices; widen it if an event is missing.
+        for window_hours in (SUN_EVENTS_WINDOW_HOURS, SUN_EVENTS_WIDE_WINDOW_HOURS):
+            events = moon_service_instance.get_sunrise_sunset(target_date, latitude, longitude, window_hours)
+
             # Find the sunrise that starts the desired day
-            today_sunrise = None
-            for ti, yi in zip(t, y):
-                if yi and ti.to_datetime().date() == target_date:
-                    today_sunrise = ti.to_datetime()
-                    break
-            if not today_sunrise: return {"error": "Could not determine sunrise for the target date."}
-            
+            today_sunrise = next((ti for ti, is_sunrise in events if is_sunrise and ti.date() == target_date), None)
+
             # Find the subsequent sunset and the next day's sunrise
-            today_sunset = next((ti.to_datetime() for ti, yi in zip(t, y) if not yi and ti.to_datetime() > today_sunrise), None)
-            next_sunrise = next((ti.to_datetime() for ti, yi in zip(t, y) if yi and ti.to_datetime() > today_sunset), None)
-            
-            if not today_sunset or not next_sunrise: return {"error": "Could not determine the full day/night cycle."}
-            
-            # Calculate durations
-            day_hour_duration = (today_sunset - today_sunrise) / 12
-            night_hour_duration = (next_sunrise - today_sunset) / 12
-            
-            day_ruler = self.day_rulers[today_sunrise.weekday()]
-            first_hour_ruler_index = self.chaldean_order.index(day_ruler)
-            
-            all_hours = []
-            # Day Hours
-            for i in range(12):
-                ruler = self.chaldean_order[(first_hour_ruler_index + i) % 7]
-                all_hours.append({
-                    "hour_number": i + 1, "type": "Day", "ruler": ruler,
-                    "start_time_utc": (today_sunrise + i * day_hour_duration).isoformat(),
-                    "end_time_utc": (today_sunrise + (i + 1) * day_hour_duration).isoformat(),
-                    "interpretation": self.interpretations.get(ruler)
-                })
-            # Night Hours
+            today_sunset = today_sunrise and next((ti for ti, is_sunrise in events if not is_sunrise and ti > today_sunrise), None)
+            next_sunrise = today_sunset and next((ti for ti, is_sunrise in events if is_sunrise and ti > today_sunset), None)
+            if next_sunrise:
+                break
+
+        if not today_sunrise: return {"error": "Could not determine sunrise for the target date."}
+        if not today_sunset or not next_sunrise: return {"error": "Could not determine the full day/night cycle."}
+        
+        # Calculate durations
+        day_hour_duration = (today_sunset - today_sunrise) / 12
+        night_hour_duration = (next_sunrise - today_sunset) / 12
+        
+        day_ruler = self.day_rulers[today_sunrise.weekday()]
+        first_hour_ruler_index = self.chaldean_order.index(day_ruler)
+        
+        # Each half of the cycle has 13 hour boundaries, computed and formatted
+        # once and shared by adjacent hours. Hours also carry epoch-second bounds
+        # so callers can bisect the schedule.
+        all_hours = []
+        for offset, hour_type, period_start, hour_duration in (
+            (0, "Day", today_sunrise, day_hour_duration),
+            (12, "Night", today_sunset, night_hour_duration),
+        ):
+            boundaries = [period_start + n * hour_duration for n in range(13)]
+            iso = [b.isoformat() for b in boundaries]
+            ts = [b.timestamp() for b in boundaries]
             for i in range(12):
-                ruler = self.chaldean_order[(first_hour_ruler_index + 12 + i) % 7]
+                ruler = self.chaldean_order[(first_hour_ruler_index + offset + i) % 7]
                 all_hours.append({
-                    "hour_number": i + 1, "type": "Night", "ruler": ruler,
-                    "start_time_utc": (today_sunset + i * night_hour_duration).isoformat(),
-                    "end_time_utc": (today_sunset + (i + 1) * night_hour_duration).isoformat(),
+                    "hour_number": i + 1, "type": hour_type, "ruler": ruler,
+                    "start_time_utc": iso[i], "end_time_utc": iso[i + 1],
+                    "start_ts": ts[i], "end_ts": ts[i + 1],
                     "interpretation": self.interpretations.get(ruler)
                 })
-            
-            return {"planetary_hours_schedule": all_hours}
-            
-        except Exception as e:
-            logger.error(f"Error calculating planetary hours: {e}", exc_info=True)
-            return {"error": "An internal error occurred during calculation."}
+        
+        return {"planetary_hours_schedule": all_hours}
 
 try:
     planetary_hours_service_instance = PlanetaryHoursService()
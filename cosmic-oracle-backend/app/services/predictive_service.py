@@ -6,59 +6,175 @@ This service provides predictive astrological calculations, including planetary
 transits and secondary progressions, to analyze current and future trends
 based on a natal chart.
 """
+import functools
 import logging
 import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 
+import numpy as np
+
 # --- REUSE: Import existing services and utilities ---
-from app.services.astrology_service import get_natal_chart_details, astro_data_cache, parse_datetime_with_timezone, convert_to_utc
+from app.services.astrology_service import get_natal_chart_details, astro_data_cache, parse_datetime_with_timezone, convert_to_utc, AstrologyService
+from app.services.numeric_kernels import aspect_applying, aspect_scan
 
 logger = logging.getLogger(__name__)
 
+# Transits are only reported from the 10 traditional planets, within a tight orb.
+TRANSITING_PLANETS = frozenset(["Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn", "Uranus", "Neptune", "Pluto"])
+TRANSIT_ORB_DEGREES = 1.5
+NATAL_CHART_CACHE_MAXSIZE = 512
+
+# Sampling step per transiting planet for exact-transit searches: short enough
+# that a planet only crosses an aspect point and returns between two samples
+# when it stations right on that point.
+TRANSIT_SAMPLE_STEPS = {
+    'moon': timedelta(hours=1),
+    'sun': timedelta(days=1),
+    'mercury': timedelta(days=1),
+    'venus': timedelta(days=1),
+    'mars': timedelta(days=1),
+    'jupiter': timedelta(days=7),
+    'saturn': timedelta(days=7),
+    'uranus': timedelta(days=7),
+    'neptune': timedelta(days=7),
+    'pluto': timedelta(days=7),
+}
+EXACT_TIME_MAX_ITERATIONS = 50
+# Saros cycle length in days, and the start of solar and lunar Saros 1.
+SAROS_DAYS = 6585.3211
+SAROS_SOLAR_REFERENCE = datetime(1685, 2, 22)
+SAROS_LUNAR_REFERENCE = datetime(1685, 2, 8)
+SAROS_CACHE_MAXSIZE = 4096
+# Major aspects searched for exact transits, by angle.
+TRANSIT_ASPECTS = {
+    0: 'conjunction',
+    60: 'sextile',
+    90: 'square',
+    120: 'trine',
+    180: 'opposition'
+}
+
+
+def _natal_key(natal_chart_data: Dict[str, Any]) -> tuple:
+    """Hashable cache key for a natal chart request."""
+    return tuple(sorted(natal_chart_data.items()))
+
+
+class _UncachedChartError(Exception):
+    """Raised from the chart cache so that an error payload is never cached."""
+
+    def __init__(self, result: Dict[str, Any]):
+        super().__init__(result.get("error"))
+        self.result = result
+
+
+@functools.lru_cache(maxsize=NATAL_CHART_CACHE_MAXSIZE)
+def _cached_natal_chart(natal_key: tuple) -> Dict[str, Any]:
+    """
+    The natal chart for one set of birth data. The returned dict is shared and
+    must not be mutated. Raises _UncachedChartError for an error payload.
+    """
+    chart = get_natal_chart_details(**dict(natal_key))
+    if 'error' in chart:
+        raise _UncachedChartError(chart)
+    return chart
+
+
+def get_cached_natal_chart(natal_chart_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    The natal chart for a set of birth data, shared by every service that
+    requests the same data. The returned dict is shared and must not be mutated.
+    Error payloads are returned as they are, without being cached.
+    """
+    try:
+        return _cached_natal_chart(_natal_key(natal_chart_data))
+    except _UncachedChartError as e:
+        return e.result
+
+
+@functools.lru_cache(maxsize=NATAL_CHART_CACHE_MAXSIZE)
+def _cached_natal_points(natal_key: tuple) -> Tuple[Tuple[str, ...], np.ndarray]:
+    """Names and (read-only) longitudes of the natal planets and angles, in chart order."""
+    return _flatten_points(_cached_natal_chart(natal_key))
+
+
+def _flatten_points(chart: Dict[str, Any], only: Optional[frozenset] = None) -> Tuple[Tuple[str, ...], np.ndarray]:
+    """
+    Flattens a chart's planets and angles into names + a (read-only) longitude
+    array, in chart order. With `only`, flattens just the planets named in it.
+    """
+    if only is None:
+        points = list(chart['points'].values()) + list(chart['angles'].values())
+    else:
+        points = [p for p in chart['points'].values() if p['name'] in only]
+    lons = np.array([p['longitude'] for p in points], dtype=np.float64)
+    lons.setflags(write=False)
+    return tuple(p['name'] for p in points), lons
+
+
+@functools.lru_cache(maxsize=SAROS_CACHE_MAXSIZE)
+def _saros_position(eclipse_date: datetime, is_solar: bool) -> Tuple[int, int]:
+    """(series, number within the series) of an eclipse, relative to Saros 1."""
+    reference_date = SAROS_SOLAR_REFERENCE if is_solar else SAROS_LUNAR_REFERENCE
+    days_since_reference = (eclipse_date - reference_date).total_seconds() / 86400
+    saros_cycles = days_since_reference / SAROS_DAYS
+
+    # Calculate series number
+    series = int(saros_cycles) + 1
+
+    # Calculate where in the series this eclipse falls
+    number = int((saros_cycles % 1) * 75) + 1  # Each series has about 75 eclipses
+    return series, number
+
 class PredictiveService:
     def __init__(self, astronomical_service):
         self.astronomical = astronomical_service
 
 # --- Transit Calculation Logic ---
-    def _calculate_transit_aspects(self, natal_chart: Dict[str, Any], transit_chart: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _calculate_transit_aspects(
+        self,
+        natal_chart: Dict[str, Any],
+        transit_chart: Dict[str, Any],
+        natal_points: Optional[Tuple[Tuple[str, ...], np.ndarray]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Private helper to calculate aspects between transiting planets and natal planets/angles.
 
         Args:
             natal_chart: Dictionary containing the natal chart data
             transit_chart: Dictionary containing the transit chart data
+            natal_points: Cached (names, longitudes) of the natal points; derived
+                from `natal_chart` when not given.
 
         Returns:
             List of aspect dictionaries
         """
         aspect_list = []
-        transiting_points = list(transit_chart['points'].values())
-        natal_points = list(natal_chart['points'].values()) + list(natal_chart['angles'].values())
-        aspect_definitions = astro_data_cache.aspects
-
-        for t_point in transiting_points:
-            # We only care about transits from the 10 traditional planets
-            if t_point['name'] not in ["Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn", "Uranus", "Neptune", "Pluto"]:
-                continue
-                
-            for n_point in natal_points:
-                separation = abs(t_point['longitude'] - n_point['longitude'])
-                if separation > 180:
-                    separation = 360 - separation
-
-                for aspect_name, aspect_info in aspect_definitions.items():
-                    # For transits, we use a much tighter orb, typically 1 degree.
-                    if abs(separation - aspect_info["degrees"]) <= 1.5:
-                        aspect_list.append({
-                            "transiting_planet": t_point['name'],
-                            "natal_point": n_point['name'],
-                            "aspect_name": aspect_name,
-                            "aspect_symbol": aspect_info["symbol"],
-                            "orb_degrees": round(abs(separation - aspect_info["degrees"]), 3),
-                        })
+        # We only care about transits from the 10 traditional planets
+        transit_names, transit_lons = _flatten_points(transit_chart, TRANSITING_PLANETS)
+        natal_names, natal_lons = natal_points or _flatten_points(natal_chart)
+        aspect_names, aspect_degrees, aspect_orbs, aspect_symbols = astro_data_cache.aspect_arrays
+
+        # Every transiting x natal x aspect combination in one compiled pass.
+        # For transits, we use a much tighter orb, typically 1 degree.
+        t_idx, n_idx, a_idx, orbs = aspect_scan(
+            transit_lons, natal_lons, aspect_degrees, aspect_orbs, TRANSIT_ORB_DEGREES,
+        )
+        # Order the hits by rounded orb before building any dicts.
+        rounded_orbs = [round(orb, 3) for orb in orbs.tolist()]
+        order = np.argsort(np.array(rounded_orbs, dtype=np.float64), kind='stable').tolist()
+        t_idx, n_idx, a_idx = t_idx.tolist(), n_idx.tolist(), a_idx.tolist()
+        for i in order:
+            aspect_list.append({
+                "transiting_planet": transit_names[t_idx[i]],
+                "natal_point": natal_names[n_idx[i]],
+                "aspect_name": aspect_names[a_idx[i]],
+                "aspect_symbol": aspect_symbols[a_idx[i]],
+                "orb_degrees": rounded_orbs[i],
+            })
         
-        return sorted(aspect_list, key=lambda x: x['orb_degrees'])
+        return aspect_list
 
     def analyze_transits(
         self,
@@ -83,13 +199,14 @@ class PredictiveService:
         """
         logger.info(f"Predictive service: calculating transits for {transit_datetime_str}.")
         try:
-            # Step 1: Generate the user's natal chart.
-            natal_chart = get_natal_chart_details(**natal_chart_data)
+            # Step 1: Generate the user's natal chart (cached per set of birth data).
+            natal_chart = get_cached_natal_chart(natal_chart_data)
             if 'error' in natal_chart:
                 return {"error": f"Could not calculate base natal chart: {natal_chart['error']}"}
 
-            # Step 2: Generate the chart for the transit moment.
-            transit_chart = get_natal_chart_details(
+            # Step 2: Generate the planetary points for the transit moment; the
+            # angles, aspects and analysis of a full chart are not needed.
+            transit_chart = AstrologyService().get_transit_points(
                 datetime_str=transit_datetime_str,
                 timezone_str=timezone_str,
                 latitude=latitude,
@@ -100,7 +217,7 @@ class PredictiveService:
                 return {"error": f"Could not calculate transit chart: {transit_chart['error']}"}
 
             # Step 3: Perform the transit calculations.
-            transit_aspects = self._calculate_transit_aspects(natal_chart, transit_chart)
+            transit_aspects = self._calculate_transit_aspects(natal_chart, transit_chart, _cached_natal_points(_natal_key(natal_chart_data)))
 
             return {
                 "predictive_analysis": {
@@ -109,7 +226,7 @@ class PredictiveService:
                     "active_transit_aspects": transit_aspects,
                 },
                 "transit_chart_positions": transit_chart['points'],
-                "natal_chart_used": natal_chart['chart_info'],
+                "natal_chart_used": dict(natal_chart['chart_info']),
             }
 
         except Exception as e:
@@ -137,13 +254,14 @@ class PredictiveService:
             if not birth_dt_aware:
                 return {"error": "Invalid birth data provided."}
 
-            # Step 2: Calculate the progressed date (N days after birth for Nth year).
-            progressed_dt_aware = birth_dt_aware + datetime.timedelta(days=target_age)
+            # Step 2: Calculate the progressed moment (N days after birth for Nth year).
+            # The arithmetic is done in UTC, so no DST transition can shift it.
+            progressed_dt_utc = convert_to_utc(birth_dt_aware) + timedelta(days=target_age)
+            progressed_dt_aware = birth_dt_aware + timedelta(days=target_age)
             
-            # Step 3: Generate the chart for the progressed moment. Location remains the same as birth.
-            progressed_chart = get_natal_chart_details(
-                datetime_str=progressed_dt_aware.isoformat(),
-                timezone_str=natal_chart_data['timezone_str'], # Keep original timezone for correct UTC conversion
+            # Step 3: Generate the planets for the progressed moment. Location remains the same as birth.
+            progressed_chart = AstrologyService().get_chart_points_for_utc(
+                progressed_dt_utc,
                 latitude=natal_chart_data['latitude'],
                 longitude=natal_chart_data['longitude'],
                 house_system="Placidus"
@@ -175,187 +293,212 @@ class PredictiveService:
                          start_date: datetime,
                          end_date: datetime,
                          orb: float = 1.0) -> List[Dict[str, Any]]:
-        """Calculate exact transit times with high precision."""
+        """
+        Calculate exact transit times with high precision.
+
+        Each transiting planet is sampled on its own grid (hourly for the Moon,
+        up to weekly for the outer planets). Between adjacent samples, the signed
+        offset of the planet from every natal aspect point is checked for a sign
+        change, and only those brackets are refined to the exact time. As with
+        an hourly walk through the range, an aspect is reported when the planet
+        comes within `orb` degrees of exact at one of the hours from the start.
+        """
+        if end_date < start_date:
+            return []
+        targets = self._aspect_targets(birth_chart)
+        exact_days, transits = [], []
+        # Planets are scanned one after another: pyswisseph holds the GIL and
+        # keeps global state, so threads would only add contention.
+        for tr_planet in TRANSIT_SAMPLE_STEPS:
+            planet_days, planet_transits = self._scan_planet(tr_planet, targets, start_date, end_date, orb)
+            exact_days.append(planet_days)
+            transits.extend(planet_transits)
+        # Order by exact time, sorting the day offsets rather than the dicts.
+        order = np.argsort(np.concatenate(exact_days), kind='stable')
+        return [transits[i] for i in order.tolist()]
+
+    @staticmethod
+    def _aspect_targets(birth_chart: Dict[str, Any]) -> Tuple[List[Tuple[str, int]], np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Every natal longitude a major aspect is exact at: both sides of each
+        natal planet, except for the conjunction and opposition.
+
+        Returns:
+            ([(natal planet, aspect degree)], target longitudes, natal
+            longitudes, aspect degrees), one entry per target.
+        """
+        keys, target_lons, natal_lons = [], [], []
+        for natal_planet, natal_pos in birth_chart['planets'].items():
+            for aspect_deg in TRANSIT_ASPECTS:
+                for side in ((1,) if aspect_deg in (0, 180) else (1, -1)):
+                    keys.append((natal_planet, aspect_deg))
+                    target_lons.append((natal_pos['longitude'] + side * aspect_deg) % 360)
+                    natal_lons.append(natal_pos['longitude'])
+        return (
+            keys,
+            np.array(target_lons, dtype=np.float64),
+            np.array(natal_lons, dtype=np.float64),
+            np.array([deg for _, deg in keys], dtype=np.float64),
+        )
+
+    def _scan_planet(self, tr_planet: str,
+                     targets: Tuple[List[Tuple[str, int]], np.ndarray, np.ndarray, np.ndarray],
+                     start_date: datetime,
+                     end_date: datetime,
+                     orb: float) -> Tuple[np.ndarray, List[Dict[str, Any]]]:
+        """
+        Find every exact transit of one planet to the natal aspect targets in
+        the range that comes within `orb` of exact on the hourly grid. Returns the exact times as day offsets from `start_date`
+        alongside the transit dicts, in the same order.
+        """
+        keys, target_lons, natal_lons_by_target, aspect_degs_by_target = targets
+
+        # Sample the planet across the range, end inclusive, in one batch of
+        # Julian Days; times are kept as day offsets from the start of the range.
+        start_jd = self.astronomical._get_julian_day(start_date)
+        span_days = (end_date - start_date).total_seconds() / 86400.0
+        step_days = TRANSIT_SAMPLE_STEPS[tr_planet].total_seconds() / 86400.0
+        day_offsets = np.arange(int(span_days / step_days) + 1) * step_days
+        if day_offsets[-1] < span_days:
+            day_offsets = np.append(day_offsets, span_days)
+        positions = self.astronomical.get_planet_positions(tr_planet, start_jd + day_offsets)
+        lons, speeds = positions[:, 0], positions[:, 1]
+
+        # Signed offset from each target in [-180, 180), shape (targets, samples).
+        offsets = (lons[None, :] - target_lons[:, None] + 180.0) % 360.0 - 180.0
+        # A crossing is a sign change between samples that is not the jump
+        # at the opposite point, where the offset wraps from +180 to -180.
+        crossed = ((offsets[:, :-1] <= 0) != (offsets[:, 1:] <= 0)) & (np.abs(offsets[:, 1:] - offsets[:, :-1]) < 180.0)
+
+        hits = np.argwhere(crossed)
+        if not len(hits):
+            return np.empty(0), []
+        target_idx, k = hits[:, 0], hits[:, 1]
+        exact = np.array([
+            self._find_exact_aspect_time(
+                tr_planet, float(target_lons[t]), start_jd,
+                float(day_offsets[i]), float(day_offsets[i + 1]),
+                float(offsets[t, i]), float(offsets[t, i + 1])
+            )
+            for t, i in zip(target_idx.tolist(), k.tolist())
+        ], dtype=np.float64).reshape(-1, 3)
+
+        # Keep the crossings the planet passes within `orb` of exact at a whole
+        # hour from the start: the nearest hour is at most half an hour of
+        # motion away from the exact time.
+        hours = exact[:, 0] * 24.0
+        to_nearest_hour = np.minimum(hours - np.floor(hours), np.ceil(hours) - hours)
+        within = to_nearest_hour * np.abs(exact[:, 2]) / 24.0 < orb
+        if not within.any():
+            return np.empty(0), []
+        exact, target_idx, k = exact[within], target_idx[within], k[within]
+
+        # Orb at the exact time and whether the aspect was applying at the
+        # start of its bracket, for every crossing at once.
+        natal_lons = natal_lons_by_target[target_idx]
+        aspect_degs = aspect_degs_by_target[target_idx]
+        diff = np.abs(exact[:, 1] - natal_lons)
+        diff = np.minimum(diff, 360.0 - diff)
+        exact_orbs = np.abs(diff - aspect_degs)
+        applying = aspect_applying(
+            speeds[k], np.zeros(len(k)), lons[k], natal_lons, aspect_degs
+        )
+
         transits = []
-        check_points = ['sun', 'moon', 'mercury', 'venus', 'mars',
-                       'jupiter', 'saturn', 'uranus', 'neptune', 'pluto']
-        
-        # Define major aspects to check
-        aspects = {
-            0: 'conjunction',
-            60: 'sextile',
-            90: 'square',
-            120: 'trine',
-            180: 'opposition'
-        }
-        
-        current = start_date
-        while current <= end_date:
-            # Get transit positions
-            transit_positions = {}
-            for planet in check_points:
-                pos = self.astronomical.get_planet_position(planet, current)
-                transit_positions[planet] = pos
-            
-            # Check aspects to natal planets
-            for tr_planet, tr_pos in transit_positions.items():
-                for natal_planet, natal_pos in birth_chart['planets'].items():
-                    # Calculate angular separation
-                    diff = abs(tr_pos['longitude'] - natal_pos['longitude'])
-                    if diff > 180:
-                        diff = 360 - diff
-                    
-                    # Check each aspect
-                    for aspect_deg, aspect_name in aspects.items():
-                        if abs(diff - aspect_deg) < orb:
-                            # Found an aspect - calculate exact timing
-                            exact_time = self._find_exact_aspect_time(
-                                tr_planet, natal_planet,
-                                natal_pos['longitude'],
-                                current, aspect_deg
-                            )
-                            
-                            transits.append({
-                                'transit_planet': tr_planet,
-                                'natal_planet': natal_planet,
-                                'aspect': aspect_name,
-                                'aspect_degree': aspect_deg,
-                                'exact_time': exact_time,
-                                'orb': abs(diff - aspect_deg),
-                                'transit_speed': tr_pos['speed'],
-                                'is_applying': self._is_aspect_applying(
-                                    tr_pos['speed'],
-                                    tr_pos['longitude'],
-                                    natal_pos['longitude'],
-                                    aspect_deg
-                                )
-                            })
-            
-            current += timedelta(hours=1)
-        
-        return sorted(transits, key=lambda x: x['exact_time'])
+        for n, t in enumerate(target_idx.tolist()):
+            natal_planet, aspect_deg = keys[t]
+            transits.append({
+                'transit_planet': tr_planet,
+                'natal_planet': natal_planet,
+                'aspect': TRANSIT_ASPECTS[aspect_deg],
+                'aspect_degree': aspect_deg,
+                'exact_time': start_date + timedelta(days=float(exact[n, 0])),
+                'orb': float(exact_orbs[n]),
+                'transit_speed': float(exact[n, 2]),
+                # Judged at the start of the bracket, as the aspect perfects.
+                'is_applying': bool(applying[n])
+            })
+        return exact[:, 0], transits
 
     def _find_exact_aspect_time(self,
-                             transit_planet: str,
-                             natal_planet: str,
-                               natal_longitude: float,
-                               approx_time: datetime,
-                               aspect_degree: float,
-                               precision: float = 0.0001) -> datetime:
-        """Find exact time of aspect using binary search."""
-        lower = approx_time - timedelta(hours=12)
-        upper = approx_time + timedelta(hours=12)
-        
-        while (upper - lower) > timedelta(seconds=1):
-            mid = lower + (upper - lower) / 2
-            pos = self.astronomical.get_planet_position(transit_planet, mid)
-            
-            diff = abs(pos['longitude'] - natal_longitude)
-            if diff > 180:
-                diff = 360 - diff
-                
-            if abs(diff - aspect_degree) < precision:
-                return mid
-                
-            if diff < aspect_degree:
-                lower = mid
+                                transit_planet: str,
+                                target_longitude: float,
+                                base_jd: float,
+                                lower: float,
+                                upper: float,
+                                lower_offset: float,
+                                upper_offset: float,
+                                precision: float = 0.0001) -> Tuple[float, float, float]:
+        """
+        Find the exact time the planet crosses `target_longitude` within a
+        bracket whose signed offsets have opposite signs. The bracket bounds
+        are in days after `base_jd`.
+
+        Uses the Illinois variant of regula falsi, which converges
+        superlinearly on the near-linear motion within a bracket while never
+        leaving it. Returns the time (in days after `base_jd`) and the
+        planet's longitude and speed at that time.
+        """
+        a, fa = lower, lower_offset
+        b, fb = upper, upper_offset
+        side = 0
+        x, lon, speed = lower, None, None
+
+        for _ in range(EXACT_TIME_MAX_ITERATIONS):
+            x = b - fb * (b - a) / (fb - fa) if fb != fa else (a + b) / 2
+            lon, speed = self.astronomical.get_planet_positions(transit_planet, np.array([base_jd + x]))[0].tolist()
+            fx = (lon - target_longitude + 180.0) % 360.0 - 180.0
+            if abs(fx) < precision or (b - a) * 86400.0 <= 1.0:
+                break
+            if (fx <= 0) == (fb <= 0):
+                b, fb = x, fx
+                if side == -1:
+                    fa /= 2
+                side = -1
             else:
-                upper = mid
-        
-        return lower
-
-    def _is_aspect_applying(transit_speed: float,
-                           transit_lon: float,
-                           natal_lon: float,
-                           aspect_degree: float) -> bool:
-        """Determine if an aspect is applying or separating."""
-        # Calculate shortest distance between the points
-        diff = transit_lon - natal_lon
-        if diff > 180:
-            diff -= 360
-        elif diff < -180:
-            diff += 360
-        
-        # For aspects other than conjunction
-        if aspect_degree > 0:
-            target_diff = aspect_degree
-            if diff > 0:
-                target_diff = -aspect_degree
-        else:
-            target_diff = 0
-        
-        # If moving towards the aspect
-        if abs(diff - target_diff) > abs(diff + transit_speed - target_diff):
-            return True
-        return False
+                a, fa = x, fx
+                if side == 1:
+                    fb /= 2
+                side = 1
+
+        return x, lon, speed
 
-    def calculate_eclipse_series(start_date: datetime,
+    def calculate_eclipse_series(self, start_date: datetime,
                                end_date: datetime) -> List[Dict[str, Any]]:
         """Calculate all eclipses in a period with Saros cycle information."""
         eclipses = []
-        current = start_date
-        
-        while current <= end_date:
-            # Check for solar eclipse
-            solar = self.astronomical.calculate_next_eclipse(current)
-            if solar['next_solar_eclipse']['date'] <= end_date:
+
+        # Solar and lunar eclipses are walked independently, jumping from
+        # each eclipse straight to the search for the next one.
+        for eclipse_type, find_next, is_solar in (
+            ('solar', self.astronomical.calculate_next_solar_eclipse, True),
+            ('lunar', self.astronomical.calculate_next_lunar_eclipse, False),
+        ):
+            current = start_date
+            while current <= end_date:
+                eclipse = find_next(current)
+                if eclipse['date'] > end_date:
+                    break
+
                 # Calculate Saros series
-                saros_data = self._calculate_saros_number(
-                    solar['next_solar_eclipse']['date'],
-                    True  # is_solar
-                )
-                
-                eclipses.append({
-                    'type': 'solar',
-                    'date': solar['next_solar_eclipse']['date'],
-                    'eclipse_type': solar['next_solar_eclipse']['type'],
-                    'saros_series': saros_data['series'],
-                    'saros_number': saros_data['number']
-                })
-                current = solar['next_solar_eclipse']['date'] + timedelta(days=1)
-            
-            # Check for lunar eclipse
-            lunar = self.astronomical.calculate_next_eclipse(current)
-            if lunar['next_lunar_eclipse']['date'] <= end_date:
-                saros_data = self._calculate_saros_number(
-                    lunar['next_lunar_eclipse']['date'],
-                    False  # is_solar
-                )
-                
+                saros_data = self._calculate_saros_number(eclipse['date'], is_solar)
+
                 eclipses.append({
-                    'type': 'lunar',
-                    'date': lunar['next_lunar_eclipse']['date'],
-                    'eclipse_type': lunar['next_lunar_eclipse']['type'],
+                    'type': eclipse_type,
+                    'date': eclipse['date'],
+                    'eclipse_type': eclipse['type'],
                     'saros_series': saros_data['series'],
                     'saros_number': saros_data['number']
                 })
-                current = lunar['next_lunar_eclipse']['date'] + timedelta(days=1)
-            
-            current += timedelta(days=1)
+                current = eclipse['date'] + timedelta(days=1)
         
         return sorted(eclipses, key=lambda x: x['date'])
 
+    @staticmethod
     def _calculate_saros_number(eclipse_date: datetime,
                             is_solar: bool) -> Dict[str, int]:
         """Calculate Saros series and number for an eclipse."""
-        # Saros cycle is approximately 6585.3211 days
-        SAROS_DAYS = 6585.3211
-        
-        # Reference eclipse (Saros 1)
-        if is_solar:
-            reference_date = datetime(1685, 2, 22)  # Saros 1 started
-        else:
-            reference_date = datetime(1685, 2, 8)   # Lunar Saros 1
-        
-        days_since_reference = (eclipse_date - reference_date).total_seconds() / 86400
-        saros_cycles = days_since_reference / SAROS_DAYS
-        
-        # Calculate series number
-        series = int(saros_cycles) + 1
-        
-        # Calculate where in the series this eclipse falls
-        number = int((saros_cycles % 1) * 75) + 1  # Each series has about 75 eclipses
-        
+        series, number = _saros_position(eclipse_date, is_solar)
         return {
             'series': series,
             'number': number
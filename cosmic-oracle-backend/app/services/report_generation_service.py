@@ -2,8 +2,11 @@
 """
 Service for orchestrating the generation of complex PDF reports.
 """
+import io
 import logging
 import os
+import threading
+from string import Template
 from typing import Dict, Any
 
 from sqlalchemy.orm import Session
@@ -18,6 +21,31 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Styles and static report text are built once per worker and shared by every
+# report; only the dynamic values are substituted per report.
+_STYLES = getSampleStyleSheet()
+_H1 = _STYLES['h1']
+_H2 = _STYLES['h2']
+_BODY = _STYLES['Normal']
+
+NATAL_REPORT_TITLE = "Cosmic Oracle Natal Report"
+NATAL_SUN_HEADING = Template("Sun in $sign_name")
+NATAL_SUN_BODY = "Your core identity, ego, and life force are expressed through the lens of this sign..."
+
+# Each worker thread renders into its own reusable in-memory buffer, and the
+# finished PDF is written to disk in one call.
+_tls = threading.local()
+
+
+def _pdf_buffer() -> io.BytesIO:
+    """The calling thread's PDF buffer, emptied for a new report."""
+    buf = getattr(_tls, 'buf', None)
+    if buf is None:
+        buf = _tls.buf = io.BytesIO()
+    buf.seek(0)
+    buf.truncate()
+    return buf
+
 class ReportGenerationService:
     """Orchestrates data gathering and PDF creation for various reports."""
     
@@ -73,25 +101,27 @@ class ReportGenerationService:
         file_name = f"{report_type}_report_{report_id}.pdf"
         file_path = os.path.join(reports_dir, file_name)
 
-        doc = SimpleDocTemplate(file_path, pagesize=letter)
-        styles = getSampleStyleSheet()
+        buf = _pdf_buffer()
+        doc = SimpleDocTemplate(buf, pagesize=letter)
         story = []
 
         # --- Build the PDF content ---
-        story.append(Paragraph("Cosmic Oracle Natal Report", styles['h1']))
+        story.append(Paragraph(NATAL_REPORT_TITLE, _H1))
         story.append(Spacer(1, 24))
         
         # Add Sun Sign info
         sun_data = content.get('chart', {}).get('points', {}).get('Sun', {})
         if sun_data:
-            story.append(Paragraph(f"Sun in {sun_data.get('sign_name')}", styles['h2']))
-            story.append(Paragraph("Your core identity, ego, and life force are expressed through the lens of this sign...", styles['Normal']))
+            story.append(Paragraph(NATAL_SUN_HEADING.substitute(sign_name=sun_data.get('sign_name')), _H2))
+            story.append(Paragraph(NATAL_SUN_BODY, _BODY))
             story.append(Spacer(1, 12))
 
         # Add more sections for Moon, Ascendant, etc.
         # This is where you would loop through all the content and format it.
 
         doc.build(story)
+        with open(file_path, 'wb') as f:
+            f.write(buf.getvalue())
         logger.info(f"Successfully built PDF for report {report_id} at {file_path}")
         return file_path
 
@@ -6,6 +6,7 @@ This service dynamically generates personalized ritual suggestions by fetching
 structured content and merging it with user-specific astrological data.
 """
 import logging
+from functools import lru_cache
 from typing import Dict, Any
 
 # Import the content fetchers for both ritual content and zodiac data
@@ -13,6 +14,9 @@ from app.services.content_fetch_service import get_ritual_content, get_zodiac_si
 
 logger = logging.getLogger(__name__)
 
+# Rituals depend only on (purpose, sign), a small finite set.
+RITUAL_CACHE_MAXSIZE = 256
+
 class RitualGeneratorService:
     """
     A service class to manage the generation of personalized rituals.
@@ -45,6 +49,16 @@ class RitualGeneratorService:
         if zodiac_sign_key not in self.zodiac_data:
             return {"error": f"Invalid zodiac sign '{zodiac_sign_key}' provided."}
 
+        # Callers get their own top-level dict; nested values are shared content.
+        return dict(self._cached_ritual(purpose, zodiac_sign_key))
+
+    @lru_cache(maxsize=RITUAL_CACHE_MAXSIZE)
+    def _cached_ritual(self, purpose: str, zodiac_sign_key: str) -> Dict[str, Any]:
+        """
+        Assembles the ritual for one validated (purpose, sign) pair. The
+        loaded content never changes, so the result is cached for the
+        service's lifetime; it is shared and must not be mutated.
+        """
         # 2. Get the base templates and specific user data
         base_ritual = self.ritual_content["rituals"][purpose]
         sign_data = self.zodiac_data[zodiac_sign_key]
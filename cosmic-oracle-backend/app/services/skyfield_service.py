@@ -1,5 +1,6 @@
 # app/services/skyfield_service.py
 import logging
+import math
 import os
 from datetime import datetime, timezone, timedelta
 # IMPORTS FOR TYPE HINTING: This line is critical for resolving NameErrors like 'Tuple'
@@ -130,59 +131,53 @@ class SkyfieldService:
         if not self.eph:
             raise RuntimeError("Skyfield ephemeris not loaded.")
 
-        t = self.ts.utc(date_time.year, date_time.month, date_time.day,
-                        date_time.hour, date_time.minute, date_time.second)
+        # Get properties to calculate speed
+        # Skyfield's approach to speed is usually about proper motion or specific components.
+        # Calculating 'speed_longitude' directly in degrees/day from Skyfield's orbital elements
+        # is complex and depends on the specific motion type (mean vs true anomaly).
+        # For a simple 'speed' indicator, we can calculate change over a small time step.
+        # This is a simplified approximation and might not match swe.calc_ut's output exactly.
+        # Both instants go into one two-element Time, so each position below is a
+        # (now, 10 seconds later) pair computed in a single vectorized call.
+        t_pair = self.ts.utc(date_time.year, date_time.month, date_time.day,
+                             date_time.hour, date_time.minute, [date_time.second, date_time.second + 10])
+
+        if observer_location:
+            # Topocentric position (from observer on Earth)
+            lat = observer_location.get('latitude', 0.0)
+            lon = observer_location.get('longitude', 0.0)
+            elevation = observer_location.get('elevation', 0.0) # meters
+            observer = self.eph['earth'] + Topos(latitude_degrees=lat, longitude_degrees=lon, elevation_m=elevation)
+        else:
+            # Geocentric position (from Earth's center)
+            observer = self.eph['earth']
+        # The observer's position at both instants is shared by every planet.
+        observer_pair = observer.at(t_pair)
 
         planets_data = {}
         for planet_name in ['sun', 'moon', 'mercury', 'venus', 'mars', 'jupiter', 'saturn', 'uranus', 'neptune', 'pluto']:
             planet = self.eph[planet_name]
-            
-            if observer_location:
-                # Topocentric position (from observer on Earth)
-                lat = observer_location.get('latitude', 0.0)
-                lon = observer_location.get('longitude', 0.0)
-                elevation = observer_location.get('elevation', 0.0) # meters
-                observer = self.eph['earth'] + Topos(latitude_degrees=lat, longitude_degrees=lon, elevation_m=elevation)
-                astrometric = observer.at(t).observe(planet)
-            else:
-                # Geocentric position (from Earth's center)
-                astrometric = self.eph['earth'].at(t).observe(planet)
+            astrometric = observer_pair.observe(planet)
 
             ra, dec, distance = astrometric.radec()
             
             # Get apparent longitude for zodiac placement (ecliptic longitude)
-            lon_ecliptic, lat_ecliptic, _ = t.at(self.eph['earth']).observe(planet).ecliptic_position()
-            
-            # Get properties to calculate speed
-            # Skyfield's approach to speed is usually about proper motion or specific components.
-            # Calculating 'speed_longitude' directly in degrees/day from Skyfield's orbital elements
-            # is complex and depends on the specific motion type (mean vs true anomaly).
-            # For a simple 'speed' indicator, we can calculate change over a small time step.
-            # This is a simplified approximation and might not match swe.calc_ut's output exactly.
-            dt_next = self.ts.utc(date_time.year, date_time.month, date_time.day,
-                                  date_time.hour, date_time.minute, date_time.second + 10) # 10 seconds later
-            
-            if observer_location:
-                astrometric_next = observer.at(dt_next).observe(planet)
-            else:
-                astrometric_next = self.eph['earth'].at(dt_next).observe(planet)
-
-            lon_ecliptic_next, _, _ = dt_next.at(self.eph['earth']).observe(planet).ecliptic_position()
+            lat_ecliptic, lon_ecliptic, _ = astrometric.ecliptic_latlon()
             
-            # Speed in degrees per day (approximate)
-            speed_deg_per_day = ((lon_ecliptic_next.degrees - lon_ecliptic.degrees + 360) % 360) / (10/86400) # (change in degrees) / (fraction of day)
-            if speed_deg_per_day > 180: # Handle wrap around for speed direction
-                speed_deg_per_day -= 360
+            # Speed in degrees per day (approximate): the longitude change, wrapped
+            # into [-180, 180) so retrograde motion stays negative, per fraction of day.
+            delta_lon = (lon_ecliptic.degrees[1] - lon_ecliptic.degrees[0] + 180) % 360 - 180
+            speed_deg_per_day = delta_lon / (10/86400)
 
             is_retrograde = speed_deg_per_day < 0
             
             planets_data[planet_name] = {
                 "name": planet_name.capitalize(),
-                "ra_degrees": ra.degrees,
-                "dec_degrees": dec.degrees,
-                "distance_au": distance.au,
-                "ecliptic_longitude_degrees": lon_ecliptic.degrees,
-                "ecliptic_latitude_degrees": lat_ecliptic.degrees,
+                "ra_degrees": ra.degrees[0],
+                "dec_degrees": dec.degrees[0],
+                "distance_au": distance.au[0],
+                "ecliptic_longitude_degrees": lon_ecliptic.degrees[0],
+                "ecliptic_latitude_degrees": lat_ecliptic.degrees[0],
                 "is_retrograde": is_retrograde,
                 "speed_degrees_per_day": speed_deg_per_day,
                 "position_type": "topocentric" if observer_location else "geocentric"
@@ -11,11 +11,23 @@ import logging
 import datetime
 from typing import Dict, Any, Optional
 
+import numpy as np
+
 # --- REUSE: Import existing services and utilities ---
-from app.services.astrology_service import get_natal_chart_details, swe, get_julian_day_utc, parse_datetime_with_timezone, convert_to_utc
+from app.services.astrology_service import AstrologyService, swe, get_julian_day_utc, parse_datetime_with_timezone, convert_to_utc
 
 logger = logging.getLogger(__name__)
 
+# The return is searched for over 2 days from the start of the birthday.
+# Newton's method on the Sun's longitude converges in a few steps; if it does
+# not, the window is sampled hourly (the Sun moves ~2.5' an hour) and the
+# bracketing hour is bisected to ~1 second.
+SOLAR_RETURN_SEARCH_DAYS = 2
+SOLAR_RETURN_NEWTON_TOLERANCE_DEG = 1e-8
+SOLAR_RETURN_NEWTON_MAX_ITERATIONS = 10
+SOLAR_RETURN_SAMPLES_PER_DAY = 24
+SOLAR_RETURN_PRECISION_DAYS = 1.0 / 86400.0
+
 # --- Solar Return Specific Logic ---
 
 def _find_exact_solar_return_jd(natal_sun_lon: float, natal_dt_aware: datetime.datetime, target_year: int) -> Optional[float]:
@@ -35,36 +47,64 @@ def _find_exact_solar_return_jd(natal_sun_lon: float, natal_dt_aware: datetime.d
     # Convert our search start time to Julian Day
     jd_start = get_julian_day_utc(convert_to_utc(search_start_dt))
     
-    # The Sun moves about 1 degree per day. We'll search over a 2-day window.
-    # We iterate minute by minute to find the crossing.
-    for minute_offset in range(2 * 24 * 60): # 2 days in minutes
-        current_jd = jd_start + (minute_offset / (24.0 * 60.0))
-        
-        # Calculate the Sun's position at this exact minute
-        sun_pos_data, _, _ = swe.calc_ut(current_jd, swe.SE_SUN, swe.FLG_SWIEPH)
-        current_sun_lon = sun_pos_data[0]
-        
-        # Calculate previous minute's position to check for crossing
-        prev_jd = jd_start + ((minute_offset - 1) / (24.0 * 60.0))
-        prev_sun_pos, _, _ = swe.calc_ut(prev_jd, swe.SE_SUN, swe.FLG_SWIEPH)
-        previous_sun_lon = prev_sun_pos[0]
-        
-        # Handle the 0/360 degree crossover for Aries
-        if abs(current_sun_lon - previous_sun_lon) > 180:
-            if previous_sun_lon > current_sun_lon:
-                previous_sun_lon -= 360
-            else:
-                current_sun_lon -= 360
-
-        # Check if the natal Sun's longitude is between the last position and the current one
-        if (previous_sun_lon <= natal_sun_lon <= current_sun_lon) or \
-           (current_sun_lon <= natal_sun_lon <= previous_sun_lon):
-            logger.info(f"Solar Return found at Julian Day: {current_jd}")
-            return current_jd
-
-    logger.error("Could not find the exact Solar Return time within the 2-day search window.")
+    jd_end = jd_start + SOLAR_RETURN_SEARCH_DAYS
+    solar_return_jd = _newton_solar_return_jd(natal_sun_lon, jd_start + SOLAR_RETURN_SEARCH_DAYS / 2)
+    if solar_return_jd is None:
+        solar_return_jd = _bracket_solar_return_jd(natal_sun_lon, jd_start)
+    if solar_return_jd is None or not jd_start <= solar_return_jd <= jd_end:
+        logger.error("Could not find the exact Solar Return time within the 2-day search window.")
+        return None
+
+    logger.info(f"Solar Return found at Julian Day: {solar_return_jd}")
+    return solar_return_jd
+
+def _newton_solar_return_jd(natal_sun_lon: float, jd: float) -> Optional[float]:
+    """
+    Newton's method from `jd` on the Sun's signed offset from its natal
+    longitude, stepping by the Sun's own speed. Returns None if it has not
+    converged within the iteration limit.
+    """
+    for _ in range(SOLAR_RETURN_NEWTON_MAX_ITERATIONS):
+        position, _ = swe.calc_ut(jd, swe.SUN, swe.FLG_SWIEPH | swe.FLG_SPEED)
+        delta = (natal_sun_lon - position[0] + 180.0) % 360.0 - 180.0
+        if abs(delta) < SOLAR_RETURN_NEWTON_TOLERANCE_DEG:
+            return jd
+        jd += delta / position[3]
     return None
 
+def _bracket_solar_return_jd(natal_sun_lon: float, jd_start: float) -> Optional[float]:
+    """
+    Fallback search: samples the window hourly and bisects the hour in which
+    the Sun crosses its natal longitude. Returns None if it does not cross.
+    """
+    # The Sun moves about 1 degree per day and never retrogrades, so over the
+    # 2-day window its unwrapped longitude increases monotonically. Sample it
+    # once per hour and locate the crossing by binary search.
+    jds = jd_start + np.arange(SOLAR_RETURN_SEARCH_DAYS * SOLAR_RETURN_SAMPLES_PER_DAY + 1) / SOLAR_RETURN_SAMPLES_PER_DAY
+    lons = np.unwrap(_sun_longitudes(jds), period=360.0)
+    # The natal longitude, shifted onto the same unwrapped turn as the samples.
+    target = lons[0] + (natal_sun_lon - lons[0]) % 360.0
+    idx = int(np.searchsorted(lons, target))
+    if idx >= len(jds):
+        return None
+    if idx == 0:
+        return float(jds[0])
+
+    # Bisect the bracketing hour on the signed offset from the natal longitude.
+    lower, upper = float(jds[idx - 1]), float(jds[idx])
+    while upper - lower > SOLAR_RETURN_PRECISION_DAYS:
+        mid = (lower + upper) / 2
+        offset = (_sun_longitudes(np.array([mid]))[0] - natal_sun_lon + 180.0) % 360.0 - 180.0
+        if offset < 0:
+            lower = mid
+        else:
+            upper = mid
+    return (lower + upper) / 2
+
+def _sun_longitudes(jds: np.ndarray) -> np.ndarray:
+    """The Sun's ecliptic longitude at each Julian Day (UTC)."""
+    return np.array([swe.calc_ut(jd, swe.SUN, swe.FLG_SWIEPH)[0][0] for jd in jds.tolist()], dtype=np.float64)
+
 def calculate_solar_return_chart(
     natal_data: Dict[str, Any],
     return_year: int,
@@ -86,7 +126,8 @@ def calculate_solar_return_chart(
     logger.info(f"Solar Return service: calculating for year {return_year}.")
     try:
         # Step 1: Get the user's natal chart to find their exact natal Sun longitude.
-        natal_chart = get_natal_chart_details(**natal_data)
+        astrology_service = AstrologyService()
+        natal_chart = astrology_service.get_natal_chart_details(**natal_data)
         if 'error' in natal_chart:
             return {"error": f"Could not calculate base natal chart: {natal_chart['error']}"}
 
@@ -112,7 +153,7 @@ def calculate_solar_return_chart(
         solar_return_datetime = datetime.datetime(year, month, day, hour, minute, second, tzinfo=datetime.timezone.utc)
         
         # Step 3: Cast a new chart for that exact moment and for the user's location THAT YEAR.
-        solar_return_chart = get_natal_chart_details(
+        solar_return_chart = astrology_service.get_natal_chart_details(
             datetime_str=solar_return_datetime.isoformat(),
             timezone_str="UTC", # The time is already in UTC
             latitude=return_latitude,
@@ -15,8 +15,11 @@ Architectural Pattern:
 import logging
 from typing import Dict, Any, List, Optional
 
+import numpy as np
+
 # --- REUSE: Import the existing, powerful natal chart service ---
 from app.services.astrology_service import get_natal_chart_details, astro_data_cache
+from app.services.numeric_kernels import aspect_scan
 
 logger = logging.getLogger(__name__)
 
@@ -28,25 +31,23 @@ def _calculate_inter_aspects(chart_a: Dict[str, Any], chart_b: Dict[str, Any]) -
     aspect_list = []
     points_a = list(chart_a['points'].values())
     points_b = list(chart_b['points'].values()) + list(chart_b['angles'].values())
-    aspect_definitions = astro_data_cache.aspects
-
-    for p1 in points_a:
-        for p2 in points_b:
-            # Calculate the angular separation between the two planets
-            separation = abs(p1['longitude'] - p2['longitude'])
-            if separation > 180:
-                separation = 360 - separation
-            
-            # Check against all defined aspects
-            for aspect_name, aspect_info in aspect_definitions.items():
-                if abs(separation - aspect_info["degrees"]) <= aspect_info["orb"]:
-                    aspect_list.append({
-                        "person_a_point": p1['name'],
-                        "person_b_point": p2['name'],
-                        "aspect_name": aspect_name,
-                        "aspect_symbol": aspect_info["symbol"],
-                        "orb_degrees": round(abs(separation - aspect_info["degrees"]), 3),
-                    })
+    aspect_names, aspect_degrees, aspect_orbs, aspect_symbols = astro_data_cache.aspect_arrays
+
+    # Every A x B x aspect combination in one compiled pass; no orb exceeds
+    # 180 degrees, so only each aspect's own orb applies.
+    a_idx, b_idx, asp_idx, orbs = aspect_scan(
+        np.array([p['longitude'] for p in points_a], dtype=np.float64),
+        np.array([p['longitude'] for p in points_b], dtype=np.float64),
+        aspect_degrees, aspect_orbs, 180.0,
+    )
+    for a, b, k, orb in zip(a_idx.tolist(), b_idx.tolist(), asp_idx.tolist(), orbs.tolist()):
+        aspect_list.append({
+            "person_a_point": points_a[a]['name'],
+            "person_b_point": points_b[b]['name'],
+            "aspect_name": aspect_names[k],
+            "aspect_symbol": aspect_symbols[k],
+            "orb_degrees": round(orb, 3),
+        })
     
     return sorted(aspect_list, key=lambda x: x['orb_degrees'])
 
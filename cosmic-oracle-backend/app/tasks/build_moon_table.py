@@ -0,0 +1,82 @@
+# app/tasks/build_moon_table.py
+"""
+Precompute the hourly Moon/Sun position table used by MoonService.
+
+Writes a read-only SQLite file with one row per UTC hour holding the Moon's
+apparent ecliptic longitude and daily motion and the Sun's apparent ecliptic
+longitude. When the file is present, MoonService answers comprehensive lookups
+inside its range from two indexed rows instead of calling Skyfield:
+
+    python -m app.tasks.build_moon_table [--start 1900] [--end 2100] [--ephemeris PATH] [--output PATH]
+"""
+import argparse
+import calendar
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+from skyfield.api import load
+from skyfield.framelib import ecliptic_frame
+
+DEFAULT_EPHEMERIS = "instance/skyfield-data/de440.bsp"
+DEFAULT_OUTPUT = "instance/moon_cache.sqlite"
+
+
+def _year_rows(ts, eph, year: int):
+    """Positions at every UTC hour of `year`, as (ts_hour, moon_lon, moon_speed, sun_lon) tuples."""
+    first_hour = calendar.timegm((year, 1, 1, 0, 0, 0)) // 3600
+    n_hours = (calendar.timegm((year + 1, 1, 1, 0, 0, 0)) // 3600) - first_hour
+    hours = np.arange(n_hours)
+    t = ts.utc(year, 1, 1, hours)
+
+    earth_at_t = eph['earth'].at(t)
+    _, moon_lon, _, _, moon_rate, _ = earth_at_t.observe(eph['moon']).apparent().frame_latlon_and_rates(ecliptic_frame)
+    _, sun_lon, _ = earth_at_t.observe(eph['sun']).apparent().frame_latlon(ecliptic_frame)
+    return zip(
+        (first_hour + hours).tolist(),
+        moon_lon.degrees.tolist(),
+        moon_rate.degrees.per_day.tolist(),
+        sun_lon.degrees.tolist(),
+    )
+
+
+def build_moon_table(start_year: int, end_year: int, ephemeris_path: str, output_path: str):
+    """Builds the table for UTC years `start_year` through `end_year` inclusive."""
+    ts = load.timescale()
+    eph = load(ephemeris_path)
+
+    output = Path(output_path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp_output = output.with_suffix(".tmp")
+    tmp_output.unlink(missing_ok=True)
+
+    conn = sqlite3.connect(tmp_output)
+    try:
+        conn.execute(
+            "CREATE TABLE moon_positions ("
+            " ts_hour INTEGER PRIMARY KEY,"  # UTC hours since the Unix epoch
+            " moon_lon REAL NOT NULL,"
+            " moon_speed REAL NOT NULL,"
+            " sun_lon REAL NOT NULL)"
+        )
+        for year in range(start_year, end_year + 1):
+            conn.executemany("INSERT INTO moon_positions VALUES (?, ?, ?, ?)", _year_rows(ts, eph, year))
+            conn.commit()
+            print(f"  {year} done")
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+
+    # Swap in the finished file so readers never see a partial table.
+    tmp_output.replace(output)
+    print(f"Wrote moon table for {start_year}-{end_year} to {output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--start", type=int, default=1900)
+    parser.add_argument("--end", type=int, default=2100)
+    parser.add_argument("--ephemeris", default=DEFAULT_EPHEMERIS)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    args = parser.parse_args()
+    build_moon_table(args.start, args.end, args.ephemeris, args.output)
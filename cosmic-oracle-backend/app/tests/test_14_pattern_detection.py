@@ -0,0 +1,188 @@
+# app/tests/test_14_pattern_detection.py
+import random
+from itertools import combinations
+
+import pytest
+import allure
+
+from app.services.pattern_service import PatternService
+
+# These tests call PatternService directly; they need neither the Flask app nor
+# its services, so no 'client' fixture is used.
+
+SIGNS = ['Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo', 'Libra',
+         'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces']
+
+
+def _planet(longitude, speed=1.0):
+    longitude %= 360
+    return {'longitude': longitude, 'speed': speed, 'sign': SIGNS[int(longitude // 30)]}
+
+
+def _random_charts(count, seed):
+    """Charts clustered around a random base angle so every pattern type turns up."""
+    rng = random.Random(seed)
+    charts = []
+    for _ in range(count):
+        base = rng.choice([0, 30, 45, 60, 90, 120])
+        anchors = [0, base, 2 * base, 3 * base, 150, 180, 210, 240, 270]
+        planets = {
+            f'P{n}': _planet(rng.choice(anchors) + rng.uniform(-6, 6), rng.uniform(-1, 14))
+            for n in range(rng.choice([5, 8, 10]))
+        }
+        charts.append(({'planets': planets}, rng.choice([3, 8, 12])))
+    return charts
+
+
+CHARTS = _random_charts(300, seed=1)
+
+
+@pytest.fixture(scope="module")
+def pattern_service():
+    return PatternService(None, None)
+
+
+# Reference searches: the nested pairwise loops the vectorized finders replaced.
+
+def _reference_grand_trines(service, chart, max_orb):
+    found = []
+    planets = list(chart['planets'].items())
+    for (n1, p1), (n2, p2), (n3, p3) in combinations(planets, 3):
+        trine1 = service._check_aspect(p1, p2, 120, max_orb)
+        trine2 = service._check_aspect(p2, p3, 120, max_orb)
+        trine3 = service._check_aspect(p3, p1, 120, max_orb)
+        element = service._get_element(p1['sign'])
+        if (trine1 and trine2 and trine3 and
+                service._get_element(p2['sign']) == element and
+                service._get_element(p3['sign']) == element):
+            avg_orb = (trine1['orb'] + trine2['orb'] + trine3['orb']) / 3
+            found.append((n1, n2, n3, element, avg_orb))
+    return sorted(found, key=lambda x: x[-1])
+
+
+def _reference_grand_crosses(service, chart, max_orb):
+    found = []
+    planets = list(chart['planets'].items())
+    for (n1, p1), (n2, p2), (n3, p3), (n4, p4) in combinations(planets, 4):
+        aspects = [
+            service._check_aspect(p1, p2, 90, max_orb), service._check_aspect(p2, p3, 90, max_orb),
+            service._check_aspect(p3, p4, 90, max_orb), service._check_aspect(p4, p1, 90, max_orb),
+            service._check_aspect(p1, p3, 180, max_orb), service._check_aspect(p2, p4, 180, max_orb),
+        ]
+        modes = {service._get_modality(p['sign']) for p in (p1, p2, p3, p4)}
+        if all(aspects) and len(modes) == 1:
+            found.append([n1, n2, n3, n4])
+    return found
+
+
+def _reference_yods(service, chart, max_orb):
+    found = []
+    planets = list(chart['planets'].items())
+    for (n1, p1), (n2, p2), (n3, p3) in combinations(planets, 3):
+        if (service._check_aspect(p1, p3, 150, max_orb) and
+                service._check_aspect(p2, p3, 150, max_orb) and
+                service._check_aspect(p1, p2, 60, max_orb)):
+            found.append([n1, n2, n3])
+    return found
+
+
+def _all_grand_crosses(service, chart, max_orb):
+    """Every set of four planets that forms a grand cross, whatever their chart order."""
+    found = set()
+    planets = chart['planets']
+    for names in combinations(planets, 4):
+        a, b, c, d = (planets[n] for n in names)
+        if len({service._get_modality(p['sign']) for p in (a, b, c, d)}) != 1:
+            continue
+        # Try each way of splitting the four into two opposing pairs.
+        for (w, x), (y, z) in (((a, b), (c, d)), ((a, c), (b, d)), ((a, d), (b, c))):
+            if (service._check_aspect(w, x, 180, max_orb) and service._check_aspect(y, z, 180, max_orb) and
+                    all(service._check_aspect(p, q, 90, max_orb) for p in (w, x) for q in (y, z))):
+                found.add(frozenset(names))
+                break
+    return found
+
+
+def _all_yods(service, chart, max_orb):
+    """Every (sextile base, apex) yod, whatever the chart order of its planets."""
+    found = set()
+    planets = chart['planets']
+    for base in combinations(planets, 2):
+        b1, b2 = (planets[n] for n in base)
+        if not service._check_aspect(b1, b2, 60, max_orb):
+            continue
+        for apex, p in planets.items():
+            if (apex not in base and service._check_aspect(b1, p, 150, max_orb) and
+                    service._check_aspect(b2, p, 150, max_orb)):
+                found.add((frozenset(base), apex))
+    return found
+
+
+@allure.epic("Core Astrology Services")
+@allure.feature("Aspect Patterns")
+class TestPatternDetection:
+    """Checks the vectorized pattern finders against plain pairwise searches."""
+
+    @allure.story("Grand Trines")
+    @allure.title("Grand trines match the pairwise search")
+    @allure.description("On 300 random charts, the grand trines found must be the ones the nested pairwise loops find, with the same orbs and order.")
+    def test_grand_trines_match_pairwise_search(self, pattern_service):
+        for chart, max_orb in CHARTS:
+            found = [
+                (*p.planets, p.quality, p.orb)
+                for p in pattern_service.find_grand_trines(chart, max_orb)
+            ]
+            expected = _reference_grand_trines(pattern_service, chart, max_orb)
+            assert [f[:4] for f in found] == [e[:4] for e in expected]
+            assert [f[4] for f in found] == pytest.approx([e[4] for e in expected])
+
+    @allure.story("Grand Crosses")
+    @allure.title("Grand crosses are found once each, in any planet order")
+    @allure.description("Every grand cross the ordered pairwise search finds is still found unchanged, and every four-planet grand cross is found exactly once, even when the chart does not list its planets in cross order.")
+    def test_grand_crosses_superset_of_pairwise_search(self, pattern_service):
+        for chart, max_orb in CHARTS:
+            found = pattern_service.find_grand_crosses(chart, max_orb)
+            planet_lists = [p.planets for p in found]
+            for expected in _reference_grand_crosses(pattern_service, chart, max_orb):
+                assert expected in planet_lists
+            assert len({frozenset(p) for p in planet_lists}) == len(planet_lists)
+            assert {frozenset(p) for p in planet_lists} == _all_grand_crosses(pattern_service, chart, max_orb)
+
+    @allure.story("Grand Crosses")
+    @allure.title("A grand cross listed out of cross order is found")
+    def test_grand_cross_out_of_order(self, pattern_service):
+        # Listed as opposition, opposition: the ordered search never tries this labelling.
+        chart = {'planets': {
+            'Sun': _planet(5), 'Moon': _planet(185), 'Mars': _planet(95), 'Saturn': _planet(275),
+        }}
+        assert _reference_grand_crosses(pattern_service, chart, 8.0) == []
+
+        crosses = pattern_service.find_grand_crosses(chart, 8.0)
+        assert len(crosses) == 1
+        assert crosses[0].planets == ['Sun', 'Mars', 'Moon', 'Saturn']
+        assert crosses[0].quality == 'cardinal'
+
+    @allure.story("Yods")
+    @allure.title("Yods are found once each, whatever the apex position")
+    @allure.description("Every yod the ordered pairwise search finds is still found unchanged, and every yod is found exactly once even when its apex is not the last of its planets in the chart.")
+    def test_yods_superset_of_pairwise_search(self, pattern_service):
+        for chart, max_orb in CHARTS:
+            found = pattern_service.find_yods(chart, max_orb)
+            planet_lists = [p.planets for p in found]
+            for expected in _reference_yods(pattern_service, chart, max_orb):
+                assert expected in planet_lists
+            yods = {(frozenset(p[:2]), p[2]) for p in planet_lists}
+            assert len(yods) == len(planet_lists)
+            assert yods == _all_yods(pattern_service, chart, max_orb)
+
+    @allure.story("Yods")
+    @allure.title("A yod whose apex is listed first is found")
+    def test_yod_apex_listed_first(self, pattern_service):
+        chart = {'planets': {
+            'Pluto': _planet(212), 'Venus': _planet(2), 'Jupiter': _planet(62),
+        }}
+        assert _reference_yods(pattern_service, chart, 8.0) == []
+
+        yods = pattern_service.find_yods(chart, 8.0)
+        assert len(yods) == 1
+        assert yods[0].planets == ['Venus', 'Jupiter', 'Pluto']
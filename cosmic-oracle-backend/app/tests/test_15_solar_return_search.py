@@ -0,0 +1,76 @@
+# app/tests/test_15_solar_return_search.py
+import random
+import datetime
+
+import pytest
+import allure
+
+from app.services.solar_return_service import (
+    swe, _find_exact_solar_return_jd, _newton_solar_return_jd, _bracket_solar_return_jd,
+    SOLAR_RETURN_SEARCH_DAYS, SOLAR_RETURN_PRECISION_DAYS
+)
+
+# These tests call the solar return search directly; they need neither the
+# Flask app nor its services, so no 'client' fixture is used.
+
+
+def _random_birth_dates(count, seed):
+    """(natal Sun longitude, birth datetime, return year) for random UTC birth times."""
+    rng = random.Random(seed)
+    cases = []
+    for _ in range(count):
+        birth = datetime.datetime(rng.randint(1900, 2000), 1, 1, tzinfo=datetime.timezone.utc)
+        birth += datetime.timedelta(days=rng.randrange(365), seconds=rng.randrange(86400))
+        hours = birth.hour + birth.minute / 60 + birth.second / 3600
+        natal_sun_lon = swe.calc_ut(swe.julday(birth.year, birth.month, birth.day, hours), swe.SUN, swe.FLG_SWIEPH)[0][0]
+        cases.append((natal_sun_lon, birth, birth.year + rng.randint(1, 80)))
+    return cases
+
+
+BIRTH_DATES = _random_birth_dates(300, seed=7)
+
+
+@allure.epic("Predictive Astrology")
+@allure.feature("Solar Return")
+class TestSolarReturnSearch:
+    """Checks the Newton solar return search against the hourly bracket search."""
+
+    @allure.story("Newton Search")
+    @allure.title("Newton's method agrees with the bracket search")
+    @allure.description("On 300 random birth dates, Newton's method and the hourly bracket-and-bisect search must agree on whether the return falls in the search window, and on its time to within a second.")
+    def test_newton_matches_bracket_search(self):
+        for natal_sun_lon, birth, return_year in BIRTH_DATES:
+            jd_start = swe.julday(return_year, birth.month, birth.day, 0.0)
+            jd_end = jd_start + SOLAR_RETURN_SEARCH_DAYS
+            newton = _newton_solar_return_jd(natal_sun_lon, jd_start + SOLAR_RETURN_SEARCH_DAYS / 2)
+            bracket = _bracket_solar_return_jd(natal_sun_lon, jd_start)
+
+            newton_found = newton is not None and jd_start <= newton <= jd_end
+            bracket_found = bracket is not None and jd_start <= bracket <= jd_end
+            assert newton_found == bracket_found, (birth, return_year)
+            if newton_found:
+                assert newton == pytest.approx(bracket, abs=SOLAR_RETURN_PRECISION_DAYS), (birth, return_year)
+
+    @allure.story("Newton Search")
+    @allure.title("A solar return found puts the Sun back on its natal longitude")
+    def test_return_is_exact(self):
+        found = 0
+        for natal_sun_lon, birth, return_year in BIRTH_DATES[:50]:
+            jd = _find_exact_solar_return_jd(natal_sun_lon, birth, return_year)
+            if jd is None:
+                # The return fell just before the birthday's search window.
+                continue
+            found += 1
+            sun_lon = swe.calc_ut(jd, swe.SUN, swe.FLG_SWIEPH)[0][0]
+            assert (sun_lon - natal_sun_lon + 180.0) % 360.0 - 180.0 == pytest.approx(0.0, abs=1e-6)
+        assert found > 0
+
+    @allure.story("Newton Search")
+    @allure.title("A leap-day birthday is searched from 28 February")
+    def test_leap_day_birthday(self):
+        birth = datetime.datetime(1996, 2, 29, 12, 0, tzinfo=datetime.timezone.utc)
+        natal_sun_lon = swe.calc_ut(swe.julday(1996, 2, 29, 12.0), swe.SUN, swe.FLG_SWIEPH)[0][0]
+        jd = _find_exact_solar_return_jd(natal_sun_lon, birth, 2023)
+        assert jd is not None
+        year, month, day, _ = swe.revjul(jd, swe.GREG_CAL)
+        assert (year, month) == (2023, 2) or (year, month, day) == (2023, 3, 1)
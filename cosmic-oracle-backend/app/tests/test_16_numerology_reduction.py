@@ -0,0 +1,66 @@
+# app/tests/test_16_numerology_reduction.py
+import random
+import datetime
+
+import pytest
+import allure
+
+from app.services.numerology_service import NumerologyService, _digit_sum
+
+# These tests call NumerologyService directly; they need neither the Flask app
+# nor its services, so no 'client' fixture is used.
+
+
+def _reference_reduce(num):
+    """The string-based reduction the digit-sum table replaced."""
+    while num > 9 and num not in [11, 22, 33]:
+        num = sum(int(digit) for digit in str(num))
+    return num
+
+
+def _reference_life_path(birth_date_str):
+    birth_date = datetime.datetime.strptime(birth_date_str, "%Y-%m-%d").date()
+    total_sum = sum(int(digit) for digit in str(birth_date.year) + str(birth_date.month) + str(birth_date.day))
+    return _reference_reduce(total_sum)
+
+
+@pytest.fixture(scope="module")
+def numerology_service():
+    return NumerologyService()
+
+
+@allure.epic("Personal Growth")
+@allure.feature("Numerology")
+class TestNumerologyReduction:
+    """Checks the table-driven digit sums against the string-based ones."""
+
+    @allure.story("Digit Sums")
+    @allure.title("Digit sums and reductions match the string-based versions")
+    @allure.description("On 200,000 random inputs of up to 12 digits, _digit_sum and _reduce_number must match summing the digits of str(num).")
+    def test_digit_sum_matches_string_sum(self):
+        rng = random.Random(3)
+        for _ in range(200_000):
+            num = rng.randrange(10 ** rng.randint(1, 12))
+            assert _digit_sum(num) == sum(int(digit) for digit in str(num)), num
+            assert NumerologyService._reduce_number(num) == _reference_reduce(num), num
+
+    @allure.story("Life Path")
+    @allure.title("Life path numbers match the string-based calculation")
+    @allure.description("On random birth dates, both zero-padded and not, the life path number and master number flag must match the strptime and str() calculation.")
+    def test_life_path_matches_string_calculation(self, numerology_service):
+        rng = random.Random(5)
+        start = datetime.date(1800, 1, 1)
+        for _ in range(5_000):
+            birth = start + datetime.timedelta(days=rng.randrange(100_000))
+            for birth_date_str in (birth.isoformat(), f"{birth.year}-{birth.month}-{birth.day}"):
+                result = numerology_service.calculate_life_path(birth_date_str)
+                expected = _reference_life_path(birth_date_str)
+                assert result["life_path_number"] == expected, birth_date_str
+                assert result["master_number"] == (expected in (11, 22, 33)), birth_date_str
+
+    @allure.story("Life Path")
+    @allure.title("Impossible dates are rejected")
+    @pytest.mark.parametrize("birth_date_str", ["1990-02-30", "1990-13-01", "1990/01/01", "not a date"])
+    def test_life_path_invalid_date(self, numerology_service, birth_date_str):
+        result = numerology_service.calculate_life_path(birth_date_str)
+        assert result == {"error": "Invalid birth date format. Please use YYYY-MM-DD."}
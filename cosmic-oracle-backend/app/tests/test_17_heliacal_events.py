@@ -0,0 +1,83 @@
+# app/tests/test_17_heliacal_events.py
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+import allure
+from skyfield.api import Star, load, wgs84
+
+from app.services.heliacal_service import find_twilights, find_visibility_changes
+
+# These tests call the heliacal search helpers directly; they need neither the
+# Flask app nor its services, so no 'client' fixture is used.
+
+SIRIUS = Star(ra_hours=(6, 45, 8.917), dec_degrees=(-16, 42, 58.02),
+              ra_mas_per_year=-546.01, dec_mas_per_year=-1223.07,
+              parallax_mas=379.21, radial_km_per_s=-5.50)
+SPICA = Star(ra_hours=(13, 25, 11.579), dec_degrees=(-11, 9, 40.75),
+             ra_mas_per_year=-42.35, dec_mas_per_year=-30.67,
+             parallax_mas=13.06, radial_km_per_s=1.00)
+
+LOCATIONS = [(30.04, 31.24), (51.51, -0.13), (-33.87, 151.21)]  # Cairo, London, Sydney
+
+
+@pytest.fixture(scope="module")
+def sky():
+    eph = load('de421.bsp')
+    ts = load.timescale()
+    start_t = ts.from_datetime(datetime(2024, 1, 1, tzinfo=timezone.utc))
+    end_t = ts.from_datetime(datetime(2027, 1, 1, tzinfo=timezone.utc))
+    return eph, start_t, end_t
+
+
+def _star_visibility(eph, location, star, twilights):
+    """is_visible callback for the star at the given twilights, counting its calls."""
+    observer = eph['earth'] + location
+    evaluated = []
+
+    def is_visible(indices):
+        evaluated.append(len(indices))
+        star_alt, _, _ = observer.at(twilights[indices]).observe(star).apparent().altaz()
+        return star_alt.degrees > 0.0
+    return is_visible, evaluated
+
+
+@allure.epic("Predictive Astrology")
+@allure.feature("Heliacal Events")
+class TestHeliacalSearch:
+    """Checks the coarse-then-refined heliacal search against a daily scan."""
+
+    @allure.story("Visibility Search")
+    @allure.title("The coarse search finds the same changes as a daily scan")
+    @allure.description("Over three years at three latitudes, the changes in a star's visibility at morning and evening twilight must be those found by checking every twilight, while checking far fewer of them.")
+    @pytest.mark.parametrize("latitude, longitude", LOCATIONS)
+    def test_matches_daily_scan(self, sky, latitude, longitude):
+        eph, start_t, end_t = sky
+        location = wgs84.latlon(latitude, longitude)
+        for twilights in find_twilights(eph, location, start_t, end_t):
+            for star in (SIRIUS, SPICA):
+                is_visible, evaluated = _star_visibility(eph, location, star, twilights)
+                changes = find_visibility_changes(is_visible, len(twilights))
+
+                daily = is_visible(np.arange(len(twilights)))
+                expected = [(int(i) + 1, bool(daily[i + 1])) for i in np.flatnonzero(daily[1:] != daily[:-1])]
+                assert changes == expected
+                # About two changes a year, so the daily scan is the last call.
+                assert len(expected) >= 4
+                assert sum(evaluated[:-1]) < len(twilights) / 2
+
+    @allure.story("Visibility Search")
+    @allure.title("Sirius rises heliacally in early August in Cairo")
+    def test_sirius_heliacal_rising_cairo(self, sky):
+        eph, start_t, end_t = sky
+        location = wgs84.latlon(30.04, 31.24)
+        mornings, _ = find_twilights(eph, location, start_t, end_t)
+        is_visible, _ = _star_visibility(eph, location, SIRIUS, mornings)
+        risings = [mornings[i].utc_datetime() for i, visible in find_visibility_changes(is_visible, len(mornings)) if visible]
+        assert [r.year for r in risings] == [2024, 2025, 2026]
+        assert all((r.month, r.day) >= (7, 20) and (r.month, r.day) <= (8, 20) for r in risings)
+
+    @allure.story("Visibility Search")
+    @allure.title("Too few twilights to change state")
+    def test_no_changes_without_two_twilights(self):
+        assert find_visibility_changes(lambda indices: np.ones(len(indices), dtype=bool), 1) == []
@@ -0,0 +1,74 @@
+"""
+Ahead-of-time compile the numeric kernels in app/services/numeric_kernels.py.
+
+Produces the `astro_kernels` native extension next to numeric_kernels.py. When
+it is present, the services call the precompiled kernels directly, so workers
+pay no JIT warmup and do not need Numba installed at runtime. Run this as part
+of the build, after installing requirements:
+
+    python build_kernels.py
+
+The build is optional. numba.pycc is deprecated upstream and will be removed
+in a future Numba release; when Numba or numba.pycc is unavailable the build
+is skipped, and the services use the JIT kernels, or plain Python without
+Numba, instead.
+"""
+import importlib.util
+from pathlib import Path
+
+try:
+    from numba.pycc import CC
+except ImportError:  # Numba not installed, or a release without pycc
+    CC = None
+
+OUTPUT_DIR = Path(__file__).resolve().parent / "app" / "services"
+
+
+def _load_numeric_kernels():
+    """
+    Loads numeric_kernels.py standalone, so the build neither imports the rest
+    of app.services nor picks up a previously built astro_kernels.
+    """
+    spec = importlib.util.spec_from_file_location("numeric_kernels", OUTPUT_DIR / "numeric_kernels.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def build_kernels():
+    """Compile every exported kernel into the `astro_kernels` extension module."""
+    if CC is None:
+        print("numba.pycc is unavailable; skipping the astro_kernels build.")
+        return
+    numeric_kernels = _load_numeric_kernels()
+    cc = CC("astro_kernels")
+    cc.output_dir = str(OUTPUT_DIR)
+    cc.verbose = True
+
+    cc.export(
+        "aspect_scan",
+        "Tuple((i8[:], i8[:], i8[:], f8[:]))(f8[:], f8[:], f8[:], f8[:], f8)",
+    )(numeric_kernels.aspect_scan.py_func)
+    cc.export(
+        "pair_aspect_scan",
+        "Tuple((i8[:], i8[:], i8[:], f8[:]))(f8[:], f8[:], f8[:])",
+    )(numeric_kernels.pair_aspect_scan.py_func)
+    cc.export(
+        "mean_node_batch",
+        "Tuple((f8[:], f8[:], i8[:], i8[:], f8[:], f8[:]))(f8[:])",
+    )(numeric_kernels.mean_node_batch.py_func)
+    cc.export(
+        "grand_trine_scan",
+        "i8[:, :](f8[:], i1[:], f8)",
+    )(numeric_kernels.grand_trine_scan.py_func)
+    cc.export(
+        "aspect_applying",
+        "b1[:](f8[:], f8[:], f8[:], f8[:], f8[:])",
+    )(numeric_kernels.aspect_applying.py_func)
+
+    cc.compile()
+    print(f"Compiled astro_kernels into {OUTPUT_DIR}")
+
+
+if __name__ == "__main__":
+    build_kernels()
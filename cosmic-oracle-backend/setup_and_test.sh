@@ -9,6 +9,11 @@ source venv/bin/activate
 echo "Installing dependencies..."
 pip install -r requirements.txt
 
+# Optional: numba.pycc is deprecated, and build_kernels.py skips the build
+# when it is unavailable. Without astro_kernels the JIT kernels are used.
+echo "Compiling numeric kernels ahead of time (optional)..."
+python build_kernels.py || echo "Kernel build failed; continuing with the JIT kernels."
+
 echo "Setting up environment variables..."
 echo "Please copy your .env file from .env.template or other .env.* files before proceeding."
 